@@ -0,0 +1,83 @@
+"""
+Benchmark de la entidad Brand
+
+Compara la entidad anterior (dataclass con __dict__ por instancia y dos
+llamadas a datetime.utcnow() en __post_init__) con la actual (slots) al
+construir marcas nuevas con Brand(...) y al hidratar filas con
+Brand.from_row(...). Mide el tiempo de construcción y la memoria por
+entidad (tracemalloc) para N entidades.
+
+Uso (desde backend/):
+    PYTHONPATH=src python benchmarks/bench_brand_entity.py [--entities 1000000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional
+from uuid import UUID, uuid4
+
+from app.domain.entities.brand import Brand
+
+@dataclass
+class LegacyBrand:
+    """Copia de la entidad anterior"""
+    id: Optional[UUID]
+    name: str
+    owner: str
+    lang: str
+    status: str = "Pendiente"
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    deleted_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.utcnow()
+        if self.updated_at is None:
+            self.updated_at = datetime.utcnow()
+
+def retained_bytes(build: Callable[[], List[object]]) -> int:
+    """Bytes retenidos por la lista construida (tracemalloc)"""
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return size
+
+def build_seconds(build: Callable[[], List[object]]) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    build()
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # Valores compartidos: solo se mide el coste de las entidades
+    now = datetime.utcnow()
+    ids = [uuid4() for _ in range(args.entities)]
+    rows = [(brand_id, "Marca", "Propietario", "es", "active", now, now, None) for brand_id in ids]
+
+    cases = [
+        ("dataclass: LegacyBrand(...) nueva", lambda: [LegacyBrand(i, "Marca", "Propietario", "es") for i in ids]),
+        ("slots: Brand(...) nueva", lambda: [Brand(i, "Marca", "Propietario", "es") for i in ids]),
+        ("dataclass: LegacyBrand(*fila)", lambda: [LegacyBrand(*row) for row in rows]),
+        ("slots: Brand.from_row(*fila)", lambda: [Brand.from_row(*row) for row in rows]),
+    ]
+
+    print(f"{args.entities} entidades (el tiempo se mide sin tracemalloc)")
+    for name, build in cases:
+        size = retained_bytes(build)
+        seconds = build_seconds(build)
+        print(f"  {name:<36} {seconds:6.2f} s  {seconds / args.entities * 1e9:6.0f} ns/entidad  {size / args.entities:6.0f} B/entidad")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark de lecturas grandes del listado de marcas
+
+Compara el camino anterior con ORM (query(BrandModel).all() y conversión a
+entidades) con las lecturas con Core del repositorio: entidades hidratadas
+desde filas (get_all), tuplas (get_rows) y lote columnar (BrandColumns).
+Por defecto usa una base SQLite temporal; con --url se puede medir contra
+PostgreSQL (la tabla brands debe existir y estar vacía).
+
+Uso (desde backend/):
+    PYTHONPATH=src python benchmarks/bench_list_query.py [--rows 100000] [--repeat 5] [--url ...]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, delete, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.db.models.brand_model import BrandModel
+from app.adapters.db.repositories.brand_repository import BrandRepository, brands_table
+from app.adapters.db.session import Base, create_test_engine
+from app.domain.entities.brand_columns import BRAND_FIELDS, BrandColumns
+
+def orm_all(session):
+    """Camino anterior: instancias BrandModel en el identity map y entidades"""
+    return [brand.to_domain_entity() for brand in session.query(BrandModel).filter(BrandModel.deleted_at.is_(None)).all()]
+
+def orm_models(session):
+    return session.query(BrandModel).filter(BrandModel.deleted_at.is_(None)).all()
+
+def core_entities(session):
+    return BrandRepository(db=session).get_all()
+
+def core_rows(session):
+    return BrandRepository(db=session).get_rows(BRAND_FIELDS)
+
+def core_columns(session):
+    return BrandColumns.from_rows(BRAND_FIELDS, BrandRepository(db=session).get_rows(BRAND_FIELDS))
+
+def best_of(func, session_factory, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        # Sesión nueva en cada vuelta: el identity map no se reutiliza
+        session = session_factory()
+        try:
+            start = time.perf_counter()
+            func(session)
+            timings.append(time.perf_counter() - start)
+        finally:
+            session.close()
+    return min(timings)
+
+def seed(engine, rows: int) -> None:
+    start = datetime(2024, 1, 1)
+    values = [
+        {
+            "id": uuid4(),
+            "name": f"Marca {i}",
+            "owner": f"Propietario {i % 97}",
+            "lang": "es",
+            "status": "active",
+            "created_at": start + timedelta(seconds=i),
+            "updated_at": start + timedelta(seconds=i),
+        }
+        for i in range(rows)
+    ]
+    with engine.begin() as conn:
+        for offset in range(0, rows, 10000):
+            conn.execute(insert(brands_table), values[offset:offset + 10000])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--url", default=None, help="URL de base de datos (por defecto SQLite temporal)")
+    args = parser.parse_args()
+
+    path = None
+    if args.url is None:
+        handle, path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+    engine = create_engine(args.url) if args.url else create_test_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(bind=engine)
+        seed(engine, args.rows)
+        session_factory = sessionmaker(bind=engine)
+
+        paths = [
+            ("ORM query(BrandModel).all() + entidades", orm_all),
+            ("ORM query(BrandModel).all()", orm_models),
+            ("Core get_all (Brand.from_row)", core_entities),
+            ("Core get_rows (tuplas)", core_rows),
+            ("Core get_rows + BrandColumns", core_columns),
+        ]
+        baseline = None
+        print(f"{args.rows} marcas ({engine.dialect.name}), mejor de {args.repeat} ejecuciones")
+        for name, func in paths:
+            seconds = best_of(func, session_factory, args.repeat)
+            baseline = baseline or seconds
+            print(f"  {name:<42} {seconds * 1000:8.1f} ms  {seconds / args.rows * 1e6:6.2f} us/fila  x{baseline / seconds:.1f}")
+    finally:
+        with engine.begin() as conn:
+            conn.execute(delete(brands_table))
+        engine.dispose()
+        if path is not None:
+            os.unlink(path)
+
+if __name__ == "__main__":
+    main()
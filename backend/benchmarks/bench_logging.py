@@ -0,0 +1,90 @@
+"""
+Benchmark del logging de la aplicación
+
+Simula peticiones de creación (seis llamadas a los helpers de
+app.core.logger, como BrandUseCase.create_brand + BrandRepository.create) y
+mide peticiones por segundo desde varios threads con el logging desactivado,
+con escritura síncrona en el thread de la petición y con la cola acotada
+(QueueHandler + QueueListener). --write-delay-us simula un stdout lento
+(pipe lleno, terminal o colector de logs) añadiendo una espera por escritura.
+
+Uso (desde backend/):
+    PYTHONPATH=src python benchmarks/bench_logging.py [--requests 20000] [--threads 8] [--write-delay-us 20]
+"""
+
+import argparse
+import os
+import threading
+import time
+from uuid import uuid4
+
+from app.core import logger as app_logging
+from app.core.logger import (
+    app_logger, log_entity_created, log_operation_start, log_operation_success, setup_logger
+)
+
+class SlowStream:
+    """Stream que descarta lo escrito tras una espera fija por escritura"""
+
+    def __init__(self, delay_seconds: float):
+        self.delay_seconds = delay_seconds
+        self.devnull = open(os.devnull, "w")
+
+    def write(self, text: str) -> int:
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        return self.devnull.write(text)
+
+    def flush(self) -> None:
+        self.devnull.flush()
+
+def create_request() -> None:
+    brand_id = str(uuid4())
+    log_operation_start("create_brand", "Brand")
+    log_operation_start("create", "Brand")
+    log_entity_created("Brand", brand_id)
+    log_operation_success("create", "Brand", brand_id)
+    log_entity_created("Brand", brand_id)
+    log_operation_success("create_brand", "Brand", brand_id)
+
+def configure(mode: str, stream: SlowStream) -> None:
+    """Sustituir los handlers de app_logger según el modo"""
+    app_logging.stop_logging()
+    app_logging._queue_handlers.clear()
+    app_logger.handlers.clear()
+    app_logger.disabled = mode == "off"
+    setup_logger("app_logger", queue_size=10000 if mode.startswith("queue") else 0,
+                 overflow="block" if mode == "queue-block" else "drop", stream=stream)
+
+def run(requests: int, threads: int) -> float:
+    per_thread = requests // threads
+    workers = [
+        threading.Thread(target=lambda: [create_request() for _ in range(per_thread)])
+        for _ in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--write-delay-us", type=float, default=0.0)
+    args = parser.parse_args()
+
+    stream = SlowStream(args.write_delay_us / 1e6)
+    print(f"{args.requests} peticiones x 6 registros, {args.threads} threads, {args.write_delay_us:g} us por escritura")
+    for mode in ("off", "sync", "queue-drop", "queue-block"):
+        configure(mode, stream)
+        seconds = run(args.requests, args.threads)
+        dropped = sum(handler.dropped for handler in app_logging._queue_handlers.values())
+        # El tiempo solo cuenta los threads de petición; vaciar la cola va aparte
+        app_logging.stop_logging()
+        print(f"  {mode:<12} {args.requests / seconds:10.0f} peticiones/s  descartados: {dropped}")
+
+if __name__ == "__main__":
+    main()
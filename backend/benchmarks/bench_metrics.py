@@ -0,0 +1,78 @@
+"""
+Benchmark de las actualizaciones de métricas
+
+Compara Histogram.observe (fragmento por thread, sin lock) con un
+histograma equivalente protegido por un lock (como PoolMetrics) y con no
+medir nada, desde varios threads a la vez. También mide el coste de
+exportar con render().
+
+Uso (desde backend/):
+    PYTHONPATH=src python benchmarks/bench_metrics.py [--observations 200000] [--threads 8]
+"""
+
+import argparse
+import bisect
+import threading
+import time
+
+from app.core.metrics import DB_BUCKETS, MetricsRegistry
+
+class LockedHistogram:
+    """Histograma con un lock por actualización"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.series = {}
+
+    def observe(self, value, labels=()):
+        with self.lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[bisect.bisect_left(self.buckets, value)] += 1
+            series[-1] += value
+
+class NoopHistogram:
+    def observe(self, value, labels=()):
+        pass
+
+def run(histogram, observations: int, threads: int) -> float:
+    labels = ("SELECT",)
+
+    def work():
+        for i in range(observations):
+            histogram.observe((i % 100) / 10000, labels)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--observations", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    total = args.observations * args.threads
+    registry = MetricsRegistry()
+    candidates = {
+        "noop": NoopHistogram(),
+        "lock": LockedHistogram(DB_BUCKETS),
+        "sharded": registry.histogram("bench_seconds", "Benchmark", ("statement",), buckets=DB_BUCKETS),
+    }
+    print(f"{args.threads} threads x {args.observations} observaciones")
+    for name, histogram in candidates.items():
+        seconds = run(histogram, args.observations, args.threads)
+        print(f"  {name:<8} {seconds * 1e9 / total:8.0f} ns/observación")
+
+    start = time.perf_counter()
+    registry.render()
+    print(f"  render() {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
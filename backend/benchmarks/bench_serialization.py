@@ -0,0 +1,76 @@
+"""
+Benchmark de serialización del listado de marcas
+
+Compara el camino anterior (validar cada entidad como BrandReadDTO con
+response_model, volcarla a dict y codificarla con json.dumps, como hace
+FastAPI con JSONResponse) con la serialización directa de
+app.api.serialization y, si está instalado, con orjson sobre los mismos dicts.
+
+Uso (desde backend/):
+    PYTHONPATH=src python benchmarks/bench_serialization.py [--rows 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import time
+from typing import List
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from app.api.serialization import dump_brands, public_row
+from app.domain.entities.brand import Brand
+from app.schemas.brand_dto import BrandReadDTO
+
+_response_model = TypeAdapter(List[BrandReadDTO])
+
+def legacy_path(brands: List[Brand]) -> bytes:
+    """response_model + JSONResponse: validación, dict JSON y json.dumps"""
+    validated = _response_model.validate_python(brands, from_attributes=True)
+    content = _response_model.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+def pydantic_core_path(brands: List[Brand]) -> bytes:
+    return to_json([public_row(brand) for brand in brands])
+
+def orjson_path(brands: List[Brand]) -> bytes:
+    import orjson
+    return orjson.dumps([public_row(brand) for brand in brands])
+
+def best_of(func, brands, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(brands)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    brands = [
+        Brand(id=uuid4(), name=f"Marca número {i}", owner=f"Propietario {i % 97}", lang="es", status="active")
+        for i in range(args.rows)
+    ]
+    assert legacy_path(brands) == dump_brands(brands) == pydantic_core_path(brands), "la salida debe ser idéntica"
+
+    paths = [("response_model + json.dumps", legacy_path), ("pydantic_core.to_json", pydantic_core_path)]
+    try:
+        import orjson  # noqa: F401
+        paths.append(("orjson (dicts)", orjson_path))
+    except ImportError:
+        pass
+
+    baseline = None
+    print(f"{args.rows} marcas, mejor de {args.repeat} ejecuciones")
+    for name, func in paths:
+        seconds = best_of(func, brands, args.repeat)
+        baseline = baseline or seconds
+        print(f"  {name:<30} {seconds * 1000:8.2f} ms  {seconds / args.rows * 1e6:6.2f} us/marca  x{baseline / seconds:.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark del coste del tracing
+
+Simula peticiones de lectura y actualización (BrandUseCase.get_brand +
+update_brand sobre BrandRepository y SQLite) dentro de un span raíz por
+petición, con el tracing desactivado y activado a varias tasas de muestreo.
+Los spans muestreados pasan por el BatchSpanProcessor a un exportador que
+los descarta, así que se mide el coste en el thread de la petición.
+
+Uso (desde backend/):
+    PYTHONPATH=src python benchmarks/bench_tracing.py [--requests 2000] [--repeat 7]
+"""
+
+import argparse
+import gc
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from app.adapters.db.repositories.brand_repository import BrandRepository
+from app.adapters.db.session import Base, create_test_engine
+from app.adapters.db.sql_instrumentation import track_statements
+from app.core.logger import app_logger
+from app.core.tracing import BatchSpanProcessor, SpanExporter, tracer
+from app.domain.use_cases.brand_use_case import BrandUseCase
+from app.schemas.brand_dto import BrandCreateDTO, BrandUpdateDTO
+
+class DiscardExporter(SpanExporter):
+    def export(self, spans) -> None:
+        pass
+
+def run(use_case: BrandUseCase, brand_id, requests: int) -> float:
+    update = BrandUpdateDTO(name="Bench", owner="Owner", lang="es")
+    start = time.perf_counter()
+    for _ in range(requests):
+        with tracer.start_span("request"):
+            use_case.get_brand(brand_id)
+            use_case.update_brand(brand_id, update)
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    # Las líneas por capa a stdout costarían más que lo medido (en una petición no se escriben)
+    app_logger.disabled = True
+    engine = create_test_engine()
+    Base.metadata.create_all(engine)
+    track_statements()
+    session = sessionmaker(bind=engine)()
+    use_case = BrandUseCase(repo=BrandRepository(db=session))
+    brand_id = use_case.create_brand(BrandCreateDTO(name="Bench", owner="Owner", lang="es")).id
+
+    modes = [("off", False, 0.0), ("1%", True, 0.01), ("10%", True, 0.1), ("100%", True, 1.0)]
+    exporter = DiscardExporter()
+    best = {name: float("inf") for name, _, _ in modes}
+    # Los modos se alternan en cada vuelta para que la deriva de SQLite no favorezca a ninguno
+    for _ in range(args.repeat):
+        for name, enabled, rate in modes:
+            tracer.configure(enabled, rate, BatchSpanProcessor(exporter, max_queue_size=100000) if enabled else None)
+            # Sin basura pendiente de la vuelta anterior
+            gc.collect()
+            best[name] = min(best[name], run(use_case, brand_id, args.requests))
+            tracer.shutdown()
+
+    print(f"{args.requests} peticiones (get_brand + update_brand), SQLite en memoria, mejor de {args.repeat}")
+    for name, _, _ in modes:
+        print(f"  {name:<5} {best[name] * 1e6 / args.requests:8.1f} us/petición  {(best[name] / best['off'] - 1) * 100:+6.2f}%")
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,9 @@ if (-not (Test-Path ".env")) {
 
 Write-Host "✅ Instalación completada!" -ForegroundColor Green
 Write-Host ""
+Write-Host "🗄️  Para aplicar las migraciones de la base de datos:" -ForegroundColor Cyan
+Write-Host "   poetry run python -m app.adapters.db.migrations upgrade" -ForegroundColor White
+Write-Host ""
 Write-Host "🚀 Para ejecutar el backend:" -ForegroundColor Cyan
 Write-Host "   poetry run uvicorn app.main:app --reload --host 0.0.0.0 --port 8000" -ForegroundColor White
 Write-Host ""
@@ -0,0 +1 @@
+# Adaptadores de caché (decoradores de puertos)
@@ -0,0 +1,92 @@
+"""
+Decorador de AsyncBrandPort que mantiene coherentes las cachés
+Con DB_ACCESS_MODE=async las lecturas van al primario, pero las rutas síncronas
+y el resto de workers siguen usando la caché local y la compartida: cada
+escritura asíncrona las invalida igual que CachedBrandRepository y
+SharedCachedBrandRepository. Las operaciones sobre Redis son bloqueantes y se
+ejecutan en un thread para no detener el event loop.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from app.adapters.cache.shared_brand_repository import (
+    invalidate_shared_ids,
+    invalidate_shared_lists,
+)
+from app.adapters.cache.shared_cache import SharedCache
+from app.adapters.cache.ttl_lru_cache import TTLLRUCache
+from app.core.tracing import traced_operations
+from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
+from app.domain.ports.async_brand_port import AsyncBrandPort
+
+@traced_operations
+class AsyncInvalidatingBrandRepository(AsyncBrandPort):
+    """AsyncBrandPort que invalida la caché local y la compartida tras cada escritura"""
+
+    def __init__(
+        self,
+        inner: AsyncBrandPort,
+        local: Optional[TTLLRUCache] = None,
+        shared: Optional[SharedCache] = None,
+    ):
+        self.inner = inner
+        self.local = local
+        self.shared = shared
+
+    async def get_all(self, filters: Optional[BrandFilter] = None, sort: Optional[BrandSort] = None) -> List[Brand]:
+        return await self.inner.get_all(filters, sort)
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[Any, UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+    ) -> List[Brand]:
+        return await self.inner.get_page(limit, after, filters, sort)
+
+    async def get_by_id(self, brand_id: UUID) -> Optional[Brand]:
+        return await self.inner.get_by_id(brand_id)
+
+    async def get_version(self, brand_id: UUID) -> Optional[datetime]:
+        return await self.inner.get_version(brand_id)
+
+    async def get_collection_version(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        return await self.inner.get_collection_version()
+
+    async def create(self, brand: Brand) -> Brand:
+        try:
+            return await self.inner.create(brand)
+        finally:
+            if self.shared is not None:
+                await asyncio.to_thread(invalidate_shared_lists, self.shared)
+
+    async def update(self, brand_id: UUID, brand: Brand) -> Brand:
+        try:
+            return await self.inner.update(brand_id, brand)
+        finally:
+            await self._invalidate(brand_id)
+
+    async def delete(self, brand_id: UUID) -> None:
+        try:
+            await self.inner.delete(brand_id)
+        finally:
+            await self._invalidate(brand_id)
+
+    async def hard_delete(self, brand_id: UUID) -> None:
+        try:
+            await self.inner.hard_delete(brand_id)
+        finally:
+            await self._invalidate(brand_id)
+
+    async def _invalidate(self, brand_id: UUID) -> None:
+        """Invalidar una marca en la caché local y en la compartida (que avisa al resto de workers)"""
+        if self.local is not None:
+            self.local.invalidate(brand_id)
+        if self.shared is not None:
+            await asyncio.to_thread(invalidate_shared_ids, self.shared, [brand_id])
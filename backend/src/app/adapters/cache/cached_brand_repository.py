@@ -0,0 +1,157 @@
+"""
+Decorador de BrandPort con caché de entidades por ID
+Las lecturas por ID se sirven desde una caché LRU/TTL compartida por el
+worker; las escrituras delegan en el repositorio envuelto e invalidan las
+entradas afectadas. La caché guarda y devuelve copias: las peticiones
+concurrentes no comparten una misma instancia mutable de Brand.
+"""
+
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.adapters.cache.ttl_lru_cache import TTLLRUCache
+from app.config import settings
+from app.core.metrics import CACHE_LOOKUPS
+from app.core.tracing import traced_operations
+from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
+from app.domain.ports.brand_port import BrandPort
+
+# Caché de marcas por ID del worker (una instancia por proceso)
+brand_cache = TTLLRUCache(
+    ttl_seconds=settings.BRAND_CACHE_TTL_SECONDS,
+    max_entries=settings.BRAND_CACHE_MAX_ENTRIES,
+    max_bytes=settings.BRAND_CACHE_MAX_BYTES,
+)
+CACHE_LOOKUPS.add_callback(lambda: {("local", "hit"): brand_cache.hits, ("local", "miss"): brand_cache.misses})
+
+@traced_operations
+class CachedBrandRepository(BrandPort):
+    """BrandPort que cachea get_by_id e invalida en update, delete, hard_delete y operaciones masivas"""
+
+    def __init__(self, inner: BrandPort, cache: TTLLRUCache = brand_cache, fill: bool = True):
+        self.inner = inner
+        self.cache = cache
+        # False si las lecturas de `inner` van a una réplica, que puede ir por detrás de la última invalidación
+        self.fill = fill
+
+    def get_all(self, filters: Optional[BrandFilter] = None, sort: Optional[BrandSort] = None) -> List[Brand]:
+        return self.inner.get_all(filters, sort)
+
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[Any, UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+    ) -> List[Brand]:
+        return self.inner.get_page(limit, after, filters, sort)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Brand]:
+        return self.inner.iter_all(batch_size)
+
+    def get_rows(
+        self,
+        fields: Sequence[str],
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple]:
+        return self.inner.get_rows(fields, filters, sort, limit)
+
+    def iter_rows(self, fields: Sequence[str], batch_size: int = 1000) -> Iterator[Tuple]:
+        return self.inner.iter_rows(fields, batch_size)
+
+    def search(self, query: str, limit: int, min_similarity: float) -> List[Brand]:
+        return self.inner.search(query, limit, min_similarity)
+
+    def get_by_id(self, brand_id: UUID) -> Optional[Brand]:
+        """Obtener una marca por ID desde la caché o, si no está, desde el repositorio"""
+        cached = self.cache.get(brand_id)
+        if cached is not None:
+            return replace(cached)
+        # Generación previa a la lectura: si una escritura invalida la marca
+        # mientras se lee, el valor leído no se cachea
+        generation = self.cache.generation(brand_id)
+        brand = self.inner.get_by_id(brand_id)
+        # Las ausencias no se cachean: una marca recién creada debe verse al momento
+        if self.fill and brand is not None:
+            self.cache.set(brand_id, replace(brand), generation)
+        return brand
+
+    def get_changes(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Brand]:
+        return self.inner.get_changes(limit, after, until)
+
+    def get_version(self, brand_id: UUID) -> Optional[datetime]:
+        """updated_at de la marca cacheada o, si no está, la sonda del repositorio"""
+        brand = self.cache.get(brand_id)
+        if brand is not None:
+            return brand.updated_at
+        return self.inner.get_version(brand_id)
+
+    def get_collection_version(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        return self.inner.get_collection_version()
+
+    def create(self, brand: Brand) -> Brand:
+        return self.inner.create(brand)
+
+    def create_many(self, brands: List[Brand]) -> int:
+        return self.inner.create_many(brands)
+
+    def update(self, brand_id: UUID, brand: Brand) -> Brand:
+        self.cache.invalidate(brand_id)
+        try:
+            return self.inner.update(brand_id, brand)
+        finally:
+            self.cache.invalidate(brand_id)
+
+    def bulk_update(
+        self,
+        changes: Dict[str, Any],
+        ids: Optional[List[UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        try:
+            return self.inner.bulk_update(changes, ids=ids, filters=filters, chunk_size=chunk_size)
+        finally:
+            self._invalidate_selection(ids)
+
+    def delete(self, brand_id: UUID) -> None:
+        try:
+            self.inner.delete(brand_id)
+        finally:
+            self.cache.invalidate(brand_id)
+
+    def bulk_delete(
+        self,
+        ids: Optional[List[UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        try:
+            return self.inner.bulk_delete(ids=ids, filters=filters, chunk_size=chunk_size)
+        finally:
+            self._invalidate_selection(ids)
+
+    def hard_delete(self, brand_id: UUID) -> None:
+        try:
+            self.inner.hard_delete(brand_id)
+        finally:
+            self.cache.invalidate(brand_id)
+
+    def _invalidate_selection(self, ids: Optional[List[UUID]]) -> None:
+        """Invalidar las marcas de una operación masiva (con filtro no se conocen los IDs: se vacía)"""
+        if ids is None:
+            self.cache.clear()
+            return
+        for brand_id in ids:
+            self.cache.invalidate(brand_id)
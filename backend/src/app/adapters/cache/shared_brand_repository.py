@@ -0,0 +1,230 @@
+"""
+Decorador de BrandPort sobre la caché compartida (Redis)
+Cachea las lecturas por ID y las páginas del listado para todos los workers.
+Las escrituras borran las claves afectadas, incrementan la versión de los
+listados y la de cada marca modificada y publican la invalidación para las
+cachés locales de cada worker. Solo se rellena la caché con lecturas del
+primario: una réplica con retraso devolvería filas anteriores a la versión
+vigente, que quedarían guardadas como actuales.
+"""
+
+import hashlib
+import json
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app.adapters.cache.shared_cache import (
+    ENTITY_VERSION,
+    INVALIDATE_ALL,
+    LIST_VERSION,
+    SharedCache,
+    create_shared_cache,
+)
+from app.config import settings
+from app.core.metrics import CACHE_LOOKUPS
+from app.core.tracing import traced_operations
+from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
+from app.domain.ports.brand_port import BrandPort
+
+# Aviso que solo afecta a listados (las cachés locales por ID no cambian)
+INVALIDATE_LISTS = "lists"
+
+# Caché compartida del proceso (None si SHARED_CACHE_URL no está definida)
+shared_cache = create_shared_cache(settings)
+if shared_cache is not None:
+    CACHE_LOOKUPS.add_callback(lambda: {("shared", "hit"): shared_cache.hits, ("shared", "miss"): shared_cache.misses})
+
+_BRAND_FIELDS = [f.name for f in fields(Brand)]
+
+def dump_brands(brands: List[Brand]) -> bytes:
+    """Serializar marcas a JSON compacto"""
+    return json.dumps(
+        [[getattr(brand, name) for name in _BRAND_FIELDS] for brand in brands],
+        default=str, separators=(",", ":"),
+    ).encode("utf-8")
+
+def load_brands(payload: bytes) -> List[Brand]:
+    """Reconstruir marcas desde dump_brands"""
+    brands = []
+    for row in json.loads(payload):
+        values = dict(zip(_BRAND_FIELDS, row, strict=False))
+        if values["id"] is not None:
+            values["id"] = UUID(values["id"])
+        for name in ("created_at", "updated_at", "deleted_at"):
+            if values.get(name) is not None:
+                values[name] = datetime.fromisoformat(values[name])
+        brands.append(Brand.from_row(**values))
+    return brands
+
+def id_version(brand_id: UUID) -> str:
+    """Nombre de la versión de una marca concreta"""
+    return f"id-version:{brand_id}"
+
+def invalidate_shared_lists(cache: SharedCache) -> None:
+    """Invalidar los listados tras un alta (las entidades cacheadas no cambian)"""
+    cache.invalidate([], INVALIDATE_LISTS)
+
+def invalidate_shared_ids(cache: SharedCache, ids: Optional[List[UUID]]) -> None:
+    """Invalidar marcas por ID; sin IDs (filtro) se invalidan todas las entidades"""
+    if ids is None:
+        cache.invalidate([], INVALIDATE_ALL, versions=(LIST_VERSION, ENTITY_VERSION))
+        return
+    cache.invalidate(
+        [cache.key("id", brand_id) for brand_id in ids],
+        ",".join(str(brand_id) for brand_id in ids),
+        versions=(LIST_VERSION, *(id_version(brand_id) for brand_id in ids)),
+    )
+
+def handle_invalidation(cache, message: str) -> None:
+    """Aplicar un aviso de invalidación a la caché local por ID de este worker"""
+    if message == INVALIDATE_ALL:
+        cache.clear()
+    elif message != INVALIDATE_LISTS:
+        for brand_id in message.split(","):
+            cache.invalidate(UUID(brand_id))
+
+@traced_operations
+class SharedCachedBrandRepository(BrandPort):
+    """BrandPort que cachea get_by_id y get_page en la caché compartida, con invalidación write-through"""
+
+    def __init__(self, inner: BrandPort, cache: SharedCache, fill: bool = True):
+        self.inner = inner
+        self.cache = cache
+        # False si las lecturas de `inner` van a una réplica: se sirven aciertos pero no se rellena
+        self.fill = fill
+
+    def get_all(self, filters: Optional[BrandFilter] = None, sort: Optional[BrandSort] = None) -> List[Brand]:
+        return self.inner.get_all(filters, sort)
+
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[Any, UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+    ) -> List[Brand]:
+        """Página desde la caché si se guardó con la versión de listados vigente"""
+        digest = hashlib.sha1(repr((limit, after, filters, sort)).encode("utf-8")).hexdigest()
+        key = self.cache.key("page", digest)
+        payload, version = self.cache.get_versioned(key, LIST_VERSION)
+        if payload is not None:
+            return load_brands(payload)
+        brands = self.inner.get_page(limit, after, filters, sort)
+        if self.fill and version is not None:
+            self.cache.set_versioned(key, version, dump_brands(brands))
+        return brands
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Brand]:
+        return self.inner.iter_all(batch_size)
+
+    def get_rows(
+        self,
+        fields: Sequence[str],
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple]:
+        return self.inner.get_rows(fields, filters, sort, limit)
+
+    def iter_rows(self, fields: Sequence[str], batch_size: int = 1000) -> Iterator[Tuple]:
+        return self.inner.iter_rows(fields, batch_size)
+
+    def search(self, query: str, limit: int, min_similarity: float) -> List[Brand]:
+        return self.inner.search(query, limit, min_similarity)
+
+    def get_by_id(self, brand_id: UUID) -> Optional[Brand]:
+        """Marca desde la caché compartida o, si no está, desde el repositorio"""
+        key = self.cache.key("id", brand_id)
+        payload, version = self.cache.get_versioned(key, ENTITY_VERSION, id_version(brand_id))
+        if payload is not None:
+            return load_brands(payload)[0]
+        brand = self.inner.get_by_id(brand_id)
+        if self.fill and brand is not None and version is not None:
+            self.cache.set_versioned(key, version, dump_brands([brand]))
+        return brand
+
+    def get_changes(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Brand]:
+        return self.inner.get_changes(limit, after, until)
+
+    def get_version(self, brand_id: UUID) -> Optional[datetime]:
+        """updated_at de la marca en la caché compartida o, si no está, la sonda del repositorio"""
+        payload, _ = self.cache.get_versioned(self.cache.key("id", brand_id), ENTITY_VERSION, id_version(brand_id))
+        if payload is not None:
+            return load_brands(payload)[0].updated_at
+        return self.inner.get_version(brand_id)
+
+    def get_collection_version(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Versión de la colección desde la caché si se guardó con la versión de listados vigente"""
+        key = self.cache.key("collection-version")
+        payload, version = self.cache.get_versioned(key, LIST_VERSION)
+        if payload is not None:
+            return tuple(datetime.fromisoformat(value) if value else None for value in json.loads(payload))
+        versions = self.inner.get_collection_version()
+        if self.fill and version is not None:
+            self.cache.set_versioned(key, version, json.dumps([value.isoformat() if value else None for value in versions]).encode("utf-8"))
+        return versions
+
+    def create(self, brand: Brand) -> Brand:
+        try:
+            return self.inner.create(brand)
+        finally:
+            invalidate_shared_lists(self.cache)
+
+    def create_many(self, brands: List[Brand]) -> int:
+        try:
+            return self.inner.create_many(brands)
+        finally:
+            invalidate_shared_lists(self.cache)
+
+    def update(self, brand_id: UUID, brand: Brand) -> Brand:
+        try:
+            return self.inner.update(brand_id, brand)
+        finally:
+            self._invalidate_ids([brand_id])
+
+    def bulk_update(
+        self,
+        changes: Dict[str, Any],
+        ids: Optional[List[UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        try:
+            return self.inner.bulk_update(changes, ids=ids, filters=filters, chunk_size=chunk_size)
+        finally:
+            self._invalidate_ids(ids)
+
+    def delete(self, brand_id: UUID) -> None:
+        try:
+            self.inner.delete(brand_id)
+        finally:
+            self._invalidate_ids([brand_id])
+
+    def bulk_delete(
+        self,
+        ids: Optional[List[UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        try:
+            return self.inner.bulk_delete(ids=ids, filters=filters, chunk_size=chunk_size)
+        finally:
+            self._invalidate_ids(ids)
+
+    def hard_delete(self, brand_id: UUID) -> None:
+        try:
+            self.inner.hard_delete(brand_id)
+        finally:
+            self._invalidate_ids([brand_id])
+
+    def _invalidate_ids(self, ids: Optional[List[UUID]]) -> None:
+        invalidate_shared_ids(self.cache, ids)
@@ -0,0 +1,249 @@
+"""
+Caché compartida entre workers sobre el protocolo Redis
+Guarda valores serializados con TTL, mantiene versiones de listados y de
+entidades que se incrementan en cada escritura y publica invalidaciones en un canal pub/sub
+para que cada worker descarte su copia local. Cualquier fallo del servidor
+se trata como un fallo de caché: se registra, se deja de consultar durante
+un intervalo y las peticiones siguen contra la base de datos.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from app.core.logger import get_logger_with_uuid
+
+# Mensaje de invalidación que vacía toda la caché local
+INVALIDATE_ALL = "*"
+
+# Versiones que invalidan en bloque: listados (cualquier escritura) y
+# entidades (operaciones masivas por filtro, cuyos IDs no se conocen)
+LIST_VERSION = "list-version"
+ENTITY_VERSION = "entity-version"
+GLOBAL_VERSIONS = (LIST_VERSION, ENTITY_VERSION)
+
+class SharedCache:
+    """
+    Operaciones de caché tolerantes a fallos sobre un cliente Redis
+
+    Args:
+        client: cliente con la API de redis-py (get, set, delete, incr, publish, pubsub)
+        ttl_seconds: vida de cada valor
+        channel: canal pub/sub de invalidaciones
+        key_prefix: prefijo de todas las claves
+        retry_after_seconds: tiempo sin consultar el servidor tras un fallo
+        max_pending_invalidations: invalidaciones a reintentar cuando el servidor vuelva
+    """
+
+    def __init__(
+        self,
+        client,
+        ttl_seconds: float = 300.0,
+        channel: str = "brands:invalidate",
+        key_prefix: str = "brands:",
+        retry_after_seconds: float = 5.0,
+        max_pending_invalidations: int = 10000,
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.channel = channel
+        self.key_prefix = key_prefix
+        self.retry_after_seconds = retry_after_seconds
+        self.max_pending_invalidations = max_pending_invalidations
+        self.logger = get_logger_with_uuid(None)
+        self.errors = 0
+        self.hits = 0
+        self.misses = 0
+        self._down_until = 0.0
+        self._pending_keys: set = set()
+        self._pending_lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    # Disponibilidad
+
+    @property
+    def available(self) -> bool:
+        """El servidor no ha fallado en el último intervalo de reintento"""
+        return time.monotonic() >= self._down_until
+
+    def _call(self, operation: str, function: Callable[[], Any], default: Any = None) -> Any:
+        """Ejecutar una operación; si falla, marcar el servidor como caído y devolver `default`"""
+        if not self.available:
+            return default
+        try:
+            # Las invalidaciones pendientes se aplican antes de volver a leer
+            self._flush_pending()
+            return function()
+        except Exception as e:
+            self.errors += 1
+            self._down_until = time.monotonic() + self.retry_after_seconds
+            self.logger.warning("Shared cache %s failed, using database for %ss: %s", operation, self.retry_after_seconds, e)
+            return default
+
+    def stats(self) -> dict:
+        """Estado del servidor para diagnóstico"""
+        return {
+            "available": self.available,
+            "errors": self.errors,
+            "hits": self.hits,
+            "misses": self.misses,
+            "pending_invalidations": len(self._pending_keys),
+            "listening": self._listener is not None,
+        }
+
+    # Valores
+
+    def key(self, *parts: Any) -> str:
+        """Clave con prefijo a partir de sus partes"""
+        return self.key_prefix + ":".join(str(part) for part in parts)
+
+    def get_versioned(self, key: str, *version_names: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Leer un valor junto con las versiones actuales `version_names` en una sola ida y vuelta
+
+        Returns:
+            (valor si se guardó con las versiones actuales o None, versiones actuales o None si el servidor no responde)
+        """
+        result = self._call("get", lambda: self.client.mget([key, *(self.key(name) for name in version_names)]))
+        if result is None:
+            return None, None
+        stored, *current = result
+        version = ".".join(str(int(value or 0)) for value in current)
+        if stored is not None:
+            stored_version, _, payload = stored.partition(b"|")
+            if stored_version == version.encode("ascii"):
+                self.hits += 1
+                return payload, version
+        self.misses += 1
+        return None, version
+
+    def set_versioned(self, key: str, version: str, payload: bytes) -> None:
+        """Guardar un valor asociado a las versiones leídas antes de calcularlo, con TTL"""
+        value = version.encode("ascii") + b"|" + payload
+        self._call("set", lambda: self.client.set(key, value, ex=max(1, int(self.ttl_seconds))))
+
+    # Invalidación (write-through)
+
+    def invalidate(self, keys: Iterable[str], message: str, versions: Iterable[str] = (LIST_VERSION,)) -> None:
+        """
+        Borrar claves, incrementar versiones y avisar al resto de workers
+
+        Incrementar la versión junto con el borrado evita que un lector que
+        cargó el valor antes de la escritura lo vuelva a guardar obsoleto.
+
+        Si el servidor no responde, las claves quedan pendientes y se borran
+        en la primera operación que vuelva a funcionar.
+        """
+        keys = list(keys)
+        versions = list(versions)
+
+        def apply():
+            if keys:
+                self.client.delete(*keys)
+            for version_name in versions:
+                version_key = self.key(version_name)
+                self.client.incr(version_key)
+                if version_name not in GLOBAL_VERSIONS:
+                    # Una versión por entidad debe sobrevivir a los valores guardados con la anterior
+                    self.client.expire(version_key, 2 * max(1, int(self.ttl_seconds)))
+            self.client.publish(self.channel, message)
+            return True
+
+        if not self._call("invalidate", apply, default=False):
+            self._remember_pending(keys)
+
+    def _remember_pending(self, keys: list) -> None:
+        with self._pending_lock:
+            if len(self._pending_keys) + len(keys) > self.max_pending_invalidations:
+                self.logger.error("Shared cache pending invalidations overflow; stale entries expire by TTL")
+                return
+            self._pending_keys.update(keys)
+            # Un marcador fuerza también el incremento de versiones y el aviso global
+            self._pending_keys.add(None)
+
+    def _flush_pending(self) -> None:
+        if not self._pending_keys:
+            return
+        with self._pending_lock:
+            pending, self._pending_keys = self._pending_keys, set()
+        keys = [key for key in pending if key is not None]
+        try:
+            if keys:
+                self.client.delete(*keys)
+            # Durante la caída otros workers pudieron escribir sin avisar: invalidar todo
+            self.client.incr(self.key(LIST_VERSION))
+            self.client.incr(self.key(ENTITY_VERSION))
+            self.client.publish(self.channel, INVALIDATE_ALL)
+        except Exception:
+            with self._pending_lock:
+                self._pending_keys.update(pending)
+            raise
+
+    # Pub/sub
+
+    def start_listener(self, on_message: Callable[[str], None], poll_seconds: float = 1.0) -> None:
+        """Escuchar invalidaciones en un thread en segundo plano (se reconecta si falla)"""
+        if self._listener is not None:
+            return
+        self._stopping.clear()
+        self._listener = threading.Thread(
+            target=self._listen, args=(on_message, poll_seconds), name="shared-cache-listener", daemon=True
+        )
+        self._listener.start()
+
+    def stop_listener(self) -> None:
+        """Detener el thread de escucha"""
+        self._stopping.set()
+        if self._listener is not None:
+            self._listener.join(timeout=5)
+            self._listener = None
+
+    def _listen(self, on_message: Callable[[str], None], poll_seconds: float) -> None:
+        while not self._stopping.is_set():
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                # Al (re)conectar se pudieron perder avisos: vaciar la copia local
+                on_message(INVALIDATE_ALL)
+                while not self._stopping.is_set():
+                    message = pubsub.get_message(timeout=poll_seconds)
+                    if message and message.get("type") == "message":
+                        data = message["data"]
+                        on_message(data.decode("utf-8") if isinstance(data, bytes) else str(data))
+            except Exception as e:
+                self.logger.warning("Shared cache listener disconnected, retrying in %ss: %s", self.retry_after_seconds, e)
+                self._stopping.wait(self.retry_after_seconds)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+def create_shared_cache(settings) -> Optional[SharedCache]:
+    """
+    Crear la caché compartida si SHARED_CACHE_URL está definida
+
+    Requiere el paquete opcional `redis`; si no está instalado se registra y
+    la aplicación funciona sin caché compartida.
+    """
+    if not settings.SHARED_CACHE_URL:
+        return None
+    try:
+        import redis
+    except ImportError:
+        get_logger_with_uuid(None).warning("SHARED_CACHE_URL is set but the 'redis' package is not installed")
+        return None
+    client = redis.Redis.from_url(
+        settings.SHARED_CACHE_URL,
+        socket_timeout=settings.SHARED_CACHE_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.SHARED_CACHE_SOCKET_TIMEOUT,
+    )
+    return SharedCache(
+        client,
+        ttl_seconds=settings.SHARED_CACHE_TTL_SECONDS,
+        channel=settings.SHARED_CACHE_CHANNEL,
+        retry_after_seconds=settings.SHARED_CACHE_RETRY_SECONDS,
+    )
@@ -0,0 +1,138 @@
+"""
+Caché en memoria LRU con expiración (TTL)
+Acotada por número de entradas y por tamaño aproximado en bytes, para que un
+worker de larga duración no crezca sin límite. Segura entre threads.
+
+Cada invalidación avanza la generación de la clave: un lector toma
+generation(key) antes de ir a la base de datos y pasa ese valor a set(), que
+descarta el valor si entre medias hubo una escritura.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Generaciones agrupadas en ranuras por hash de la clave: memoria acotada a
+# cambio de que una invalidación descarte también rellenos de otras claves
+GENERATION_SLOTS = 4096
+
+def approximate_size(value: Any) -> int:
+    """Tamaño aproximado en bytes de un valor (objeto más sus campos si es un dataclass)"""
+    size = sys.getsizeof(value)
+    if is_dataclass(value):
+        size += sum(sys.getsizeof(getattr(value, f.name)) for f in fields(value))
+    return size
+
+class TTLLRUCache:
+    """
+    Caché LRU con TTL por entrada
+
+    Args:
+        ttl_seconds: vida de cada entrada desde que se guarda
+        max_entries: número máximo de entradas
+        max_bytes: tamaño aproximado máximo (suma de approximate_size de los valores)
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 10000, max_bytes: int = 16 * 1024 * 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # clave -> (valor, instante de expiración, tamaño)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._generations = [0] * GENERATION_SLOTS
+        self._clears = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Valor de la clave o None si no está o expiró"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, _ = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self, key: Hashable) -> Tuple[int, int]:
+        """Generación actual de la clave, para pasarla a set() tras leer el valor"""
+        with self._lock:
+            return self._clears, self._generations[hash(key) % GENERATION_SLOTS]
+
+    def set(self, key: Hashable, value: Any, generation: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Guardar un valor desalojando las entradas menos usadas si se superan los límites
+
+        Con `generation` (tomada antes de leer el valor) no se guarda si la clave
+        se invalidó después: el valor podría ser anterior a esa escritura.
+        """
+        size = approximate_size(value)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != (self._clears, self._generations[hash(key) % GENERATION_SLOTS]):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Eliminar una entrada y descartar los set() en curso de la clave"""
+        with self._lock:
+            self._generations[hash(key) % GENERATION_SLOTS] += 1
+            if key in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Vaciar la caché (conserva los contadores)"""
+        with self._lock:
+            self._clears += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores y ocupación actual"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,53 @@
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.adapters.db.pool import pool_options
+from app.adapters.db.session import sql_instrumentation
+from app.config import settings
+
+# Drivers asíncronos por dialecto
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+def to_async_url(database_url: str) -> str:
+    """Convertir una URL síncrona (psycopg2/pysqlite) a su driver asíncrono"""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}'")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+def create_async_test_engine(database_url: str = "sqlite:///:memory:") -> AsyncEngine:
+    """Crear un engine asíncrono de SQLite (aiosqlite) para tests"""
+    return create_async_engine(to_async_url(database_url), echo=False)
+
+def get_async_engine() -> AsyncEngine:
+    """Engine asíncrono, creado bajo demanda para no exigir el driver en modo síncrono"""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            to_async_url(settings.DATABASE_URL), **pool_options(settings.DATABASE_URL, settings)
+        )
+        sql_instrumentation.attach(_async_engine.sync_engine)
+        _async_session_factory = async_sessionmaker(bind=_async_engine, expire_on_commit=False)
+    return _async_engine
+
+async def dispose_async_engine() -> None:
+    """Cerrar el pool del engine asíncrono si se llegó a crear"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
+async def get_async_db():
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
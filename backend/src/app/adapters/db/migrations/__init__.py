@@ -0,0 +1,187 @@
+"""
+Migraciones de esquema versionadas
+Cada módulo de `versions/` (vNNNN_descripcion.py) define VERSION, DESCRIPTION,
+TRANSACTIONAL y upgrade(conn). Las versiones aplicadas se registran en la
+tabla schema_migrations. Se ejecutan una sola vez, fuera de los workers que
+sirven peticiones:
+
+    python -m app.adapters.db.migrations upgrade
+    python -m app.adapters.db.migrations status
+    python -m app.adapters.db.migrations seed
+
+En PostgreSQL el proceso toma un advisory lock, de modo que varios despliegues
+simultáneos no compiten, y las migraciones no transaccionales (CREATE INDEX
+CONCURRENTLY) se ejecutan en modo AUTOCOMMIT.
+"""
+
+import importlib
+import pkgutil
+from datetime import datetime
+from types import ModuleType
+from typing import List, Optional
+from uuid import uuid4
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    column,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.logger import get_logger_with_uuid
+
+# Clave del advisory lock de PostgreSQL para serializar ejecuciones
+MIGRATION_LOCK_KEY = 7_314_002_009
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", String(32), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+# Marcas de ejemplo para entornos de desarrollo (las que insertaba init-db.sql)
+SAMPLE_BRANDS = (
+    {"name": "TechCorp", "owner": "John Doe", "lang": "en", "status": "active"},
+    {"name": "GreenEarth", "owner": "Jane Smith", "lang": "es", "status": "active"},
+    {"name": "FoodMaster", "owner": "Mike Johnson", "lang": "en", "status": "active"},
+)
+
+logger = get_logger_with_uuid(None)
+
+def load_migrations() -> List[ModuleType]:
+    """Cargar los módulos de versions/ ordenados por versión"""
+    from app.adapters.db.migrations import versions
+
+    modules = [
+        importlib.import_module(f"{versions.__name__}.{info.name}")
+        for info in pkgutil.iter_modules(versions.__path__)
+        if info.name.startswith("v")
+    ]
+    return sorted(modules, key=lambda module: module.VERSION)
+
+def applied_versions(engine: Engine) -> List[str]:
+    """Versiones ya aplicadas en la base de datos"""
+    with engine.begin() as conn:
+        schema_migrations.create(conn, checkfirst=True)
+        return list(conn.scalars(select(schema_migrations.c.version).order_by(schema_migrations.c.version)))
+
+def pending_migrations(engine: Engine) -> List[ModuleType]:
+    """Migraciones pendientes de aplicar"""
+    applied = set(applied_versions(engine))
+    return [module for module in load_migrations() if module.VERSION not in applied]
+
+def run_migrations(engine: Engine, target: Optional[str] = None) -> List[str]:
+    """
+    Aplicar las migraciones pendientes hasta `target` (incluida) o hasta la última
+
+    Returns:
+        Versiones aplicadas en esta ejecución
+    """
+    is_postgresql = engine.dialect.name == "postgresql"
+    lock_conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT") if is_postgresql else None
+    try:
+        if lock_conn is not None:
+            lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+        applied = []
+        for module in pending_migrations(engine):
+            if target is not None and module.VERSION > target:
+                break
+            logger.info("Applying migration %s: %s", module.VERSION, module.DESCRIPTION)
+            if module.TRANSACTIONAL or not is_postgresql:
+                with engine.begin() as conn:
+                    module.upgrade(conn)
+                    _record(conn, module)
+            else:
+                with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                    module.upgrade(conn)
+                    _record(conn, module)
+            applied.append(module.VERSION)
+        return applied
+    finally:
+        if lock_conn is not None:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            lock_conn.close()
+
+def _record(conn: Connection, module: ModuleType) -> None:
+    """Registrar una migración como aplicada"""
+    conn.execute(
+        schema_migrations.insert().values(
+            version=module.VERSION,
+            description=module.DESCRIPTION,
+            applied_at=datetime.utcnow(),
+        )
+    )
+
+def seed_sample_data(engine: Engine) -> List[str]:
+    """
+    Insertar las marcas de ejemplo que falten (paso explícito, no es una migración)
+
+    Es idempotente: las marcas cuyo nombre ya existe no se tocan. Requiere el
+    esquema migrado.
+
+    Returns:
+        Nombres de las marcas insertadas
+    """
+    brands = table("brands", column("id", Uuid), column("name"), column("owner"), column("lang"), column("status"))
+    with engine.begin() as conn:
+        existing = set(conn.scalars(select(brands.c.name).where(brands.c.name.in_([row["name"] for row in SAMPLE_BRANDS]))))
+        missing = [row for row in SAMPLE_BRANDS if row["name"] not in existing]
+        if missing:
+            # id explícito: en SQLite la columna no tiene valor por defecto en servidor
+            conn.execute(brands.insert(), [{"id": uuid4(), **row} for row in missing])
+    return [row["name"] for row in missing]
+
+# Utilidades DDL para las migraciones
+
+def create_index(
+    conn: Connection,
+    name: str,
+    table: str,
+    columns: str,
+    where: Optional[str] = None,
+    unique: bool = False,
+    using: Optional[str] = None,
+) -> None:
+    """
+    Crear un índice si no existe; en PostgreSQL con CREATE INDEX CONCURRENTLY
+
+    Un CREATE INDEX CONCURRENTLY interrumpido deja el índice como INVALID; en ese
+    caso se elimina y se vuelve a crear.
+    """
+    is_postgresql = conn.dialect.name == "postgresql"
+    if is_postgresql:
+        invalid = conn.execute(
+            text(
+                "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ),
+            {"name": name},
+        ).first()
+        if invalid:
+            drop_index(conn, name)
+    ddl = "CREATE {unique}INDEX {concurrently}IF NOT EXISTS {name} ON {table}{using} ({columns}){where}".format(
+        unique="UNIQUE " if unique else "",
+        concurrently="CONCURRENTLY " if is_postgresql else "",
+        name=name,
+        table=table,
+        using=f" USING {using}" if using and is_postgresql else "",
+        columns=columns,
+        where=f" WHERE {where}" if where else "",
+    )
+    conn.execute(text(ddl))
+
+def drop_index(conn: Connection, name: str) -> None:
+    """Eliminar un índice si existe; en PostgreSQL con DROP INDEX CONCURRENTLY"""
+    concurrently = "CONCURRENTLY " if conn.dialect.name == "postgresql" else ""
+    conn.execute(text(f"DROP INDEX {concurrently}IF EXISTS {name}"))
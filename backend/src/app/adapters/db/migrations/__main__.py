@@ -0,0 +1,33 @@
+"""CLI de migraciones: python -m app.adapters.db.migrations [upgrade [VERSION] | status | seed]"""
+
+import sys
+
+from app.adapters.db.migrations import (
+    applied_versions,
+    load_migrations,
+    run_migrations,
+    seed_sample_data,
+)
+from app.adapters.db.session import engine
+
+def main(argv) -> int:
+    command = argv[0] if argv else "upgrade"
+    if command == "upgrade":
+        applied = run_migrations(engine, target=argv[1] if len(argv) > 1 else None)
+        print(f"Applied {len(applied)} migration(s): {', '.join(applied) or '-'}")
+        return 0
+    if command == "status":
+        applied = set(applied_versions(engine))
+        for module in load_migrations():
+            mark = "x" if module.VERSION in applied else " "
+            print(f"[{mark}] {module.VERSION} {module.DESCRIPTION}")
+        return 0
+    if command == "seed":
+        inserted = seed_sample_data(engine)
+        print(f"Inserted {len(inserted)} sample brand(s): {', '.join(inserted) or '-'}")
+        return 0
+    print(__doc__)
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
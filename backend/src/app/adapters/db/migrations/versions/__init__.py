@@ -0,0 +1 @@
+# Versiones de migración (vNNNN_descripcion.py)
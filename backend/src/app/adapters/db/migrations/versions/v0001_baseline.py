@@ -0,0 +1,70 @@
+"""
+Esquema base de la tabla brands
+Equivale al esquema que antes creaban init-db.sql y create_all(); es
+idempotente para poder adoptarse sobre bases de datos existentes.
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+VERSION = "0001"
+DESCRIPTION = "baseline brands table"
+TRANSACTIONAL = True
+
+_COMMENTS = {
+    "id": "Identificador único de la marca",
+    "name": "Nombre de la marca",
+    "owner": "Propietario de la marca",
+    "lang": "Código de idioma ISO 639-1",
+    "status": "Estado de la marca",
+    "created_at": "Fecha y hora de creación",
+    "updated_at": "Fecha y hora de última actualización",
+    "deleted_at": "Fecha y hora de eliminación (soft delete)",
+}
+
+def _brands_table(is_postgresql: bool) -> sa.Table:
+    """Definición congelada de la tabla (no depende del modelo ORM actual)"""
+    return sa.Table(
+        "brands",
+        sa.MetaData(),
+        sa.Column(
+            "id", sa.Uuid, primary_key=True,
+            server_default=sa.text("gen_random_uuid()") if is_postgresql else None,
+        ),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("owner", sa.String(255), nullable=False),
+        sa.Column("lang", sa.String(10), nullable=False),
+        sa.Column("status", sa.String(50), server_default="Pendiente"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("name", name="brands_name_key"),
+        comment="Tabla de marcas comerciales con trazabilidad completa",
+    )
+
+def upgrade(conn: Connection) -> None:
+    is_postgresql = conn.dialect.name == "postgresql"
+    brands = _brands_table(is_postgresql)
+    if sa.inspect(conn).has_table(brands.name):
+        return
+    brands.create(conn)
+
+    if is_postgresql:
+        for column, comment in _COMMENTS.items():
+            conn.execute(sa.text(f"COMMENT ON COLUMN brands.{column} IS '{comment}'"))
+        conn.execute(sa.text(
+            """
+            CREATE OR REPLACE FUNCTION update_updated_at_column()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                NEW.updated_at = CURRENT_TIMESTAMP;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+            """
+        ))
+        conn.execute(sa.text("DROP TRIGGER IF EXISTS update_brands_updated_at ON brands"))
+        conn.execute(sa.text(
+            "CREATE TRIGGER update_brands_updated_at BEFORE UPDATE ON brands "
+            "FOR EACH ROW EXECUTE FUNCTION update_updated_at_column()"
+        ))
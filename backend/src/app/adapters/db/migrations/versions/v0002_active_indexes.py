@@ -0,0 +1,59 @@
+"""
+Índices parciales sobre marcas activas
+Todas las consultas de la API filtran deleted_at IS NULL, así que los índices
+se restringen a las filas activas. Se eliminan los índices de columna sueltos
+que creaban create_all() (ix_brands_*) e init-db.sql (idx_brands_*): el de id
+duplica la clave primaria y el de name duplica la restricción UNIQUE.
+
+No es transaccional: en PostgreSQL usa CREATE/DROP INDEX CONCURRENTLY para no
+bloquear escrituras sobre la tabla mientras se construyen.
+"""
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+from app.adapters.db.migrations import create_index, drop_index
+
+VERSION = "0002"
+DESCRIPTION = "partial indexes on active brands"
+TRANSACTIONAL = False
+
+ACTIVE = "deleted_at IS NULL"
+
+INDEXES = (
+    # (nombre, columnas, predicado, único)
+    ("idx_brands_active_created_id", "created_at, id", ACTIVE, False),
+    ("idx_brands_active_owner", "owner", ACTIVE, False),
+    ("idx_brands_active_lang", "lang", ACTIVE, False),
+    ("idx_brands_active_status", "status", ACTIVE, False),
+    ("idx_brands_deleted_at", "deleted_at", "deleted_at IS NOT NULL", False),
+)
+
+REDUNDANT_INDEXES = (
+    "ix_brands_id",
+    "ix_brands_name",
+    "ix_brands_owner",
+    "ix_brands_lang",
+    "ix_brands_status",
+    "ix_brands_deleted_at",
+    "idx_brands_name",
+    "idx_brands_owner",
+    "idx_brands_status",
+)
+
+def _has_unique_name(conn: Connection) -> bool:
+    """Las tablas creadas con create_all() no tenían la restricción UNIQUE de name"""
+    inspector = inspect(conn)
+    constraints = inspector.get_unique_constraints("brands") + [
+        index for index in inspector.get_indexes("brands") if index["unique"]
+    ]
+    return any(constraint["column_names"] == ["name"] for constraint in constraints)
+
+def upgrade(conn: Connection) -> None:
+    if not _has_unique_name(conn):
+        create_index(conn, "brands_name_key", "brands", "name", unique=True)
+    # Crear primero los nuevos para que las consultas nunca se queden sin índice
+    for name, columns, where, unique in INDEXES:
+        create_index(conn, name, "brands", columns, where=where, unique=unique)
+    for name in REDUNDANT_INDEXES:
+        drop_index(conn, name)
@@ -0,0 +1,27 @@
+"""
+Índices para la búsqueda difusa por nombre y propietario
+PostgreSQL: extensión pg_trgm e índices GIN gin_trgm_ops parciales sobre
+marcas activas (CREATE INDEX CONCURRENTLY). SQLite: tabla FTS5 con
+tokenizador trigram y triggers de sincronización.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.adapters.db.migrations import create_index
+from app.adapters.db.search import SQLITE_FTS_DDL
+
+VERSION = "0003"
+DESCRIPTION = "trigram search indexes"
+TRANSACTIONAL = False
+
+ACTIVE = "deleted_at IS NULL"
+
+def upgrade(conn: Connection) -> None:
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        create_index(conn, "idx_brands_name_trgm", "brands", "name gin_trgm_ops", where=ACTIVE, using="gin")
+        create_index(conn, "idx_brands_owner_trgm", "brands", "owner gin_trgm_ops", where=ACTIVE, using="gin")
+    elif conn.dialect.name == "sqlite":
+        for statement in SQLITE_FTS_DDL:
+            conn.execute(text(statement))
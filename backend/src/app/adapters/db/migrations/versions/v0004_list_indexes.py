@@ -0,0 +1,37 @@
+"""
+Índices compuestos para los filtros y órdenes del listado
+Cubren las combinaciones habituales sobre marcas activas: filtro de igualdad
+(status, lang u owner) seguido de la clave keyset (created_at, id), y las
+claves de orden alternativas (updated_at, id) y (name, id). Los índices de una
+sola columna de 0002 quedan cubiertos por el prefijo de los compuestos.
+"""
+
+from sqlalchemy.engine import Connection
+
+from app.adapters.db.migrations import create_index, drop_index
+
+VERSION = "0004"
+DESCRIPTION = "composite indexes for list filters and sorting"
+TRANSACTIONAL = False
+
+ACTIVE = "deleted_at IS NULL"
+
+INDEXES = (
+    ("idx_brands_active_status_created", "status, created_at, id"),
+    ("idx_brands_active_lang_created", "lang, created_at, id"),
+    ("idx_brands_active_owner_created", "owner, created_at, id"),
+    ("idx_brands_active_updated_id", "updated_at, id"),
+    ("idx_brands_active_name_id", "name, id"),
+)
+
+SUPERSEDED_INDEXES = (
+    "idx_brands_active_owner",
+    "idx_brands_active_lang",
+    "idx_brands_active_status",
+)
+
+def upgrade(conn: Connection) -> None:
+    for name, columns in INDEXES:
+        create_index(conn, name, "brands", columns, where=ACTIVE)
+    for name in SUPERSEDED_INDEXES:
+        drop_index(conn, name)
@@ -0,0 +1,17 @@
+"""
+Índice para el feed de cambios
+El feed recorre todas las marcas (activas y eliminadas) en orden
+(updated_at, id) a partir de un cursor; los índices parciales de activas no
+sirven porque excluyen las lápidas (deleted_at IS NOT NULL).
+"""
+
+from sqlalchemy.engine import Connection
+
+from app.adapters.db.migrations import create_index
+
+VERSION = "0005"
+DESCRIPTION = "index on (updated_at, id) for the change feed"
+TRANSACTIONAL = False
+
+def upgrade(conn: Connection) -> None:
+    create_index(conn, "idx_brands_updated_id", "brands", "updated_at, id")
@@ -1,25 +1,85 @@
-from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy import Column, String, DateTime, Text, Index, UniqueConstraint, DDL, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.adapters.db.session import Base
+from app.adapters.db.search import SQLITE_FTS_DDL, SQLITE_FTS_DROP
 import uuid
 
 class BrandModel(Base):
     __tablename__ = "brands"
+    # Refleja el esquema de las migraciones (app/adapters/db/migrations);
+    # los índices parciales cubren solo marcas activas (deleted_at IS NULL);
+    # idx_brands_updated_id incluye las eliminadas para el feed de cambios.
+    # Los índices GIN de trigramas de PostgreSQL solo los crea la migración 0003
+    __table_args__ = (
+        UniqueConstraint("name", name="brands_name_key"),
+        Index(
+            "idx_brands_active_created_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_brands_active_status_created",
+            "status",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_brands_active_lang_created",
+            "lang",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_brands_active_owner_created",
+            "owner",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_brands_active_updated_id",
+            "updated_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_brands_active_name_id",
+            "name",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index("idx_brands_updated_id", "updated_at", "id"),
+        Index(
+            "idx_brands_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     # Identificador único usando UUID
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Campos de negocio
-    name = Column(String(255), nullable=False, index=True)
-    owner = Column(String(255), nullable=False, index=True)
-    lang = Column(String(10), nullable=False, index=True)  # ISO 639-1 language codes
-    status = Column(String(50), default="Pendiente", index=True)
+    name = Column(String(255), nullable=False)
+    owner = Column(String(255), nullable=False)
+    lang = Column(String(10), nullable=False)  # ISO 639-1 language codes
+    status = Column(String(50), default="Pendiente")
     
     # Campos de auditoría y trazabilidad
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
     
     def __repr__(self):
         return f"<BrandModel(id={self.id}, name='{self.name}', owner='{self.owner}', lang='{self.lang}')>"
@@ -27,7 +87,7 @@ class BrandModel(Base):
     def to_domain_entity(self):
         """Convertir el modelo SQLAlchemy a entidad de dominio"""
         from app.domain.entities.brand import Brand
-        return Brand(
+        return Brand.from_row(
             id=self.id,
             name=self.name,
             owner=self.owner,
@@ -51,3 +111,8 @@ class BrandModel(Base):
             updated_at=brand.updated_at,
             deleted_at=brand.deleted_at
         )
+
+# En SQLite, create_all()/drop_all() también gestionan la tabla FTS5 de búsqueda
+for _statement in SQLITE_FTS_DDL:
+    event.listen(BrandModel.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(BrandModel.__table__, "before_drop", DDL(SQLITE_FTS_DROP).execute_if(dialect="sqlite"))
@@ -0,0 +1,140 @@
+"""
+Configuración e instrumentación del pool de conexiones
+Permite dimensionar el pool desde Settings y expone estadísticas en vivo
+(conexiones en uso, overflow, esperas y latencia de checkout).
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+from app.core.metrics import DB_POOL_CHECKOUT_SECONDS, DB_POOL_TIMEOUTS
+
+# Límites superiores (ms) de los buckets del histograma de latencia de checkout
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+class PoolMetrics:
+    """Contadores e histograma de checkouts del pool (seguro entre threads)"""
+
+    def __init__(self, buckets_ms=CHECKOUT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reiniciar todas las métricas"""
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            # Un bucket extra para valores por encima del último límite (+Inf)
+            self.bucket_counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+
+    def observe_checkout(self, wait_ms: float) -> None:
+        """Registrar un checkout y su tiempo de espera"""
+        index = bisect.bisect_left(self.buckets_ms, wait_ms)
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            if wait_ms > self.wait_max_ms:
+                self.wait_max_ms = wait_ms
+            self.bucket_counts[index] += 1
+        DB_POOL_CHECKOUT_SECONDS.observe(wait_ms / 1000)
+
+    def observe_timeout(self) -> None:
+        """Registrar un checkout que agotó pool_timeout"""
+        with self._lock:
+            self.timeouts += 1
+        DB_POOL_TIMEOUTS.inc()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copia consistente de las métricas"""
+        with self._lock:
+            histogram = {}
+            cumulative = 0
+            for bound, count in zip(list(self.buckets_ms) + ["+Inf"], self.bucket_counts, strict=False):
+                cumulative += count
+                histogram[str(bound)] = cumulative
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total_ms, 3),
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "checkout_latency_ms_histogram": histogram,
+            }
+
+def instrumented_queue_pool(metrics: PoolMetrics) -> type:
+    """
+    Crear una subclase de QueuePool que mide la latencia de cada checkout
+
+    La métrica va en un atributo de clase para que sobreviva a pool.recreate()
+    (engine.dispose() crea el nuevo pool con la misma clase).
+    """
+
+    class InstrumentedQueuePool(QueuePool):
+        pool_metrics = metrics
+
+        def connect(self):
+            start = time.perf_counter()
+            try:
+                connection = super().connect()
+            except exc.TimeoutError:
+                self.pool_metrics.observe_timeout()
+                raise
+            self.pool_metrics.observe_checkout((time.perf_counter() - start) * 1000)
+            return connection
+
+    return InstrumentedQueuePool
+
+def pool_options(database_url: str, settings, metrics: Optional[PoolMetrics] = None) -> Dict[str, Any]:
+    """
+    Argumentos de create_engine para el pool según Settings
+
+    SQLite conserva el pool por defecto de SQLAlchemy (no admite tamaño ni overflow útiles).
+    """
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if metrics is not None:
+        options["poolclass"] = instrumented_queue_pool(metrics)
+    return options
+
+def warm_up_pool(engine: Engine, connections: int) -> int:
+    """Abrir `connections` conexiones al arrancar y devolverlas al pool"""
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.raw_connection())
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+def pool_status(engine: Engine, metrics: Optional[PoolMetrics] = None) -> Dict[str, Any]:
+    """Estado actual del pool más las métricas acumuladas"""
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "timeout": pool.timeout(),
+        })
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
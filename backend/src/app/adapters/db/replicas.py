@@ -0,0 +1,178 @@
+"""
+Enrutado de lecturas a réplicas
+Las lecturas (listados, búsquedas y obtención por ID) se envían a una réplica
+elegida por turno rotatorio o por menor latencia observada; las escrituras van
+siempre al primario. Tras una escritura, las lecturas del mismo cliente se
+sirven desde el primario durante una ventana configurable (read-your-writes),
+para que no vea datos anteriores a su propio cambio por el retraso de réplica.
+La marca de la escritura viaja con el cliente (cookie o cabecera), no en el
+proceso, para que funcione con varios workers y detrás de un proxy.
+"""
+
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+
+STRATEGIES = ("round_robin", "least_latency")
+
+class _Replica:
+    """Engine de una réplica, su fábrica de sesiones y su latencia media (EWMA)"""
+
+    __slots__ = ("engine", "session_factory", "latency_ms", "queries")
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+        self.latency_ms: Optional[float] = None
+        self.queries = 0
+
+class ReplicaRouter:
+    """
+    Selección de réplica para lecturas y ventana read-your-writes por cliente
+
+    Args:
+        engines: engines de las réplicas (vacío: todo va al primario)
+        strategy: "round_robin" o "least_latency"
+        read_your_writes_seconds: tiempo tras una escritura en que el cliente lee del primario
+        latency_alpha: peso de la última medida en la media móvil de latencia
+    """
+
+    def __init__(
+        self,
+        engines: List[Engine],
+        strategy: str = "round_robin",
+        read_your_writes_seconds: float = 5.0,
+        latency_alpha: float = 0.2,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Invalid replica strategy: {strategy}")
+        self.strategy = strategy
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.latency_alpha = latency_alpha
+        self._replicas = [_Replica(engine) for engine in engines]
+        self._by_engine = {id(replica.engine): replica for replica in self._replicas}
+        self._turns = itertools.cycle(range(len(self._replicas))) if self._replicas else None
+        self._lock = threading.Lock()
+        for replica in self._replicas:
+            event.listen(replica.engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(replica.engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @property
+    def enabled(self) -> bool:
+        """Hay al menos una réplica configurada"""
+        return bool(self._replicas)
+
+    @property
+    def engines(self) -> List[Engine]:
+        """Engines de las réplicas"""
+        return [replica.engine for replica in self._replicas]
+
+    def write_token(self) -> Optional[str]:
+        """
+        Marca de tiempo de una escritura para devolver al cliente, o None si no
+        hay ventana read-your-writes (sin réplicas o con la ventana a 0)
+        """
+        if not self.enabled or self.read_your_writes_seconds <= 0:
+            return None
+        return f"{time.time():.3f}"
+
+    def recently_wrote(self, token: Optional[str]) -> bool:
+        """La marca del cliente cae dentro de la ventana read-your-writes"""
+        if not token:
+            return False
+        try:
+            written_at = float(token)
+        except ValueError:
+            return False
+        # Se admite un pequeño desfase entre relojes de workers; una marca
+        # más lejana en el futuro se ignora para no fijar al cliente al primario
+        return abs(time.time() - written_at) < self.read_your_writes_seconds
+
+    def choose(self) -> Engine:
+        """Elegir la réplica para la siguiente lectura según la estrategia"""
+        if not self.enabled:
+            raise ValueError("No read replicas configured")
+        with self._lock:
+            if self.strategy == "least_latency":
+                # Las réplicas sin medidas se prueban primero
+                replica = min(
+                    self._replicas,
+                    key=lambda r: -1.0 if r.latency_ms is None else r.latency_ms,
+                )
+            else:
+                replica = self._replicas[next(self._turns)]
+        return replica.engine
+
+    def session(self, write_token: Optional[str] = None) -> Optional[Session]:
+        """
+        Sesión de lectura en una réplica, o None si las lecturas deben ir al primario
+        (sin réplicas o con una escritura reciente del cliente)
+        """
+        if not self.enabled or self.recently_wrote(write_token):
+            return None
+        return self._by_engine[id(self.choose())].session_factory()
+
+    def observe(self, engine: Engine, duration_ms: float) -> None:
+        """Actualizar la latencia media de la réplica"""
+        replica = self._by_engine.get(id(engine))
+        if replica is None:
+            return
+        with self._lock:
+            replica.queries += 1
+            if replica.latency_ms is None:
+                replica.latency_ms = duration_ms
+            else:
+                replica.latency_ms += self.latency_alpha * (duration_ms - replica.latency_ms)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("replica_query_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("replica_query_start")
+        if starts:
+            self.observe(conn.engine, (time.perf_counter() - starts.pop()) * 1000)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Estado de las réplicas (URL sin contraseña, latencia media y lecturas servidas)"""
+        with self._lock:
+            return [
+                {
+                    "url": replica.engine.url.render_as_string(hide_password=True),
+                    "latency_ms": round(replica.latency_ms, 3) if replica.latency_ms is not None else None,
+                    "queries": replica.queries,
+                }
+                for replica in self._replicas
+            ]
+
+    def dispose(self) -> None:
+        """Cerrar los pools de las réplicas"""
+        for replica in self._replicas:
+            replica.engine.dispose()
+
+def parse_replica_urls(value: str) -> List[str]:
+    """Lista de URLs de réplica separadas por comas"""
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+def create_replica_router(settings, engine_options=None) -> ReplicaRouter:
+    """
+    Crear el router con un engine por cada URL de DATABASE_REPLICA_URLS
+
+    Args:
+        engine_options: función url -> kwargs de create_engine (pool, etc.)
+    """
+    engines = []
+    for url in parse_replica_urls(settings.DATABASE_REPLICA_URLS):
+        options = engine_options(url) if engine_options else {}
+        if make_url(url).get_backend_name() == "sqlite":
+            options.setdefault("connect_args", {"check_same_thread": False})
+        engines.append(create_engine(url, **options))
+    return ReplicaRouter(
+        engines,
+        strategy=settings.DB_REPLICA_STRATEGY,
+        read_your_writes_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+    )
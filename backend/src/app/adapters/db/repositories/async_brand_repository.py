@@ -0,0 +1,261 @@
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.db.models.brand_model import BrandModel
+from app.adapters.db.repositories.brand_repository import (
+    UPDATABLE_FIELDS,
+    _collection_version_statement,
+    _insert_values,
+    _list_statement,
+    _row_to_entity,
+    _version_statement,
+    brands_table,
+)
+from app.core.logger import (
+    log_entity_created,
+    log_entity_deleted,
+    log_entity_not_found,
+    log_entity_updated,
+    log_operation_error,
+    log_operation_start,
+    log_operation_success,
+)
+from app.core.tracing import traced_operations
+from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
+from app.domain.ports.async_brand_port import AsyncBrandPort
+
+@traced_operations
+class AsyncBrandRepository(AsyncBrandPort):
+    """Repositorio de marcas sobre AsyncSession (asyncpg / aiosqlite)"""
+
+    def __init__(self, db: AsyncSession = None):
+        self.db = db
+
+    def _require_session(self, operation: str, brand_id: Optional[UUID] = None) -> None:
+        """Verificar que hay una sesión asignada"""
+        if not self.db:
+            log_operation_error(operation, "Brand", str(brand_id) if brand_id else None, error="Database session not provided")
+            raise ValueError("Database session not provided")
+
+    async def _get_active_model(self, brand_id: UUID) -> Optional[BrandModel]:
+        """Obtener el modelo de una marca activa"""
+        result = await self.db.execute(
+            select(BrandModel).where(BrandModel.id == brand_id, BrandModel.deleted_at.is_(None))
+        )
+        return result.scalars().first()
+
+    async def get_all(self, filters: Optional[BrandFilter] = None, sort: Optional[BrandSort] = None) -> List[Brand]:
+        """Obtener todas las marcas activas (no eliminadas) filtradas y ordenadas en SQL"""
+        log_operation_start("get_all", "Brand")
+        self._require_session("get_all")
+
+        try:
+            result = await self.db.execute(_list_statement(filters, sort))
+            domain_brands = [_row_to_entity(row) for row in result]
+
+            log_operation_success("get_all", "Brand", extra={"count": len(domain_brands)})
+            return domain_brands
+
+        except Exception as e:
+            log_operation_error("get_all", "Brand", error=str(e))
+            raise
+
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[Any, UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+    ) -> List[Brand]:
+        """Obtener una página de marcas activas usando búsqueda por índice (keyset, sin OFFSET)"""
+        log_operation_start("get_page", "Brand")
+        self._require_session("get_page")
+
+        try:
+            result = await self.db.execute(_list_statement(filters, sort, limit, after))
+            domain_brands = [_row_to_entity(row) for row in result]
+
+            log_operation_success("get_page", "Brand", extra={"count": len(domain_brands)})
+            return domain_brands
+
+        except Exception as e:
+            log_operation_error("get_page", "Brand", error=str(e))
+            raise
+
+    async def get_by_id(self, brand_id: UUID) -> Optional[Brand]:
+        """Obtener una marca por ID (solo activas)"""
+        log_operation_start("get_by_id", "Brand", str(brand_id))
+        self._require_session("get_by_id", brand_id)
+
+        try:
+            brand = await self._get_active_model(brand_id)
+            if brand:
+                log_operation_success("get_by_id", "Brand", str(brand_id))
+                return brand.to_domain_entity()
+            log_entity_not_found("Brand", str(brand_id))
+            return None
+
+        except Exception as e:
+            log_operation_error("get_by_id", "Brand", str(brand_id), error=str(e))
+            raise
+
+    async def get_version(self, brand_id: UUID) -> Optional[datetime]:
+        """updated_at de una marca activa, para respuestas condicionales"""
+        log_operation_start("get_version", "Brand", str(brand_id))
+        self._require_session("get_version", brand_id)
+
+        try:
+            version = await self.db.scalar(_version_statement(brand_id))
+            log_operation_success("get_version", "Brand", str(brand_id))
+            return version
+
+        except Exception as e:
+            log_operation_error("get_version", "Brand", str(brand_id), error=str(e))
+            raise
+
+    async def get_collection_version(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Versión de la colección de marcas, para respuestas condicionales del listado"""
+        log_operation_start("get_collection_version", "Brand")
+        self._require_session("get_collection_version")
+
+        try:
+            result = await self.db.execute(_collection_version_statement())
+            last_updated, last_deleted = result.one()
+            log_operation_success("get_collection_version", "Brand")
+            return last_updated, last_deleted
+
+        except Exception as e:
+            log_operation_error("get_collection_version", "Brand", error=str(e))
+            raise
+
+    async def create(self, brand: Brand) -> Brand:
+        """Crear una nueva marca"""
+        log_operation_start("create", "Brand")
+        self._require_session("create")
+
+        try:
+            # INSERT ... RETURNING: una sola ida y vuelta, sin SELECT de refresco
+            result = await self.db.execute(
+                brands_table.insert().values(**_insert_values(brand)).returning(*brands_table.c)
+            )
+            created_brand = _row_to_entity(result.one())
+            await self.db.commit()
+
+            log_entity_created("Brand", str(created_brand.id))
+            log_operation_success("create", "Brand", str(created_brand.id))
+            return created_brand
+
+        except Exception as e:
+            log_operation_error("create", "Brand", error=str(e))
+            await self.db.rollback()
+            raise
+
+    async def update(self, brand_id: UUID, brand: Brand) -> Brand:
+        """Actualizar una marca existente"""
+        log_operation_start("update", "Brand", str(brand_id))
+        self._require_session("update", brand_id)
+
+        try:
+            # Actualizar solo los campos proporcionados
+            changes = {
+                field: getattr(brand, field)
+                for field in UPDATABLE_FIELDS
+                if getattr(brand, field) is not None
+            }
+            changes["updated_at"] = datetime.utcnow()
+
+            # UPDATE ... RETURNING: si no devuelve fila, la marca no existe (sin SELECT previo)
+            result = await self.db.execute(
+                brands_table.update()
+                .where(brands_table.c.id == brand_id, brands_table.c.deleted_at.is_(None))
+                .values(**changes)
+                .returning(*brands_table.c)
+            )
+            row = result.first()
+            if row is None:
+                log_entity_not_found("Brand", str(brand_id))
+                log_operation_error("update", "Brand", str(brand_id), error="Brand not found")
+                raise ValueError(f"Brand with id {brand_id} not found")
+
+            await self.db.commit()
+            updated_brand = _row_to_entity(row)
+
+            log_entity_updated("Brand", str(brand_id))
+            log_operation_success("update", "Brand", str(brand_id))
+            return updated_brand
+
+        except ValueError:
+            # "No encontrada" ya se registró en la rama que lanza el error
+            await self.db.rollback()
+            raise
+        except Exception as e:
+            log_operation_error("update", "Brand", str(brand_id), error=str(e))
+            await self.db.rollback()
+            raise
+
+    async def delete(self, brand_id: UUID) -> None:
+        """Eliminar una marca (soft delete)"""
+        log_operation_start("delete", "Brand", str(brand_id))
+        self._require_session("delete", brand_id)
+
+        try:
+            # Soft delete en una sola sentencia: UPDATE ... RETURNING id
+            now = datetime.utcnow()
+            result = await self.db.execute(
+                brands_table.update()
+                .where(brands_table.c.id == brand_id, brands_table.c.deleted_at.is_(None))
+                .values(deleted_at=now, updated_at=now)
+                .returning(brands_table.c.id)
+            )
+            if result.first() is None:
+                log_entity_not_found("Brand", str(brand_id))
+                log_operation_error("delete", "Brand", str(brand_id), error="Brand not found")
+                raise ValueError(f"Brand with id {brand_id} not found")
+
+            await self.db.commit()
+
+            log_entity_deleted("Brand", str(brand_id))
+            log_operation_success("delete", "Brand", str(brand_id))
+
+        except ValueError:
+            # "No encontrada" ya se registró en la rama que lanza el error
+            await self.db.rollback()
+            raise
+        except Exception as e:
+            log_operation_error("delete", "Brand", str(brand_id), error=str(e))
+            await self.db.rollback()
+            raise
+
+    async def hard_delete(self, brand_id: UUID) -> None:
+        """Eliminación física de una marca (solo para casos especiales)"""
+        log_operation_start("hard_delete", "Brand", str(brand_id))
+        self._require_session("hard_delete", brand_id)
+
+        try:
+            # Eliminación física en una sola sentencia: DELETE ... RETURNING id
+            result = await self.db.execute(
+                brands_table.delete().where(brands_table.c.id == brand_id).returning(brands_table.c.id)
+            )
+            if result.first() is None:
+                log_entity_not_found("Brand", str(brand_id))
+                log_operation_error("hard_delete", "Brand", str(brand_id), error="Brand not found")
+                raise ValueError(f"Brand with id {brand_id} not found")
+
+            await self.db.commit()
+
+            log_operation_success("hard_delete", "Brand", str(brand_id))
+
+        except ValueError:
+            # "No encontrada" ya se registró en la rama que lanza el error
+            await self.db.rollback()
+            raise
+        except Exception as e:
+            log_operation_error("hard_delete", "Brand", str(brand_id), error=str(e))
+            await self.db.rollback()
+            raise
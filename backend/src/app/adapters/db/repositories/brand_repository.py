@@ -1,21 +1,149 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import func, insert, literal, or_, select, text, tuple_, update
 from sqlalchemy.orm import Session
 from app.domain.ports.brand_port import BrandPort
 from app.domain.entities.brand import Brand
+from app.domain.entities.brand_columns import check_fields
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
 from app.adapters.db.models.brand_model import BrandModel
+from app.adapters.db.search import fts_match_expression, word_similarity
 from app.core.logger import (
     log_operation_start, log_operation_success, log_operation_error,
     log_entity_created, log_entity_updated, log_entity_deleted, log_entity_not_found
 )
-from uuid import UUID
+from app.core.tracing import traced_operations
+from uuid import UUID, uuid4
 from datetime import datetime
 
+# Tabla subyacente para las lecturas con Core y las escrituras con RETURNING
+# (sin instancias ORM ni identity map); sus columnas siguen el orden de Brand.from_row
+brands_table = BrandModel.__table__
+
+# Candidatos preseleccionados por FTS5 (SQLite) por cada resultado pedido
+SEARCH_CANDIDATES_PER_RESULT = 10
+
+# Campos de negocio que se pueden modificar (individual o masivamente)
+UPDATABLE_FIELDS = ("name", "owner", "lang", "status")
+
+def _insert_values(brand: Brand) -> Dict[str, Any]:
+    """Valores de INSERT para una entidad de dominio"""
+    return {
+        "id": brand.id or uuid4(),
+        "name": brand.name,
+        "owner": brand.owner,
+        "lang": brand.lang,
+        "status": brand.status,
+        "created_at": brand.created_at,
+        "updated_at": brand.updated_at,
+    }
+
+def _row_to_entity(row) -> Brand:
+    """Construir la entidad de dominio desde una fila con todas las columnas de brands_table"""
+    return Brand.from_row(*row)
+
+def _columns(fields: Sequence[str]) -> list:
+    """Columnas de brands_table para los campos pedidos"""
+    return [brands_table.c[name] for name in check_fields(fields)]
+
+def _filter_clauses(filters: Optional[BrandFilter]) -> list:
+    """Traducir un BrandFilter a condiciones SQL (siempre sobre marcas activas)"""
+    clauses = [BrandModel.deleted_at.is_(None)]
+    if filters is None:
+        return clauses
+    if filters.status is not None:
+        clauses.append(BrandModel.status == filters.status)
+    if filters.lang is not None:
+        clauses.append(BrandModel.lang == filters.lang)
+    if filters.owner is not None:
+        clauses.append(BrandModel.owner == filters.owner)
+    if filters.created_from is not None:
+        clauses.append(BrandModel.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        clauses.append(BrandModel.created_at < filters.created_to)
+    if filters.updated_from is not None:
+        clauses.append(BrandModel.updated_at >= filters.updated_from)
+    if filters.updated_to is not None:
+        clauses.append(BrandModel.updated_at < filters.updated_to)
+    return clauses
+
+def _version_statement(brand_id: UUID):
+    """updated_at de una marca activa (búsqueda por clave primaria, sin la fila completa)"""
+    return select(BrandModel.updated_at).where(BrandModel.id == brand_id, BrandModel.deleted_at.is_(None))
+
+def _collection_version_statement():
+    """
+    (MAX(updated_at) de activas, MAX(deleted_at)) como dos subconsultas que
+    resuelven los índices parciales idx_brands_active_updated_id e
+    idx_brands_deleted_at sin recorrer la tabla. Las eliminaciones físicas no
+    dejan rastro: no cambian la versión hasta la siguiente escritura
+    """
+    last_updated = (
+        select(func.max(BrandModel.updated_at)).where(BrandModel.deleted_at.is_(None)).scalar_subquery()
+    )
+    last_deleted = (
+        select(func.max(BrandModel.deleted_at)).where(BrandModel.deleted_at.is_not(None)).scalar_subquery()
+    )
+    return select(last_updated, last_deleted)
+
+def _list_statement(
+    filters: Optional[BrandFilter] = None,
+    sort: Optional[BrandSort] = None,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[Any, UUID]] = None,
+    columns: Optional[list] = None,
+):
+    """
+    SELECT del listado: filtros, orden (campo, id) y clave keyset en SQL
+
+    El orden y los filtros de igualdad coinciden con los índices parciales
+    compuestos de marcas activas (p. ej. status, created_at, id). Devuelve
+    filas de Core con `columns` (por defecto todas las de brands_table).
+    """
+    sort = sort or BrandSort()
+    column = brands_table.c[sort.field]
+    stmt = select(*(columns or brands_table.c)).where(*_filter_clauses(filters))
+    if after is not None:
+        key = tuple_(column, BrandModel.id)
+        stmt = stmt.where(key < tuple_(*after) if sort.descending else key > tuple_(*after))
+    if sort.descending:
+        stmt = stmt.order_by(column.desc(), BrandModel.id.desc())
+    else:
+        stmt = stmt.order_by(column, BrandModel.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+def _changes_statement(
+    limit: int,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    until: Optional[datetime] = None,
+):
+    """
+    SELECT del feed de cambios: todas las marcas, incluidas las eliminadas,
+    en orden (updated_at, id) sobre idx_brands_updated_id
+    """
+    stmt = select(brands_table)
+    if after is not None:
+        stmt = stmt.where(tuple_(BrandModel.updated_at, BrandModel.id) > tuple_(*after))
+    if until is not None:
+        stmt = stmt.where(BrandModel.updated_at < until)
+    return stmt.order_by(BrandModel.updated_at, BrandModel.id).limit(limit)
+
+@traced_operations
 class BrandRepository(BrandPort):
-    def __init__(self, db: Session = None):
+    def __init__(self, db: Session = None, read_db: Session = None):
         self.db = db
+        # Sesión opcional en una réplica para las lecturas (get_all, get_page, search, get_by_id)
+        self.read_db = read_db
+
+    @property
+    def _reader(self) -> Session:
+        """Sesión para lecturas: la réplica si se asignó, si no el primario"""
+        return self.read_db or self.db
 
-    def get_all(self) -> List[Brand]:
-        """Obtener todas las marcas activas (no eliminadas)"""
+    def get_all(self, filters: Optional[BrandFilter] = None, sort: Optional[BrandSort] = None) -> List[Brand]:
+        """Obtener todas las marcas activas (no eliminadas) filtradas y ordenadas en SQL"""
         log_operation_start("get_all", "Brand")
         
         if not self.db:
@@ -24,8 +152,8 @@ class BrandRepository(BrandPort):
         
         try:
             # Solo obtener marcas activas (no eliminadas)
-            brands = self.db.query(BrandModel).filter(BrandModel.deleted_at.is_(None)).all()
-            domain_brands = [brand.to_domain_entity() for brand in brands]
+            rows = self._reader.execute(_list_statement(filters, sort))
+            domain_brands = [_row_to_entity(row) for row in rows]
             
             log_operation_success("get_all", "Brand", extra={"count": len(domain_brands)})
             return domain_brands
@@ -34,6 +162,209 @@ class BrandRepository(BrandPort):
             log_operation_error("get_all", "Brand", error=str(e))
             raise
 
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[Any, UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+    ) -> List[Brand]:
+        """Obtener una página de marcas activas usando búsqueda por índice (keyset, sin OFFSET)"""
+        log_operation_start("get_page", "Brand")
+        
+        if not self.db:
+            log_operation_error("get_page", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        try:
+            rows = self._reader.execute(_list_statement(filters, sort, limit, after))
+            domain_brands = [_row_to_entity(row) for row in rows]
+            
+            log_operation_success("get_page", "Brand", extra={"count": len(domain_brands)})
+            return domain_brands
+            
+        except Exception as e:
+            log_operation_error("get_page", "Brand", error=str(e))
+            raise
+
+    def get_changes(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Brand]:
+        """Obtener marcas creadas, actualizadas o eliminadas después de la clave `after`"""
+        log_operation_start("get_changes", "Brand")
+        
+        if not self.db:
+            log_operation_error("get_changes", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        try:
+            rows = self._reader.execute(_changes_statement(limit, after, until))
+            domain_brands = [_row_to_entity(row) for row in rows]
+            
+            log_operation_success("get_changes", "Brand", extra={"count": len(domain_brands)})
+            return domain_brands
+            
+        except Exception as e:
+            log_operation_error("get_changes", "Brand", error=str(e))
+            raise
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Brand]:
+        """Recorrer las marcas activas en lotes (cursor del lado del servidor en PostgreSQL)"""
+        log_operation_start("iter_all", "Brand")
+        
+        if not self.db:
+            log_operation_error("iter_all", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        try:
+            count = 0
+            for row in self._stream_rows(brands_table.c, batch_size):
+                count += 1
+                yield _row_to_entity(row)
+            
+            log_operation_success("iter_all", "Brand", extra={"count": count})
+            
+        except Exception as e:
+            log_operation_error("iter_all", "Brand", error=str(e))
+            raise
+
+    def get_rows(
+        self,
+        fields: Sequence[str],
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple]:
+        """Obtener los `fields` de las marcas activas como tuplas (Core, sin ORM ni entidades)"""
+        log_operation_start("get_rows", "Brand")
+        
+        if not self.db:
+            log_operation_error("get_rows", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        try:
+            result = self._reader.execute(_list_statement(filters, sort, limit, columns=_columns(fields)))
+            rows = [tuple(row) for row in result]
+            
+            log_operation_success("get_rows", "Brand", extra={"count": len(rows)})
+            return rows
+            
+        except Exception as e:
+            log_operation_error("get_rows", "Brand", error=str(e))
+            raise
+
+    def iter_rows(self, fields: Sequence[str], batch_size: int = 1000) -> Iterator[Tuple]:
+        """Recorrer los `fields` de las marcas activas como tuplas, en lotes de batch_size"""
+        log_operation_start("iter_rows", "Brand")
+        
+        if not self.db:
+            log_operation_error("iter_rows", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        try:
+            count = 0
+            for row in self._stream_rows(_columns(fields), batch_size):
+                count += 1
+                yield tuple(row)
+            
+            log_operation_success("iter_rows", "Brand", extra={"count": count})
+            
+        except Exception as e:
+            log_operation_error("iter_rows", "Brand", error=str(e))
+            raise
+
+    def _stream_rows(self, columns, batch_size: int):
+        """Filas de las marcas activas en orden (created_at, id) llegando por lotes"""
+        # yield_per activa stream_results: las filas llegan por lotes de batch_size
+        stmt = (
+            select(*columns)
+            .where(BrandModel.deleted_at.is_(None))
+            .order_by(BrandModel.created_at, BrandModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        return self.db.execute(stmt)
+
+    def search(self, query: str, limit: int, min_similarity: float) -> List[Brand]:
+        """Búsqueda difusa por nombre/propietario (pg_trgm en PostgreSQL, FTS5 en SQLite)"""
+        log_operation_start("search", "Brand")
+        
+        if not self.db:
+            log_operation_error("search", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        try:
+            dialect = self._reader.get_bind().dialect.name
+            if dialect == "postgresql":
+                domain_brands = self._search_trigram(query, limit, min_similarity)
+            else:
+                match = fts_match_expression(query) if dialect == "sqlite" else ""
+                candidates = self._search_fts(match, limit) if match else self._search_like(query, limit)
+                domain_brands = self._rank(query, candidates, limit, min_similarity)
+            
+            log_operation_success("search", "Brand", extra={"count": len(domain_brands)})
+            return domain_brands
+            
+        except Exception as e:
+            log_operation_error("search", "Brand", error=str(e))
+            raise
+
+    def _search_trigram(self, query: str, limit: int, min_similarity: float) -> List[Brand]:
+        """PostgreSQL: el operador <% usa los índices GIN gin_trgm_ops de name y owner"""
+        # Umbral del operador <% solo para esta transacción
+        self._reader.execute(select(func.set_config("pg_trgm.word_similarity_threshold", str(min_similarity), True)))
+        score = func.greatest(
+            func.word_similarity(query, BrandModel.name),
+            func.word_similarity(query, BrandModel.owner),
+        )
+        stmt = (
+            select(BrandModel)
+            .where(
+                BrandModel.deleted_at.is_(None),
+                or_(literal(query).bool_op("<%")(BrandModel.name), literal(query).bool_op("<%")(BrandModel.owner)),
+            )
+            .order_by(score.desc(), BrandModel.name)
+            .limit(limit)
+        )
+        return [brand.to_domain_entity() for brand in self._reader.scalars(stmt)]
+
+    def _search_fts(self, match: str, limit: int) -> List[Brand]:
+        """SQLite: preseleccionar candidatos con la tabla FTS5 de trigramas, ordenados por bm25"""
+        # Columnas explícitas: el orden físico de la tabla depende de las migraciones
+        stmt = text(
+            f"SELECT {', '.join('brands.' + name for name in brands_table.c.keys())} FROM brands_fts JOIN brands ON brands.rowid = brands_fts.rowid "
+            "WHERE brands_fts MATCH :match AND brands.deleted_at IS NULL "
+            "ORDER BY bm25(brands_fts) LIMIT :candidates"
+        ).columns(*brands_table.c)
+        result = self._reader.execute(stmt, {"match": match, "candidates": limit * SEARCH_CANDIDATES_PER_RESULT})
+        return [_row_to_entity(row) for row in result]
+
+    def _search_like(self, query: str, limit: int) -> List[Brand]:
+        """Consultas demasiado cortas para trigramas (u otros motores): coincidencia por subcadena"""
+        pattern = "%{}%".format(query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_"))
+        stmt = (
+            select(BrandModel)
+            .where(
+                BrandModel.deleted_at.is_(None),
+                or_(BrandModel.name.ilike(pattern, escape="\\"), BrandModel.owner.ilike(pattern, escape="\\")),
+            )
+            .limit(limit * SEARCH_CANDIDATES_PER_RESULT)
+        )
+        return [brand.to_domain_entity() for brand in self._reader.scalars(stmt)]
+
+    @staticmethod
+    def _rank(query: str, candidates: List[Brand], limit: int, min_similarity: float) -> List[Brand]:
+        """Ordenar candidatos por similitud (como word_similarity de pg_trgm) y aplicar el umbral"""
+        scored = [
+            (max(word_similarity(query, brand.name), word_similarity(query, brand.owner)), brand)
+            for brand in candidates
+        ]
+        scored = [item for item in scored if item[0] >= min_similarity]
+        scored.sort(key=lambda item: (-item[0], item[1].name))
+        return [brand for _, brand in scored[:limit]]
+
     def get_by_id(self, brand_id: UUID) -> Optional[Brand]:
         """Obtener una marca por ID (solo activas)"""
         log_operation_start("get_by_id", "Brand", str(brand_id))
@@ -44,7 +375,7 @@ class BrandRepository(BrandPort):
         
         try:
             # Solo obtener marcas activas
-            brand = self.db.query(BrandModel).filter(
+            brand = self._reader.query(BrandModel).filter(
                 BrandModel.id == brand_id,
                 BrandModel.deleted_at.is_(None)
             ).first()
@@ -61,6 +392,40 @@ class BrandRepository(BrandPort):
             log_operation_error("get_by_id", "Brand", str(brand_id), error=str(e))
             raise
 
+    def get_version(self, brand_id: UUID) -> Optional[datetime]:
+        """updated_at de una marca activa, para respuestas condicionales"""
+        log_operation_start("get_version", "Brand", str(brand_id))
+        
+        if not self.db:
+            log_operation_error("get_version", "Brand", str(brand_id), error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        try:
+            version = self._reader.scalar(_version_statement(brand_id))
+            log_operation_success("get_version", "Brand", str(brand_id))
+            return version
+            
+        except Exception as e:
+            log_operation_error("get_version", "Brand", str(brand_id), error=str(e))
+            raise
+
+    def get_collection_version(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Versión de la colección de marcas, para respuestas condicionales del listado"""
+        log_operation_start("get_collection_version", "Brand")
+        
+        if not self.db:
+            log_operation_error("get_collection_version", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        try:
+            last_updated, last_deleted = self._reader.execute(_collection_version_statement()).one()
+            log_operation_success("get_collection_version", "Brand")
+            return last_updated, last_deleted
+            
+        except Exception as e:
+            log_operation_error("get_collection_version", "Brand", error=str(e))
+            raise
+
     def create(self, brand: Brand) -> Brand:
         """Crear una nueva marca"""
         log_operation_start("create", "Brand")
@@ -70,15 +435,13 @@ class BrandRepository(BrandPort):
             raise ValueError("Database session not provided")
         
         try:
-            # Crear modelo SQLAlchemy desde entidad de dominio
-            db_brand = BrandModel.from_domain_entity(brand)
-            
-            self.db.add(db_brand)
+            # INSERT ... RETURNING: una sola ida y vuelta, sin SELECT de refresco
+            row = self.db.execute(
+                brands_table.insert().values(**_insert_values(brand)).returning(*brands_table.c)
+            ).one()
             self.db.commit()
-            self.db.refresh(db_brand)
             
-            # Convertir de vuelta a entidad de dominio
-            created_brand = db_brand.to_domain_entity()
+            created_brand = _row_to_entity(row)
             
             log_entity_created("Brand", str(created_brand.id))
             log_operation_success("create", "Brand", str(created_brand.id))
@@ -90,6 +453,31 @@ class BrandRepository(BrandPort):
             self.db.rollback()
             raise
 
+    def create_many(self, brands: List[Brand]) -> int:
+        """Crear varias marcas con un INSERT multi-fila dentro de una única transacción"""
+        log_operation_start("create_many", "Brand")
+        
+        if not self.db:
+            log_operation_error("create_many", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        if not brands:
+            return 0
+        
+        try:
+            rows = [_insert_values(brand) for brand in brands]
+            # executemany con "insertmanyvalues": se agrupa en INSERT ... VALUES (...), (...)
+            self.db.execute(insert(BrandModel), rows)
+            self.db.commit()
+            
+            log_operation_success("create_many", "Brand", extra={"count": len(rows)})
+            return len(rows)
+            
+        except Exception as e:
+            log_operation_error("create_many", "Brand", error=str(e))
+            self.db.rollback()
+            raise
+
     def update(self, brand_id: UUID, brand: Brand) -> Brand:
         """Actualizar una marca existente"""
         log_operation_start("update", "Brand", str(brand_id))
@@ -99,45 +487,148 @@ class BrandRepository(BrandPort):
             raise ValueError("Database session not provided")
         
         try:
-            # Obtener marca existente
-            db_brand = self.db.query(BrandModel).filter(
-                BrandModel.id == brand_id,
-                BrandModel.deleted_at.is_(None)
+            # Actualizar solo los campos proporcionados
+            changes = {
+                field: getattr(brand, field)
+                for field in UPDATABLE_FIELDS
+                if getattr(brand, field) is not None
+            }
+            changes["updated_at"] = datetime.utcnow()
+            
+            # UPDATE ... RETURNING: si no devuelve fila, la marca no existe (sin SELECT previo)
+            row = self.db.execute(
+                brands_table.update()
+                .where(brands_table.c.id == brand_id, brands_table.c.deleted_at.is_(None))
+                .values(**changes)
+                .returning(*brands_table.c)
             ).first()
             
-            if not db_brand:
+            if row is None:
                 log_entity_not_found("Brand", str(brand_id))
                 log_operation_error("update", "Brand", str(brand_id), error="Brand not found")
                 raise ValueError(f"Brand with id {brand_id} not found")
             
-            # Actualizar solo los campos proporcionados
-            if brand.name is not None:
-                db_brand.name = brand.name
-            if brand.owner is not None:
-                db_brand.owner = brand.owner
-            if brand.lang is not None:
-                db_brand.lang = brand.lang
-            if brand.status is not None:
-                db_brand.status = brand.status
-            
-            # Actualizar timestamp
-            db_brand.updated_at = datetime.utcnow()
-            
             self.db.commit()
-            self.db.refresh(db_brand)
-            
-            updated_brand = db_brand.to_domain_entity()
+            updated_brand = _row_to_entity(row)
             
             log_entity_updated("Brand", str(brand_id))
             log_operation_success("update", "Brand", str(brand_id))
             
             return updated_brand
             
+        except ValueError:
+            # "No encontrada" ya se registró en la rama que lanza el error
+            self.db.rollback()
+            raise
         except Exception as e:
             log_operation_error("update", "Brand", str(brand_id), error=str(e))
             self.db.rollback()
             raise
 
+    def bulk_update(
+        self,
+        changes: Dict[str, Any],
+        ids: Optional[List[UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        """Actualización masiva con UPDATE por lotes, una transacción por lote"""
+        log_operation_start("bulk_update", "Brand")
+        
+        if not self.db:
+            log_operation_error("bulk_update", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        unknown = set(changes) - set(UPDATABLE_FIELDS)
+        if unknown:
+            log_operation_error("bulk_update", "Brand", error="Invalid bulk update fields")
+            raise ValueError(f"Fields cannot be bulk updated: {', '.join(sorted(unknown))}")
+        
+        try:
+            affected = self._update_in_chunks(changes, ids, filters, chunk_size, stamped=("updated_at",))
+            log_operation_success("bulk_update", "Brand", extra={"count": affected})
+            return affected
+            
+        except Exception as e:
+            log_operation_error("bulk_update", "Brand", error=str(e))
+            self.db.rollback()
+            raise
+
+    def bulk_delete(
+        self,
+        ids: Optional[List[UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        """Soft delete masivo con UPDATE por lotes, una transacción por lote"""
+        log_operation_start("bulk_delete", "Brand")
+        
+        if not self.db:
+            log_operation_error("bulk_delete", "Brand", error="Database session not provided")
+            raise ValueError("Database session not provided")
+        
+        try:
+            affected = self._update_in_chunks({}, ids, filters, chunk_size, stamped=("deleted_at", "updated_at"))
+            log_operation_success("bulk_delete", "Brand", extra={"count": affected})
+            return affected
+            
+        except Exception as e:
+            log_operation_error("bulk_delete", "Brand", error=str(e))
+            self.db.rollback()
+            raise
+
+    def _update_in_chunks(
+        self,
+        values: Dict[str, Any],
+        ids: Optional[List[UUID]],
+        filters: Optional[BrandFilter],
+        chunk_size: int,
+        stamped: Sequence[str] = (),
+    ) -> int:
+        """
+        Ejecutar UPDATE ... WHERE id IN (...) por lotes de chunk_size
+
+        Con lista de IDs se trocea la lista; con filtro se recorren los IDs que
+        cumplen el filtro por orden de id (keyset), de modo que cada lote es una
+        transacción corta y acotada. Los campos de `stamped` reciben la hora de
+        cada lote: un lote confirmado tarde no queda con una marca anterior a
+        los cursores que el feed de cambios ya ha entregado.
+        """
+        clauses = _filter_clauses(filters)
+        affected = 0
+        
+        if ids is not None:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                affected += self._update_chunk(values, clauses, chunk, stamped)
+            return affected
+        
+        last_id = None
+        while True:
+            stmt = select(BrandModel.id).where(*clauses).order_by(BrandModel.id).limit(chunk_size)
+            if last_id is not None:
+                stmt = stmt.where(BrandModel.id > last_id)
+            chunk = list(self.db.scalars(stmt))
+            if not chunk:
+                return affected
+            affected += self._update_chunk(values, clauses, chunk, stamped)
+            last_id = chunk[-1]
+
+    def _update_chunk(
+        self, values: Dict[str, Any], clauses: list, chunk: List[UUID], stamped: Sequence[str] = ()
+    ) -> int:
+        """Actualizar un lote de IDs, sellado con la hora actual, y confirmar la transacción"""
+        now = datetime.utcnow()
+        stmt = (
+            update(BrandModel)
+            .where(BrandModel.id.in_(chunk), *clauses)
+            .values(**values, **{field: now for field in stamped})
+            .execution_options(synchronize_session=False)
+        )
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount
+
     def delete(self, brand_id: UUID) -> None:
         """Eliminar una marca (soft delete)"""
         log_operation_start("delete", "Brand", str(brand_id))
@@ -147,26 +638,29 @@ class BrandRepository(BrandPort):
             raise ValueError("Database session not provided")
         
         try:
-            # Obtener marca existente
-            db_brand = self.db.query(BrandModel).filter(
-                BrandModel.id == brand_id,
-                BrandModel.deleted_at.is_(None)
+            # Soft delete en una sola sentencia: UPDATE ... RETURNING id
+            now = datetime.utcnow()
+            row = self.db.execute(
+                brands_table.update()
+                .where(brands_table.c.id == brand_id, brands_table.c.deleted_at.is_(None))
+                .values(deleted_at=now, updated_at=now)
+                .returning(brands_table.c.id)
             ).first()
             
-            if not db_brand:
+            if row is None:
                 log_entity_not_found("Brand", str(brand_id))
                 log_operation_error("delete", "Brand", str(brand_id), error="Brand not found")
                 raise ValueError(f"Brand with id {brand_id} not found")
             
-            # Soft delete - marcar como eliminada
-            db_brand.deleted_at = datetime.utcnow()
-            db_brand.updated_at = datetime.utcnow()
-            
             self.db.commit()
             
             log_entity_deleted("Brand", str(brand_id))
             log_operation_success("delete", "Brand", str(brand_id))
             
+        except ValueError:
+            # "No encontrada" ya se registró en la rama que lanza el error
+            self.db.rollback()
+            raise
         except Exception as e:
             log_operation_error("delete", "Brand", str(brand_id), error=str(e))
             self.db.rollback()
@@ -181,19 +675,24 @@ class BrandRepository(BrandPort):
             raise ValueError("Database session not provided")
         
         try:
-            db_brand = self.db.query(BrandModel).filter(BrandModel.id == brand_id).first()
+            # Eliminación física en una sola sentencia: DELETE ... RETURNING id
+            row = self.db.execute(
+                brands_table.delete().where(brands_table.c.id == brand_id).returning(brands_table.c.id)
+            ).first()
             
-            if not db_brand:
+            if row is None:
                 log_entity_not_found("Brand", str(brand_id))
                 log_operation_error("hard_delete", "Brand", str(brand_id), error="Brand not found")
                 raise ValueError(f"Brand with id {brand_id} not found")
             
-            # Eliminación física
-            self.db.delete(db_brand)
             self.db.commit()
             
             log_operation_success("hard_delete", "Brand", str(brand_id))
             
+        except ValueError:
+            # "No encontrada" ya se registró en la rama que lanza el error
+            self.db.rollback()
+            raise
         except Exception as e:
             log_operation_error("hard_delete", "Brand", str(brand_id), error=str(e))
             self.db.rollback()
@@ -0,0 +1,68 @@
+"""
+Búsqueda difusa de marcas por nombre y propietario
+PostgreSQL usa pg_trgm (índices GIN gin_trgm_ops y el operador <%). SQLite
+usa una tabla virtual FTS5 con tokenizador trigram, sincronizada con brands
+mediante triggers, para preseleccionar candidatos; la similitud final se
+calcula aquí con la misma definición de trigramas que pg_trgm.
+"""
+
+import re
+from typing import List, Set
+
+# Objetos FTS5 de SQLite (tabla externa sobre brands + triggers de sincronización)
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS brands_fts USING fts5("
+    "name, owner, content='brands', content_rowid='rowid', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS brands_fts_ai AFTER INSERT ON brands BEGIN "
+    "INSERT INTO brands_fts(rowid, name, owner) VALUES (new.rowid, new.name, new.owner); END",
+    "CREATE TRIGGER IF NOT EXISTS brands_fts_ad AFTER DELETE ON brands BEGIN "
+    "INSERT INTO brands_fts(brands_fts, rowid, name, owner) VALUES ('delete', old.rowid, old.name, old.owner); END",
+    "CREATE TRIGGER IF NOT EXISTS brands_fts_au AFTER UPDATE OF name, owner ON brands BEGIN "
+    "INSERT INTO brands_fts(brands_fts, rowid, name, owner) VALUES ('delete', old.rowid, old.name, old.owner); "
+    "INSERT INTO brands_fts(rowid, name, owner) VALUES (new.rowid, new.name, new.owner); END",
+    "INSERT INTO brands_fts(brands_fts) VALUES ('rebuild')",
+)
+
+SQLITE_FTS_DROP = "DROP TABLE IF EXISTS brands_fts"
+
+# Máximo de trigramas de la consulta usados en la expresión MATCH de FTS5
+MAX_QUERY_TRIGRAMS = 32
+
+_WORD = re.compile(r"\w+")
+
+def trigrams(value: str) -> Set[str]:
+    """Trigramas de un texto al estilo pg_trgm (palabras en minúsculas con relleno '  w ')"""
+    result = set()
+    for word in _WORD.findall(value.lower()):
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+def similarity(a: str, b: str) -> float:
+    """Similitud de trigramas (equivalente a similarity() de pg_trgm)"""
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    return len(ta & tb) / len(ta | tb)
+
+def word_similarity(query: str, value: str) -> float:
+    """
+    Parte de los trigramas de la consulta presentes en el texto
+
+    Aproxima word_similarity() de pg_trgm: premia que la consulta aparezca como
+    fragmento del texto aunque este sea más largo o tenga errores menores.
+    """
+    tq = trigrams(query)
+    if not tq:
+        return 0.0
+    return len(tq & trigrams(value)) / len(tq)
+
+def fts_match_expression(query: str) -> str:
+    """Expresión MATCH de FTS5: OR de los trigramas de la consulta (bm25 premia los que más coinciden)"""
+    text = " ".join(_WORD.findall(query.lower()))
+    grams: List[str] = []
+    for i in range(len(text) - 2):
+        gram = text[i:i + 3]
+        if gram not in grams:
+            grams.append(gram)
+    return " OR ".join('"{}"'.format(gram.replace('"', '""')) for gram in grams[:MAX_QUERY_TRIGRAMS])
@@ -1,10 +1,38 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config import settings
+from app.adapters.db.pool import PoolMetrics, pool_options
+from app.adapters.db.sql_instrumentation import SqlInstrumentation, track_statements
+from app.adapters.db.replicas import create_replica_router
 
-engine = create_engine(settings.DATABASE_URL, echo=True)
+# Métricas en vivo del pool del engine principal
+pool_metrics = PoolMetrics()
+
+# Log de sentencias lentas/muestreadas y agregados por huella
+sql_instrumentation = SqlInstrumentation(
+    slow_threshold_ms=settings.SQL_SLOW_QUERY_MS,
+    sample_rate=settings.SQL_SAMPLE_RATE,
+)
+
+# Métricas de sentencias SQL y sentencias por petición para el registro JSON de cada petición
+track_statements()
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    echo=settings.SQL_ECHO,
+    **pool_options(settings.DATABASE_URL, settings, pool_metrics)
+)
+sql_instrumentation.attach(engine)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
+# Réplicas de lectura (DATABASE_REPLICA_URLS); sin réplicas todo va al primario
+replica_router = create_replica_router(
+    settings,
+    lambda url: {"echo": settings.SQL_ECHO, **pool_options(url, settings)},
+)
+for replica_engine in replica_router.engines:
+    sql_instrumentation.attach(replica_engine)
+
 # Función para crear engine de test
 def create_test_engine(database_url: str = "sqlite:///:memory:"):
     """Crear un engine de SQLite en memoria para tests"""
@@ -16,6 +44,10 @@ def create_test_engine(database_url: str = "sqlite:///:memory:"):
 
 Base = declarative_base()
 
+def get_session_factory():
+    """Fábrica de sesiones para operaciones que gestionan su propia sesión (p. ej. streaming)"""
+    return SessionLocal
+
 def get_db():
     db = SessionLocal()
     try:
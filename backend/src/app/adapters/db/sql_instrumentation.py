@@ -0,0 +1,221 @@
+"""
+Instrumentación de SQL basada en eventos del engine
+Sustituye a echo=True: solo se registran las sentencias lentas (por encima de
+un umbral) o una muestra aleatoria, siempre con los parámetros ocultos, y se
+mantienen agregados por huella de sentencia (conteo, tiempo total y p95).
+"""
+
+import random
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.logger import get_logger_with_uuid
+from app.core.metrics import DB_STATEMENT_SECONDS
+from app.core.request_context import current_request
+from app.core.tracing import KIND_CLIENT, current_span, tracer
+
+# Normalización de sentencias para agruparlas por huella
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|:\w+|\$\d+|%s)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+|\$\d+|%s))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+def fingerprint(statement: str) -> str:
+    """Huella de una sentencia: literales y listas de parámetros colapsados"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """Ocultar los valores de los parámetros conservando su forma"""
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return {key: "***" for key in parameters}
+    if isinstance(parameters, (list, tuple)):
+        return ["***"] * len(parameters)
+    return "***" if parameters else parameters
+
+class _StatementStats:
+    """Agregados de una huella: conteo, tiempo total, máximo y ventana para percentiles"""
+
+    __slots__ = ("count", "total_ms", "max_ms", "recent")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        self.recent.append(duration_ms)
+
+    def percentile(self, q: float) -> float:
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+# Tipos de sentencia con serie propia en db_statement_duration_seconds (el resto: OTHER)
+_STATEMENT_TYPES = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+def statement_type(statement: str) -> str:
+    """Primera palabra de la sentencia si es un tipo conocido (SELECT, ..., WITH), si no OTHER"""
+    head = statement.lstrip()[:6].upper()
+    if head.startswith("WITH"):
+        return "WITH"
+    return head if head in _STATEMENT_TYPES else "OTHER"
+
+def _statement_span(conn, statement: str):
+    """Span de la sentencia si hay una traza muestreada en curso (no pasa a ser el span actual)"""
+    parent = current_span()
+    if not tracer.enabled or parent is None or not parent.recording:
+        return None
+    return tracer.start_span(f"SQL {statement_type(statement)}", kind=KIND_CLIENT, parent=parent, attributes={
+        "db.system": conn.dialect.name,
+        "db.query.text": statement,
+    })
+
+def _track_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("tracked_statement_start", []).append((time.perf_counter(), _statement_span(conn, statement)))
+
+def _track_after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("tracked_statement_start")
+    if not starts:
+        return
+    start, span = starts.pop()
+    duration = time.perf_counter() - start
+    if span is not None:
+        span.end()
+    DB_STATEMENT_SECONDS.observe(duration, (statement_type(statement),))
+    request = current_request.get()
+    if request is not None:
+        request.note_statement(duration * 1000)
+
+def _track_handle_error(exception_context):
+    # after_cursor_execute no se llama si la sentencia falla
+    conn = exception_context.connection
+    starts = conn.info.get("tracked_statement_start") if conn is not None else None
+    if starts:
+        _, span = starts.pop()
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.end()
+
+def track_statements() -> None:
+    """
+    Medir todas las sentencias SQL del proceso (incluidos los engines de test):
+    histograma por tipo de sentencia, un span por sentencia dentro de una traza
+    muestreada y, dentro de una petición, número y duración en su RequestContext
+    """
+    if not event.contains(Engine, "after_cursor_execute", _track_after_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _track_before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _track_after_cursor_execute)
+        event.listen(Engine, "handle_error", _track_handle_error)
+
+class SqlInstrumentation:
+    """
+    Registro de sentencias lentas/muestreadas y agregados por huella
+
+    Args:
+        slow_threshold_ms: sentencias con duración >= umbral se registran siempre
+        sample_rate: probabilidad (0-1) de registrar una sentencia rápida
+        max_fingerprints: huellas distintas a conservar; el resto se agrupa en "<other>"
+        window: número de duraciones recientes por huella usadas para el p95
+    """
+
+    OTHER = "<other>"
+
+    def __init__(
+        self,
+        slow_threshold_ms: float = 200.0,
+        sample_rate: float = 0.0,
+        max_fingerprints: int = 500,
+        window: int = 512,
+        logger_name: str = "app_logger",
+    ):
+        self.slow_threshold_ms = slow_threshold_ms
+        self.sample_rate = sample_rate
+        self.max_fingerprints = max_fingerprints
+        self.window = window
+        self.logger = get_logger_with_uuid(None, logger_name)
+        self._stats: Dict[str, _StatementStats] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, engine: Engine) -> None:
+        """Registrar los listeners en el engine (síncrono o sync_engine de uno asíncrono)"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def detach(self, engine: Engine) -> None:
+        """Quitar los listeners del engine"""
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start_time")
+        if not starts:
+            return
+        duration_ms = (time.perf_counter() - starts.pop()) * 1000
+        self.record(statement, duration_ms, parameters, executemany)
+
+    def record(self, statement: str, duration_ms: float, parameters: Any = None, executemany: bool = False) -> None:
+        """Acumular la duración de una sentencia y registrarla si es lenta o sale en la muestra"""
+        statement_fingerprint = key = fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    key = self.OTHER
+                    stats = self._stats.get(key)
+                if stats is None:
+                    stats = self._stats[key] = _StatementStats(self.window)
+            stats.observe(duration_ms)
+
+        if duration_ms >= self.slow_threshold_ms:
+            self.logger.warning(
+                "Slow query (%.1f ms): %s params=%s",
+                duration_ms, statement_fingerprint, redact_parameters(parameters, executemany),
+            )
+        elif self.sample_rate > 0 and random.random() < self.sample_rate:
+            self.logger.info(
+                "Sampled query (%.1f ms): %s params=%s",
+                duration_ms, statement_fingerprint, redact_parameters(parameters, executemany),
+            )
+
+    def dump(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Agregados por huella ordenados por tiempo total descendente"""
+        with self._lock:
+            rows = [
+                {
+                    "fingerprint": key,
+                    "count": stats.count,
+                    "total_ms": round(stats.total_ms, 3),
+                    "mean_ms": round(stats.total_ms / stats.count, 3),
+                    "p95_ms": round(stats.percentile(0.95), 3),
+                    "max_ms": round(stats.max_ms, 3),
+                }
+                for key, stats in self._stats.items()
+            ]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def reset(self) -> None:
+        """Descartar los agregados acumulados"""
+        with self._lock:
+            self._stats.clear()
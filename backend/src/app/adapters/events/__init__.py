@@ -0,0 +1 @@
+# Adaptadores de eventos (stream SSE de cambios)
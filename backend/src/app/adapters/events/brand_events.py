@@ -0,0 +1,194 @@
+"""
+Publicación de eventos de marcas para el stream SSE
+En SQLite (o con BRAND_EVENTS_BACKEND=memory) los eventos se reparten solo
+dentro del worker. En PostgreSQL se envían con NOTIFY desde un thread y cada
+worker los recibe con LISTEN en una conexión dedicada, de modo que todos los
+suscriptores ven las escrituras de cualquier proceso.
+"""
+
+import json
+import queue
+import select
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.adapters.db.session import engine
+from app.adapters.events.broadcaster import EventBroadcaster
+from app.config import settings
+from app.core.logger import get_logger_with_uuid
+from app.domain.entities.brand_event import BrandEvent
+from app.domain.ports.brand_event_port import BrandEventPort
+
+# Campos de la marca incluidos en el evento
+EVENT_BRAND_FIELDS = ("id", "name", "owner", "lang", "status", "updated_at", "deleted_at")
+
+# NOTIFY admite cargas de hasta 8000 bytes
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+def serialize_event(event: BrandEvent) -> str:
+    """JSON compacto del evento en una línea (válido como campo data de SSE)"""
+    payload = {"type": event.type}
+    if event.brand_id is not None:
+        payload["id"] = str(event.brand_id)
+    if event.brand is not None:
+        payload["brand"] = {field: getattr(event.brand, field) for field in EVENT_BRAND_FIELDS}
+    if event.count is not None:
+        payload["count"] = event.count
+    return json.dumps(payload, default=str, ensure_ascii=False, separators=(",", ":"))
+
+class InProcessBrandEvents(BrandEventPort):
+    """Eventos repartidos solo a los suscriptores de este worker"""
+
+    def __init__(self, broadcaster: EventBroadcaster):
+        self.broadcaster = broadcaster
+
+    def publish(self, event: BrandEvent) -> None:
+        self.broadcaster.publish(event.type, serialize_event(event))
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+class PgNotifyBrandEvents(BrandEventPort):
+    """
+    Eventos entre procesos con LISTEN/NOTIFY de PostgreSQL
+
+    publish() solo encola: un thread envía los NOTIFY en lotes con una
+    conexión del pool, y otro mantiene una conexión dedicada con LISTEN que
+    entrega al broadcaster local lo publicado por cualquier worker (incluido
+    este). Si la base de datos no responde, los eventos se descartan: los
+    clientes pueden reconciliarse con GET /brands/changes.
+
+    Args:
+        engine: engine de PostgreSQL (psycopg2)
+        broadcaster: destino local de los eventos recibidos
+        channel: canal de NOTIFY
+        max_pending: eventos en espera de envío antes de descartar
+        reconnect_seconds: espera antes de reconectar el LISTEN
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        engine: Engine,
+        broadcaster: EventBroadcaster,
+        channel: str = "brand_events",
+        max_pending: int = 10000,
+        reconnect_seconds: float = 1.0,
+    ):
+        self.engine = engine
+        self.broadcaster = broadcaster
+        self.channel = channel
+        self.reconnect_seconds = reconnect_seconds
+        self.logger = get_logger_with_uuid(None)
+        self._outbox: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._stopping = threading.Event()
+        self._threads = []
+
+    def publish(self, event: BrandEvent) -> None:
+        payload = serialize_event(event)
+        if len(payload.encode("utf-8")) > MAX_NOTIFY_PAYLOAD_BYTES:
+            payload = serialize_event(BrandEvent(type=event.type, brand_id=event.brand_id, count=event.count))
+        try:
+            self._outbox.put_nowait(payload)
+        except queue.Full:
+            self.logger.warning("Brand event outbox full, dropping %s event", event.type)
+
+    def start(self) -> None:
+        """Arrancar los threads de envío (NOTIFY) y de escucha (LISTEN)"""
+        if self._threads:
+            return
+        self._stopping.clear()
+        for target, name in ((self._send, "brand-events-notify"), (self._listen, "brand-events-listen")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Detener los threads"""
+        self._stopping.set()
+        try:
+            self._outbox.put_nowait(self._STOP)
+        except queue.Full:
+            pass
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+    def _send(self) -> None:
+        while not self._stopping.is_set():
+            payload = self._outbox.get()
+            if payload is self._STOP:
+                return
+            batch = [payload]
+            while len(batch) < 100:
+                try:
+                    payload = self._outbox.get_nowait()
+                except queue.Empty:
+                    break
+                if payload is self._STOP:
+                    self._stopping.set()
+                    break
+                batch.append(payload)
+            try:
+                with self.engine.begin() as conn:
+                    for payload in batch:
+                        conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": payload})
+            except Exception as e:
+                self.logger.warning("Could not NOTIFY %s brand events: %s", len(batch), e)
+
+    def _listen(self) -> None:
+        while not self._stopping.is_set():
+            connection = None
+            try:
+                # Conexión dedicada fuera del pool: LISTEN la ocupa de forma permanente
+                cargs, cparams = self.engine.dialect.create_connect_args(self.engine.url)
+                connection = self.engine.dialect.dbapi.connect(*cargs, **cparams)
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+                while not self._stopping.is_set():
+                    if select.select([connection], [], [], 1.0) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        notify = connection.notifies.pop(0)
+                        self._deliver(notify.payload)
+            except Exception as e:
+                self.logger.warning("Brand events listener disconnected, retrying in %ss: %s", self.reconnect_seconds, e)
+                self._stopping.wait(self.reconnect_seconds)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+    def _deliver(self, payload: str) -> None:
+        try:
+            event_type = json.loads(payload)["type"]
+        except (ValueError, KeyError, TypeError):
+            self.logger.warning("Ignoring malformed brand event notification")
+            return
+        self.broadcaster.publish(event_type, payload)
+
+def create_brand_events(settings, engine: Engine, broadcaster: EventBroadcaster):
+    """
+    Elegir el backend de eventos: BRAND_EVENTS_BACKEND=auto usa LISTEN/NOTIFY
+    en PostgreSQL y el reparto en proceso en el resto de bases de datos
+    """
+    backend = settings.BRAND_EVENTS_BACKEND
+    if backend == "auto":
+        backend = "pg_notify" if engine.dialect.name == "postgresql" else "memory"
+    if backend == "pg_notify":
+        return PgNotifyBrandEvents(engine, broadcaster, channel=settings.BRAND_EVENTS_CHANNEL)
+    return InProcessBrandEvents(broadcaster)
+
+# Suscriptores SSE y publicador de eventos del proceso
+brand_broadcaster = EventBroadcaster(buffer_size=settings.SSE_CLIENT_BUFFER, max_subscribers=settings.SSE_MAX_SUBSCRIBERS)
+brand_events = create_brand_events(settings, engine, brand_broadcaster)
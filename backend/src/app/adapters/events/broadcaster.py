@@ -0,0 +1,189 @@
+"""
+Difusión en proceso de eventos Server-Sent Events
+Cada suscriptor tiene una cola acotada en el event loop; los eventos se
+formatean una sola vez y se reparten con put_nowait. Un suscriptor cuya cola
+está llena (consumidor lento) se expulsa en lugar de bloquear o acumular
+memoria sin límite. publish() se puede llamar desde cualquier thread.
+"""
+
+import asyncio
+import threading
+from typing import AsyncIterator, Dict, Optional, Set
+
+from app.core.logger import get_logger_with_uuid
+
+# Reintento sugerido al cliente EventSource tras una desconexión
+RETRY_MILLISECONDS = 3000
+
+HEARTBEAT_FRAME = ": ping\n\n"
+EVICTED_FRAME = "event: evicted\ndata: {}\n\n"
+
+class TooManySubscribers(Exception):
+    """Se alcanzó el máximo de suscriptores del worker"""
+
+def format_event(event_type: str, data: str) -> str:
+    """Trama SSE de un evento (data en una sola línea)"""
+    return f"event: {event_type}\ndata: {data}\n\n"
+
+class Subscription:
+    """Cola acotada de un suscriptor"""
+
+    __slots__ = ("queue", "evicted")
+
+    def __init__(self, buffer_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.evicted = False
+
+class EventBroadcaster:
+    """
+    Reparto de eventos a los suscriptores SSE de un worker
+
+    Args:
+        buffer_size: eventos pendientes por suscriptor antes de expulsarlo
+        max_subscribers: suscriptores simultáneos admitidos
+    """
+
+    def __init__(self, buffer_size: int = 100, max_subscribers: int = 10000):
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self.logger = get_logger_with_uuid(None)
+        self._subscribers: Set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._published = 0
+        self._delivered = 0
+        self._evicted = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def full(self) -> bool:
+        return len(self._subscribers) >= self.max_subscribers
+
+    # Operaciones del event loop
+
+    def subscribe(self) -> Subscription:
+        """
+        Registrar un suscriptor (desde el event loop); la comprobación del límite
+        y el registro son atómicos
+
+        Raises:
+            TooManySubscribers: si se alcanzó max_subscribers
+        """
+        loop = asyncio.get_running_loop()
+        subscription = Subscription(self.buffer_size)
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                raise TooManySubscribers(f"Subscriber limit reached ({self.max_subscribers})")
+            self._loop = loop
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    async def stream(
+        self,
+        heartbeat_seconds: float = 15.0,
+        max_seconds: Optional[float] = None,
+        subscription: Optional[Subscription] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Producir las tramas SSE: eventos, comentarios de heartbeat mientras está
+        inactivo y un evento final "evicted" si se le expulsa. Con max_seconds la
+        conexión se cierra y el cliente se reconecta. Sin `subscription` se
+        suscribe al iterarlo; con ella (obtenida de subscribe() antes de
+        responder, para poder rechazar la petición) la da de baja al terminar
+
+        Raises:
+            TooManySubscribers: si se alcanzó max_subscribers
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_seconds if max_seconds else None
+        if subscription is None:
+            subscription = self.subscribe()
+        try:
+            yield f"retry: {RETRY_MILLISECONDS}\n\n"
+            while not subscription.evicted:
+                timeout = heartbeat_seconds
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        return
+                    timeout = min(timeout, remaining)
+                try:
+                    frame = await asyncio.wait_for(subscription.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT_FRAME
+                    continue
+                if frame is None or subscription.evicted:
+                    break
+                yield frame
+            if subscription.evicted:
+                yield EVICTED_FRAME
+        finally:
+            self.unsubscribe(subscription)
+
+    def _dispatch(self, frame: str) -> None:
+        delivered = 0
+        for subscription in list(self._subscribers):
+            try:
+                subscription.queue.put_nowait(frame)
+                delivered += 1
+            except asyncio.QueueFull:
+                self._evict(subscription)
+        with self._lock:
+            self._delivered += delivered
+
+    def _evict(self, subscription: Subscription) -> None:
+        subscription.evicted = True
+        self._subscribers.discard(subscription)
+        with self._lock:
+            self._evicted += 1
+        self.logger.warning("Evicted slow SSE subscriber (%s events pending)", subscription.queue.qsize())
+
+    def _close_all(self) -> None:
+        for subscription in list(self._subscribers):
+            self._subscribers.discard(subscription)
+            try:
+                # None cierra el stream después de los eventos pendientes
+                subscription.queue.put_nowait(None)
+            except asyncio.QueueFull:
+                subscription.evicted = True
+
+    # Operaciones desde cualquier thread
+
+    def publish(self, event_type: str, data: str) -> None:
+        """Encolar un evento para todos los suscriptores del worker"""
+        with self._lock:
+            self._published += 1
+        loop = self._loop
+        if not self._subscribers or loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._dispatch, format_event(event_type, data))
+        except RuntimeError:
+            # Event loop cerrado (parada del worker)
+            pass
+
+    def close(self) -> None:
+        """Cerrar todos los streams (parada del worker)"""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._close_all)
+        except RuntimeError:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "published": self._published,
+                "delivered": self._delivered,
+                "evicted": self._evicted,
+            }
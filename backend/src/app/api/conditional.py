@@ -0,0 +1,94 @@
+"""
+Peticiones condicionales (ETag / Last-Modified)
+Ante If-None-Match / If-Modified-Since las rutas consultan primero una versión
+barata del recurso (updated_at de la marca o los máximos de la colección) y
+responden 304 sin cargar ni serializar el cuerpo cuando coincide. Sin esas
+cabeceras, la marca se carga directamente (desde la caché si está) y los
+validadores salen de su updated_at.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+from uuid import UUID
+
+from fastapi import Request, Response
+
+# Las respuestas dependen de la API key: solo cachés privadas y siempre revalidando
+CACHE_CONTROL = "private, no-cache"
+
+def _as_utc(value: datetime) -> datetime:
+    """Los timestamps de la base de datos son naive en UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def _digest(*parts: object) -> str:
+    return hashlib.blake2b("|".join(str(part) for part in parts).encode("utf-8"), digest_size=12).hexdigest()
+
+def entity_etag(brand_id: UUID, updated_at: Optional[datetime]) -> str:
+    """ETag fuerte de una marca: cambia con cada escritura (updated_at)"""
+    version = _as_utc(updated_at).isoformat() if updated_at else ""
+    return f'"{_digest(brand_id, version)}"'
+
+def collection_etag(versions: Iterable[Optional[datetime]], query: str = "") -> str:
+    """ETag fuerte de un listado: versión de la colección más los parámetros de la consulta"""
+    parts = [_as_utc(version).isoformat() if version else "" for version in versions]
+    return f'"{_digest(*parts, query)}"'
+
+def last_modified(*versions: Optional[datetime]) -> Optional[datetime]:
+    """La versión más reciente de las indicadas (None si no hay ninguna)"""
+    present = [_as_utc(version) for version in versions if version]
+    return max(present) if present else None
+
+def http_date(value: datetime) -> str:
+    """Fecha en formato IMF-fixdate (RFC 9110)"""
+    return format_datetime(_as_utc(value).replace(microsecond=0), usegmt=True)
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Comparación débil de If-None-Match: ignora el prefijo W/ y admite listas y *"""
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+def is_conditional(request: Request) -> bool:
+    """La petición trae If-None-Match o If-Modified-Since"""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+def is_not_modified(request: Request, etag: str, modified: Optional[datetime] = None) -> bool:
+    """
+    Decidir si procede un 304
+    If-None-Match tiene prioridad; If-Modified-Since solo se evalúa sin él y
+    con precisión de segundos, como la cabecera Last-Modified
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since is None or since.tzinfo is None:
+        return False
+    return _as_utc(modified).replace(microsecond=0) <= since
+
+def validator_headers(etag: str, modified: Optional[datetime] = None) -> dict:
+    """Cabeceras de validación comunes a las respuestas 200 y 304"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if modified is not None:
+        headers["Last-Modified"] = http_date(modified)
+    return headers
+
+def not_modified(etag: str, modified: Optional[datetime] = None) -> Response:
+    """Respuesta 304 sin cuerpo"""
+    return Response(status_code=304, headers=validator_headers(etag, modified))
+
+def canonical_query(request: Request) -> str:
+    """Parámetros de la consulta en orden canónico (el orden en la URL no cambia el ETag)"""
+    return "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
@@ -1,14 +1,123 @@
-from fastapi import Depends
+import math
+from datetime import datetime
+from typing import Literal, Optional
+from fastapi import Depends, Query, Request, Response
 from sqlalchemy.orm import Session
-from app.adapters.db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.adapters.db.session import get_db, replica_router
+from app.adapters.db.async_session import get_async_db
 from app.adapters.db.repositories.brand_repository import BrandRepository
+from app.adapters.db.repositories.async_brand_repository import AsyncBrandRepository
+from app.adapters.cache.async_invalidating_brand_repository import AsyncInvalidatingBrandRepository
+from app.adapters.cache.cached_brand_repository import CachedBrandRepository
+from app.adapters.cache.ttl_lru_cache import TTLLRUCache
+from app.adapters.cache.shared_brand_repository import SharedCachedBrandRepository, shared_cache
+from app.adapters.events.brand_events import brand_events
 from app.domain.use_cases.brand_use_case import BrandUseCase
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort, SORT_FIELDS
 from app.core.logger import get_logger_with_uuid
+from app.config import settings
+from app.container import injector
 
-def get_brand_use_case(db: Session = Depends(get_db)) -> BrandUseCase:
+# Métodos HTTP que no escriben: sus lecturas pueden ir a una réplica
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Cookie y cabecera con la marca de tiempo de la última escritura del cliente
+WRITE_TOKEN_COOKIE = "last_write_at"
+WRITE_TOKEN_HEADER = "X-Last-Write-At"
+
+def get_write_token(request: Request) -> Optional[str]:
+    """Marca de la última escritura enviada por el cliente (cabecera o cookie)"""
+    return request.headers.get(WRITE_TOKEN_HEADER) or request.cookies.get(WRITE_TOKEN_COOKIE)
+
+def issue_write_token(response: Response) -> None:
+    """Devolver al cliente la marca de su escritura (cookie y cabecera) si hay réplicas"""
+    token = replica_router.write_token()
+    if token is not None:
+        response.headers[WRITE_TOKEN_HEADER] = token
+        response.set_cookie(
+            WRITE_TOKEN_COOKIE, token,
+            max_age=math.ceil(replica_router.read_your_writes_seconds),
+            httponly=True, samesite="lax",
+        )
+
+def get_read_db(request: Request, response: Response):
+    """
+    Sesión de réplica para las lecturas de la petición, o None para usar el primario
+
+    Las peticiones de escritura usan el primario y devuelven al cliente la marca
+    de la escritura (cookie y cabecera); mientras la reenvíe dentro de la ventana
+    read-your-writes, sus lecturas van al primario sea cual sea el worker. La
+    marca se toma al empezar la escritura, así que la ventana debe cubrir su
+    duración más el retraso de las réplicas.
+    """
+    if request.method not in READ_ONLY_METHODS:
+        issue_write_token(response)
+        yield None
+        return
+    db = replica_router.session(get_write_token(request))
+    try:
+        yield db
+    finally:
+        if db is not None:
+            db.close()
+
+def get_brand_use_case(db: Session = Depends(get_db), read_db: Session = Depends(get_read_db)) -> BrandUseCase:
     """Obtener el caso de uso de marcas con la sesión de base de datos inyectada"""
-    repository = BrandRepository(db=db)
-    return BrandUseCase(repo=repository)
+    repository = BrandRepository(db=db, read_db=read_db)
+    # Las lecturas de réplica pueden ir por detrás: las cachés solo se rellenan desde el primario
+    from_primary = read_db is None
+    if shared_cache is not None:
+        repository = SharedCachedBrandRepository(repository, shared_cache, fill=from_primary)
+    if settings.BRAND_CACHE_ENABLED:
+        repository = CachedBrandRepository(repository, injector.get(TTLLRUCache), fill=from_primary)
+    return BrandUseCase(repo=repository, events=brand_events)
+
+def get_async_brand_use_case(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+) -> BrandUseCase:
+    """
+    Obtener el caso de uso de marcas con el repositorio asíncrono
+
+    Las escrituras invalidan las mismas cachés que el repositorio síncrono y
+    devuelven la marca read-your-writes, para que las rutas síncronas (y el
+    resto de workers) no sirvan datos anteriores a la escritura.
+    """
+    repository = AsyncBrandRepository(db=db)
+    if shared_cache is not None or settings.BRAND_CACHE_ENABLED:
+        local = injector.get(TTLLRUCache) if settings.BRAND_CACHE_ENABLED else None
+        repository = AsyncInvalidatingBrandRepository(repository, local=local, shared=shared_cache)
+    if request.method not in READ_ONLY_METHODS:
+        issue_write_token(response)
+    return BrandUseCase(repo=None, async_repo=repository, events=brand_events)
+
+# Claves de orden admitidas en la query: campo ascendente o con '-' descendente
+SortKey = Literal[tuple(key for field in SORT_FIELDS for key in (field, f"-{field}"))]
+
+def get_brand_filter(
+    status: Optional[str] = Query(None, max_length=50, description="Estado de la marca"),
+    lang: Optional[str] = Query(None, min_length=2, max_length=10, description="Código de idioma ISO 639-1"),
+    owner: Optional[str] = Query(None, min_length=1, max_length=255, description="Propietario de la marca"),
+    created_from: Optional[datetime] = Query(None, description="Creadas desde (inclusive)"),
+    created_to: Optional[datetime] = Query(None, description="Creadas hasta (exclusive)"),
+    updated_from: Optional[datetime] = Query(None, description="Actualizadas desde (inclusive)"),
+    updated_to: Optional[datetime] = Query(None, description="Actualizadas hasta (exclusive)"),
+) -> BrandFilter:
+    """Filtros del listado de marcas a partir de la query string"""
+    return BrandFilter(
+        status=status, lang=lang, owner=owner,
+        created_from=created_from, created_to=created_to,
+        updated_from=updated_from, updated_to=updated_to,
+    )
+
+def get_brand_sort(
+    sort: SortKey = Query("created_at", description="Orden: created_at, updated_at o name ('-' para descendente)"),
+) -> BrandSort:
+    """Orden del listado de marcas (solo claves permitidas)"""
+    return BrandSort.parse(sort)
 
 def get_brand_logger(brand_id: str = None):
     """Obtener logger con contexto de UUID para operaciones de marca"""
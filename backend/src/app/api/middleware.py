@@ -0,0 +1,154 @@
+"""
+Middlewares ASGI de observabilidad
+RequestContextMiddleware abre un RequestContext con el ID de correlación
+(cabecera X-Request-ID o uno nuevo), lo devuelve en la respuesta y, cuando
+termina el cuerpo, emite un único registro JSON con la ruta, el estado, los
+tiempos por capa, las sentencias SQL y el resultado. MetricsMiddleware mide
+la latencia por ruta y estado y las peticiones en curso. TracingMiddleware
+abre el span de servidor de cada petición.
+"""
+
+import re
+import time
+from uuid import uuid4
+
+from app.core.logger import log_request_event
+from app.core.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_PROGRESS
+from app.core.request_context import RequestContext, current_request
+from app.core.tracing import KIND_SERVER, parse_traceparent, tracer
+
+REQUEST_ID_HEADER = b"x-request-id"
+TRACEPARENT_HEADER = b"traceparent"
+
+# IDs de correlación aceptados del cliente (el resto se sustituye por uno nuevo)
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+def _header(scope, header: bytes):
+    for name, value in scope.get("headers", ()):
+        if name == header:
+            return value.decode("latin-1")
+    return None
+
+def _request_id(scope) -> str:
+    request_id = _header(scope, REQUEST_ID_HEADER)
+    if request_id is not None and _VALID_REQUEST_ID.match(request_id):
+        return request_id
+    return uuid4().hex
+
+class RequestContextMiddleware:
+    """Contexto y registro JSON de cada petición HTTP"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        context = RequestContext(request_id=_request_id(scope), method=scope["method"], path=scope["path"])
+        token = current_request.set(context)
+
+        async def send_with_context(message):
+            if message["type"] == "http.response.start":
+                context.status = message["status"]
+                headers = list(message.get("headers", ()))
+                headers.append((REQUEST_ID_HEADER, context.request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_context)
+        except Exception as e:
+            # Sin respuesta enviada el estado queda en None (resultado "error")
+            if context.error is None:
+                context.error = f"{type(e).__name__}: {e}"
+                context.error_type = type(e).__name__
+            raise
+        finally:
+            # La ruta solo se conoce después del enrutado
+            route = scope.get("route")
+            context.route = getattr(route, "path", None)
+            current_request.reset(token)
+            log_request_event(context)
+
+# Ruta de las peticiones que no coinciden con ninguna (evita una serie por URL)
+UNMATCHED_ROUTE = "<unmatched>"
+
+class MetricsMiddleware:
+    """Histograma de latencia por método, ruta y estado y gauge de peticiones en curso"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = (scope["method"],)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc(labels=method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec(labels=method)
+            # La plantilla de la ruta (no la URL) mantiene acotadas las series
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - start, (scope["method"], route, str(status)))
+
+class TracingMiddleware:
+    """Span de servidor por petición HTTP, hijo del `traceparent` entrante si lo hay"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        span = tracer.start_span(
+            method,
+            kind=KIND_SERVER,
+            parent=parse_traceparent(_header(scope, TRACEPARENT_HEADER)),
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        )
+        if not span.recording:
+            with span:
+                await self.app(scope, receive, send)
+            return
+
+        # El registro JSON de la petición enlaza con su traza
+        context = current_request.get()
+        if context is not None:
+            context.trace_id = f"{span.context.trace_id:032x}"
+        status = None
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.name = f"{method} {route}"
+                    span.set_attribute("http.route", route)
+                if status is not None:
+                    span.set_attribute("http.response.status_code", status)
+                    if status >= 500:
+                        span.set_error(f"HTTP {status}")
@@ -0,0 +1,67 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.adapters.cache.cached_brand_repository import brand_cache
+from app.adapters.cache.shared_brand_repository import shared_cache
+from app.adapters.db.pool import pool_status
+from app.adapters.db.session import (
+    engine,
+    pool_metrics,
+    replica_router,
+    sql_instrumentation,
+)
+from app.adapters.events.brand_events import brand_broadcaster
+from app.api.dependencies.auth_dependency import verify_api_key
+from app.core.logger import error_limiter, logging_stats
+from app.core.tracing import tracer
+
+router = APIRouter()
+
+@router.get("/admin/pool", dependencies=[Depends(verify_api_key)])
+def get_pool_status():
+    """Estadísticas en vivo del pool de conexiones de este worker"""
+    status = pool_status(engine, pool_metrics)
+    status["replicas"] = replica_router.status()
+    return status
+
+@router.get("/admin/sql-stats", dependencies=[Depends(verify_api_key)])
+def get_sql_stats(
+    limit: Optional[int] = Query(None, ge=1, description="Número máximo de huellas"),
+    reset: bool = Query(False, description="Reiniciar los agregados tras leerlos"),
+):
+    """Agregados por huella de sentencia SQL (conteo, tiempo total y p95) de este worker"""
+    stats = sql_instrumentation.dump(limit)
+    if reset:
+        sql_instrumentation.reset()
+    return stats
+
+@router.get("/admin/cache", dependencies=[Depends(verify_api_key)])
+def get_cache_stats():
+    """Contadores de la caché de marcas por ID de este worker y estado de la caché compartida"""
+    stats = brand_cache.stats()
+    stats["shared"] = shared_cache.stats() if shared_cache is not None else None
+    return stats
+
+@router.get("/admin/events", dependencies=[Depends(verify_api_key)])
+def get_event_stats():
+    """Suscriptores SSE de este worker y contadores de eventos publicados, entregados y expulsiones"""
+    return brand_broadcaster.stats()
+
+@router.get("/admin/logging", dependencies=[Depends(verify_api_key)])
+def get_logging_stats():
+    """Registros en cola y descartados por desbordamiento en las colas de logging de este worker"""
+    return logging_stats()
+
+@router.get("/admin/errors", dependencies=[Depends(verify_api_key)])
+def get_error_stats(reset: bool = Query(False, description="Reiniciar los contadores tras leerlos")):
+    """Contadores por huella de error (tipo de excepción y operación) de este worker"""
+    stats = error_limiter.stats()
+    if reset:
+        error_limiter.reset()
+    return stats
+
+@router.get("/admin/tracing", dependencies=[Depends(verify_api_key)])
+def get_tracing_stats():
+    """Configuración del tracing y spans en cola o descartados por el exportador de este worker"""
+    return tracer.stats()
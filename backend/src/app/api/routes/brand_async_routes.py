@@ -0,0 +1,149 @@
+"""
+Rutas asíncronas de marcas (DB_ACCESS_MODE=async)
+Sirven las operaciones CRUD sobre AsyncBrandPort sin ocupar el threadpool.
+Se registran antes que las rutas síncronas, que siguen atendiendo el resto
+de endpoints (exportación, cargas y operaciones masivas).
+"""
+
+from typing import List, Optional, Union
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from app.api.conditional import (
+    canonical_query,
+    collection_etag,
+    entity_etag,
+    is_conditional,
+    is_not_modified,
+    last_modified,
+    not_modified,
+    validator_headers,
+)
+from app.api.dependencies.auth_dependency import verify_api_key
+from app.api.dependencies.brand_dependency import (
+    get_async_brand_use_case,
+    get_brand_filter,
+    get_brand_sort,
+)
+from app.api.serialization import brand_response
+from app.api.traced_route import TracedRoute
+from app.config import settings
+from app.core.logger import log_operation_error
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
+from app.domain.use_cases.brand_use_case import BrandUseCase
+from app.schemas.brand_dto import (
+    BrandCreateDTO,
+    BrandPageDTO,
+    BrandReadDTO,
+    BrandUpdateDTO,
+)
+
+router = APIRouter(route_class=TracedRoute)
+
+@router.get("/brands", response_model=Union[BrandPageDTO, List[BrandReadDTO]], dependencies=[Depends(verify_api_key)])
+async def list_brands_async(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=settings.PAGE_MAX_LIMIT, description="Tamaño de página"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco devuelto en next_cursor"),
+    filters: BrandFilter = Depends(get_brand_filter),
+    sort: BrandSort = Depends(get_brand_sort),
+    use_case: BrandUseCase = Depends(get_async_brand_use_case),
+):
+    """Obtener las marcas registradas, filtradas y ordenadas (paginadas por cursor si se indica limit o cursor)"""
+    try:
+        # Sonda de versión: dos agregados por índice en lugar del listado completo
+        versions = await use_case.get_brands_version_async()
+        etag = collection_etag(versions, canonical_query(request))
+        modified = last_modified(*versions)
+        if is_not_modified(request, etag, modified):
+            return not_modified(etag, modified)
+        headers = validator_headers(etag, modified)
+
+        # Las entidades se serializan directamente (sin revalidar con response_model)
+        if limit is None and cursor is None:
+            return brand_response(await use_case.list_brands_async(filters=filters, sort=sort), headers)
+        return brand_response(await use_case.list_brands_page_async(limit=limit, cursor=cursor, filters=filters, sort=sort), headers)
+    except ValueError as e:
+        log_operation_error("list_brands", "Brand", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        log_operation_error("list_brands", "Brand", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+# El conversor :uuid evita capturar rutas estáticas como /brands/export
+@router.get("/brands/{brand_id:uuid}", response_model=BrandReadDTO, dependencies=[Depends(verify_api_key)])
+async def get_brand_async(
+    brand_id: UUID,
+    request: Request,
+    use_case: BrandUseCase = Depends(get_async_brand_use_case),
+):
+    """Obtener una marca por su ID"""
+    try:
+        if is_conditional(request):
+            # Sonda de versión: updated_at de la marca cacheada o por clave primaria
+            version = await use_case.get_brand_version_async(brand_id)
+            if version is None:
+                raise HTTPException(status_code=404, detail="Marca no encontrada")
+            etag = entity_etag(brand_id, version)
+            if is_not_modified(request, etag, version):
+                return not_modified(etag, version)
+
+        brand = await use_case.get_brand_async(brand_id)
+        if not brand:
+            raise HTTPException(status_code=404, detail="Marca no encontrada")
+        # Validadores calculados sobre la marca cargada: coinciden con el cuerpo
+        return brand_response(brand, validator_headers(entity_etag(brand_id, brand.updated_at), brand.updated_at))
+    except HTTPException:
+        raise
+    except Exception as e:
+        log_operation_error("get_brand", "Brand", str(brand_id), error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+@router.post("/brands", response_model=BrandReadDTO, dependencies=[Depends(verify_api_key)])
+async def create_brand_async(dto: BrandCreateDTO, use_case: BrandUseCase = Depends(get_async_brand_use_case)):
+    """Crear una nueva marca"""
+    try:
+        return await use_case.create_brand_async(dto)
+    except Exception as e:
+        log_operation_error("create_brand", "Brand", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+@router.put("/brands/{brand_id:uuid}", response_model=BrandReadDTO, dependencies=[Depends(verify_api_key)])
+async def update_brand_async(brand_id: UUID, dto: BrandUpdateDTO, use_case: BrandUseCase = Depends(get_async_brand_use_case)):
+    """Actualizar una marca existente"""
+    try:
+        return await use_case.update_brand_async(brand_id, dto)
+    except ValueError as e:
+        log_operation_error("update_brand", "Brand", str(brand_id), error=str(e))
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        log_operation_error("update_brand", "Brand", str(brand_id), error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+@router.delete("/brands/{brand_id:uuid}", dependencies=[Depends(verify_api_key)])
+async def delete_brand_async(brand_id: UUID, use_case: BrandUseCase = Depends(get_async_brand_use_case)):
+    """Eliminar una marca (soft delete)"""
+    try:
+        await use_case.delete_brand_async(brand_id)
+        return {"detail": "Marca eliminada correctamente"}
+    except ValueError as e:
+        log_operation_error("delete_brand", "Brand", str(brand_id), error=str(e))
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        log_operation_error("delete_brand", "Brand", str(brand_id), error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+@router.delete("/brands/{brand_id:uuid}/hard", dependencies=[Depends(verify_api_key)])
+async def hard_delete_brand_async(brand_id: UUID, use_case: BrandUseCase = Depends(get_async_brand_use_case)):
+    """Eliminación física de una marca (solo para casos especiales)"""
+    try:
+        await use_case.hard_delete_brand_async(brand_id)
+        return {"detail": "Marca eliminada físicamente"}
+    except ValueError as e:
+        log_operation_error("hard_delete_brand", "Brand", str(brand_id), error=str(e))
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        log_operation_error("hard_delete_brand", "Brand", str(brand_id), error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
@@ -1,37 +1,177 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from fastapi.responses import StreamingResponse
+from typing import List, Literal, Optional, Union
 from uuid import UUID
-from app.schemas.brand_dto import BrandCreateDTO, BrandUpdateDTO, BrandReadDTO
+from app.api.traced_route import TracedRoute
+from app.schemas.brand_dto import (
+    BrandCreateDTO, BrandUpdateDTO, BrandReadDTO, BrandPageDTO,
+    BrandBulkResultDTO, BrandBulkErrorDTO, BrandBulkUpdateDTO,
+    BrandBulkSelectionDTO, BrandBulkAffectedDTO, BrandChangeDTO, BrandChangesDTO
+)
 from app.api.dependencies.auth_dependency import verify_api_key
-from app.api.dependencies.brand_dependency import get_brand_use_case, get_brand_logger
+from app.api.dependencies.brand_dependency import (
+    get_brand_use_case, get_brand_filter, get_brand_sort
+)
+from app.api.conditional import (
+    entity_etag, collection_etag, last_modified, is_conditional, is_not_modified, not_modified, validator_headers, canonical_query
+)
+from app.adapters.events.broadcaster import TooManySubscribers
+from app.adapters.events.brand_events import brand_broadcaster
+from app.api.serialization import brand_response
+from app.api.streaming import EXPORT_FIELDS, ndjson_chunks, csv_chunks, iterate_and_close, iter_ndjson_lines
+from app.adapters.db.session import get_session_factory
+from app.adapters.db.repositories.brand_repository import BrandRepository
 from app.domain.use_cases.brand_use_case import BrandUseCase
-from app.core.logger import log_operation_start, log_operation_error
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
+from app.core.logger import log_operation_error
+from app.config import settings
 
-router = APIRouter()
+router = APIRouter(route_class=TracedRoute)
 
-@router.get("/brands", response_model=List[BrandReadDTO], dependencies=[Depends(verify_api_key)])
-def list_brands(use_case: BrandUseCase = Depends(get_brand_use_case)):
-    """Obtener todas las marcas registradas"""
+@router.get("/brands", response_model=Union[BrandPageDTO, List[BrandReadDTO]], dependencies=[Depends(verify_api_key)])
+def list_brands(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=settings.PAGE_MAX_LIMIT, description="Tamaño de página"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco devuelto en next_cursor"),
+    filters: BrandFilter = Depends(get_brand_filter),
+    sort: BrandSort = Depends(get_brand_sort),
+    use_case: BrandUseCase = Depends(get_brand_use_case),
+):
+    """Obtener las marcas registradas, filtradas y ordenadas (paginadas por cursor si se indica limit o cursor)"""
     try:
-        brands = use_case.list_brands()
-        return brands
+        # Sonda de versión: dos agregados por índice en lugar del listado completo
+        versions = use_case.get_brands_version()
+        etag = collection_etag(versions, canonical_query(request))
+        modified = last_modified(*versions)
+        if is_not_modified(request, etag, modified):
+            return not_modified(etag, modified)
+        headers = validator_headers(etag, modified)
+
+        # Las entidades se serializan directamente (sin revalidar con response_model)
+        if limit is None and cursor is None:
+            return brand_response(use_case.list_brands(filters=filters, sort=sort), headers)
+        return brand_response(use_case.list_brands_page(limit=limit, cursor=cursor, filters=filters, sort=sort), headers)
+    except ValueError as e:
+        log_operation_error("list_brands", "Brand", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         log_operation_error("list_brands", "Brand", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_chunks, "application/x-ndjson"),
+    "csv": (csv_chunks, "text/csv; charset=utf-8"),
+}
+
+@router.get("/brands/export", dependencies=[Depends(verify_api_key)])
+def export_brands(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Formato de exportación"),
+    session_factory=Depends(get_session_factory),
+):
+    """Exportar todas las marcas activas en streaming (NDJSON o CSV)"""
+    serializer, media_type = EXPORT_FORMATS[format]
+
+    def stream():
+        # La exportación abre su propia sesión: vive lo mismo que la respuesta
+        db = session_factory()
+        try:
+            use_case = BrandUseCase(repo=BrandRepository(db=db))
+            yield from serializer(use_case.export_brand_rows(EXPORT_FIELDS))
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        iterate_and_close(stream()),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="brands.{format}"'},
+    )
+
+@router.get("/brands/search", response_model=List[BrandReadDTO], dependencies=[Depends(verify_api_key)])
+def search_brands(
+    q: str = Query(..., min_length=1, max_length=255, description="Texto a buscar en nombre o propietario"),
+    limit: Optional[int] = Query(None, ge=1, le=settings.SEARCH_MAX_LIMIT, description="Máximo de resultados"),
+    min_similarity: Optional[float] = Query(None, ge=0, le=1, description="Similitud mínima (0-1)"),
+    use_case: BrandUseCase = Depends(get_brand_use_case),
+):
+    """Buscar marcas por nombre o propietario, ordenadas por similitud"""
+    try:
+        return brand_response(use_case.search_brands(q, limit=limit, min_similarity=min_similarity))
+    except ValueError as e:
+        log_operation_error("search_brands", "Brand", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        log_operation_error("search_brands", "Brand", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+@router.get("/brands/changes", response_model=BrandChangesDTO, dependencies=[Depends(verify_api_key)])
+def list_brand_changes(
+    since: Optional[str] = Query(None, description="Cursor next_cursor de la consulta anterior (vacío: desde el principio)"),
+    limit: Optional[int] = Query(None, ge=1, le=settings.CHANGES_MAX_LIMIT, description="Máximo de cambios"),
+    use_case: BrandUseCase = Depends(get_brand_use_case),
+):
+    """Obtener las marcas creadas, actualizadas o eliminadas después del cursor indicado"""
+    try:
+        page = use_case.list_brand_changes(limit=limit, since=since)
+        return BrandChangesDTO(
+            items=[BrandChangeDTO.from_brand(brand) for brand in page.items],
+            next_cursor=page.next_cursor,
+            has_more=page.has_more,
+        )
+    except ValueError as e:
+        log_operation_error("list_brand_changes", "Brand", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        log_operation_error("list_brand_changes", "Brand", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+@router.get("/brands/stream", dependencies=[Depends(verify_api_key)])
+async def stream_brand_events():
+    """Stream Server-Sent Events con las altas, modificaciones y bajas de marcas"""
+    try:
+        subscription = brand_broadcaster.subscribe()
+    except TooManySubscribers as e:
+        log_operation_error("stream_brand_events", "Brand", error=str(e))
+        raise HTTPException(status_code=503, detail="Demasiados suscriptores, reintente más tarde") from e
+    return StreamingResponse(
+        brand_broadcaster.stream(
+            heartbeat_seconds=settings.SSE_HEARTBEAT_SECONDS,
+            max_seconds=settings.SSE_MAX_CONNECTION_SECONDS or None,
+            subscription=subscription,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @router.get("/brands/{brand_id}", response_model=BrandReadDTO, dependencies=[Depends(verify_api_key)])
-def get_brand(brand_id: UUID, use_case: BrandUseCase = Depends(get_brand_use_case)):
+def get_brand(
+    brand_id: UUID,
+    request: Request,
+    use_case: BrandUseCase = Depends(get_brand_use_case),
+):
     """Obtener una marca por su ID"""
     try:
+        if is_conditional(request):
+            # Sonda de versión: updated_at de la marca cacheada o por clave primaria
+            version = use_case.get_brand_version(brand_id)
+            if version is None:
+                raise HTTPException(status_code=404, detail="Marca no encontrada")
+            etag = entity_etag(brand_id, version)
+            if is_not_modified(request, etag, version):
+                return not_modified(etag, version)
+
         brand = use_case.get_brand(brand_id)
         if not brand:
             raise HTTPException(status_code=404, detail="Marca no encontrada")
-        return brand
+        # Validadores calculados sobre la marca cargada: coinciden con el cuerpo
+        return brand_response(brand, validator_headers(entity_etag(brand_id, brand.updated_at), brand.updated_at))
     except HTTPException:
         raise
     except Exception as e:
         log_operation_error("get_brand", "Brand", str(brand_id), error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 @router.post("/brands", response_model=BrandReadDTO, dependencies=[Depends(verify_api_key)])
 def create_brand(dto: BrandCreateDTO, use_case: BrandUseCase = Depends(get_brand_use_case)):
@@ -41,7 +181,80 @@ def create_brand(dto: BrandCreateDTO, use_case: BrandUseCase = Depends(get_brand
         return brand
     except Exception as e:
         log_operation_error("create_brand", "Brand", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+def _insert_bulk_batch(use_case: BrandUseCase, batch: list, result: BrandBulkResultDTO) -> None:
+    """Insertar un lote; si falla, reintentar fila a fila para aislar los errores"""
+    if not batch:
+        return
+    try:
+        result.created += use_case.create_brands([dto for _, dto in batch])
+        return
+    except Exception as e:
+        log_operation_error("create_brands_bulk", "Brand", error=f"batch of {len(batch)} rolled back, retrying row by row: {e}")
+    for line_no, dto in batch:
+        try:
+            result.created += use_case.create_brands([dto])
+        except Exception as e:
+            _report_bulk_error(result, line_no, str(e))
+
+def _report_bulk_error(result: BrandBulkResultDTO, line_no: int, error: str) -> None:
+    """Registrar una fila fallida respetando el máximo de errores reportados"""
+    result.failed += 1
+    if len(result.errors) < settings.BULK_MAX_REPORTED_ERRORS:
+        result.errors.append(BrandBulkErrorDTO(line=line_no, error=error))
+    else:
+        result.errors_truncated = True
+
+@router.post("/brands/bulk", response_model=BrandBulkResultDTO, dependencies=[Depends(verify_api_key)])
+async def create_brands_bulk(request: Request, use_case: BrandUseCase = Depends(get_brand_use_case)):
+    """Crear marcas de forma masiva a partir de un cuerpo NDJSON (una marca por línea)"""
+    result = BrandBulkResultDTO()
+    batch = []
+    try:
+        async for line_no, line in iter_ndjson_lines(request.stream(), settings.BULK_MAX_LINE_BYTES):
+            if line is None:
+                _report_bulk_error(result, line_no, f"Line exceeds {settings.BULK_MAX_LINE_BYTES} bytes")
+                continue
+            try:
+                batch.append((line_no, BrandCreateDTO.model_validate_json(line)))
+            except ValidationError as e:
+                _report_bulk_error(result, line_no, "; ".join(
+                    f"{'.'.join(map(str, err['loc'])) or 'body'}: {err['msg']}" for err in e.errors()
+                ))
+                continue
+            if len(batch) >= settings.BULK_BATCH_SIZE:
+                await run_in_threadpool(_insert_bulk_batch, use_case, batch, result)
+                batch = []
+        await run_in_threadpool(_insert_bulk_batch, use_case, batch, result)
+        return result
+    except Exception as e:
+        log_operation_error("create_brands_bulk", "Brand", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+@router.patch("/brands/bulk", response_model=BrandBulkAffectedDTO, dependencies=[Depends(verify_api_key)])
+def bulk_update_brands(dto: BrandBulkUpdateDTO, use_case: BrandUseCase = Depends(get_brand_use_case)):
+    """Actualizar parcialmente un conjunto de marcas por lista de IDs o filtro"""
+    try:
+        return BrandBulkAffectedDTO(affected=use_case.bulk_update_brands(dto))
+    except ValueError as e:
+        log_operation_error("bulk_update_brands", "Brand", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        log_operation_error("bulk_update_brands", "Brand", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+@router.post("/brands/bulk/delete", response_model=BrandBulkAffectedDTO, dependencies=[Depends(verify_api_key)])
+def bulk_delete_brands(dto: BrandBulkSelectionDTO, use_case: BrandUseCase = Depends(get_brand_use_case)):
+    """Eliminar (soft delete) un conjunto de marcas por lista de IDs o filtro"""
+    try:
+        return BrandBulkAffectedDTO(affected=use_case.bulk_delete_brands(dto))
+    except ValueError as e:
+        log_operation_error("bulk_delete_brands", "Brand", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        log_operation_error("bulk_delete_brands", "Brand", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 @router.put("/brands/{brand_id}", response_model=BrandReadDTO, dependencies=[Depends(verify_api_key)])
 def update_brand(brand_id: UUID, dto: BrandUpdateDTO, use_case: BrandUseCase = Depends(get_brand_use_case)):
@@ -51,10 +264,10 @@ def update_brand(brand_id: UUID, dto: BrandUpdateDTO, use_case: BrandUseCase = D
         return brand
     except ValueError as e:
         log_operation_error("update_brand", "Brand", str(brand_id), error=str(e))
-        raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e)) from e
     except Exception as e:
         log_operation_error("update_brand", "Brand", str(brand_id), error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 @router.delete("/brands/{brand_id}", dependencies=[Depends(verify_api_key)])
 def delete_brand(brand_id: UUID, use_case: BrandUseCase = Depends(get_brand_use_case)):
@@ -64,10 +277,10 @@ def delete_brand(brand_id: UUID, use_case: BrandUseCase = Depends(get_brand_use_
         return {"detail": "Marca eliminada correctamente"}
     except ValueError as e:
         log_operation_error("delete_brand", "Brand", str(brand_id), error=str(e))
-        raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e)) from e
     except Exception as e:
         log_operation_error("delete_brand", "Brand", str(brand_id), error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 @router.delete("/brands/{brand_id}/hard", dependencies=[Depends(verify_api_key)])
 def hard_delete_brand(brand_id: UUID, use_case: BrandUseCase = Depends(get_brand_use_case)):
@@ -77,7 +290,7 @@ def hard_delete_brand(brand_id: UUID, use_case: BrandUseCase = Depends(get_brand
         return {"detail": "Marca eliminada físicamente"}
     except ValueError as e:
         log_operation_error("hard_delete_brand", "Brand", str(brand_id), error=str(e))
-        raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e)) from e
     except Exception as e:
         log_operation_error("hard_delete_brand", "Brand", str(brand_id), error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
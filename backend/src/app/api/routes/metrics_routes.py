@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Depends, Response
+
+from app.api.dependencies.auth_dependency import verify_api_key
+from app.core.metrics import CONTENT_TYPE, registry
+
+router = APIRouter()
+
+@router.get("/metrics", include_in_schema=False, dependencies=[Depends(verify_api_key)])
+def get_metrics():
+    """Métricas en formato de texto de Prometheus (agregadas entre workers si METRICS_DIR está definido)"""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
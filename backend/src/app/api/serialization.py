@@ -0,0 +1,62 @@
+"""
+Serialización directa de marcas a JSON
+Las lecturas devuelven entidades que acaban de salir de nuestra base de
+datos: en lugar de validarlas de nuevo como BrandReadDTO (response_model) y
+pasar por el encoder JSON de la librería estándar, se copian sus campos
+públicos a un dict que se codifica a bytes con orjson (dependencia opcional)
+o, si no está instalado, con pydantic-core (to_json). La salida es idéntica
+byte a byte a la del camino con response_model.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import Response
+from pydantic_core import to_json
+
+from app.domain.entities.brand import Brand
+from app.domain.entities.brand_page import BrandPage
+from app.schemas.brand_dto import BrandReadDTO
+
+try:
+    import orjson
+except ImportError:  # Opcional: pydantic-core es algo más lento pero siempre está disponible
+    orjson = None
+
+# Campos públicos en el orden del esquema (los de BrandReadDTO)
+BRAND_PUBLIC_FIELDS = tuple(BrandReadDTO.model_fields)
+
+def public_row(brand: Brand) -> Dict[str, Any]:
+    """Campos públicos de la marca (mismas claves y orden que BrandReadDTO)"""
+    return {"id": brand.id, "name": brand.name, "owner": brand.owner, "lang": brand.lang, "status": brand.status}
+
+def dump_json(content: Any) -> bytes:
+    """JSON compacto en UTF-8 con orjson si está instalado"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return to_json(content)
+
+def dump_brand(brand: Brand) -> bytes:
+    """JSON de una marca con el esquema de BrandReadDTO"""
+    return dump_json(public_row(brand))
+
+def dump_brands(brands: List[Brand]) -> bytes:
+    """JSON de una lista de marcas con el esquema de List[BrandReadDTO]"""
+    return dump_json([public_row(brand) for brand in brands])
+
+def dump_brand_page(page: BrandPage) -> bytes:
+    """JSON de una página de marcas con el esquema de BrandPageDTO"""
+    return dump_json({"items": [public_row(brand) for brand in page.items], "next_cursor": page.next_cursor})
+
+class BrandJSONResponse(Response):
+    """Respuesta JSON cuyo cuerpo ya está serializado"""
+    media_type = "application/json"
+
+def brand_response(content: Any, headers: Optional[Dict[str, str]] = None) -> BrandJSONResponse:
+    """Respuesta JSON para una marca, una lista de marcas o una página"""
+    if isinstance(content, BrandPage):
+        body = dump_brand_page(content)
+    elif isinstance(content, list):
+        body = dump_brands(content)
+    else:
+        body = dump_brand(content)
+    return BrandJSONResponse(body, headers=headers)
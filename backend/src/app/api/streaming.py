@@ -0,0 +1,100 @@
+"""
+Utilidades para respuestas y cuerpos en streaming
+Serializan filas de marcas (tuplas en el orden de EXPORT_FIELDS) a NDJSON/CSV
+por bloques, garantizan el cierre del
+iterador (y de su sesión de base de datos) aunque el cliente se desconecte
+y parten cuerpos NDJSON entrantes en líneas sin cargarlos completos.
+"""
+
+import csv
+import io
+import json
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+import anyio
+from starlette.concurrency import iterate_in_threadpool
+
+from app.schemas.brand_dto import BrandReadDTO
+
+# Campos públicos exportados, en el orden de las filas que reciben los serializadores
+EXPORT_FIELDS = list(BrandReadDTO.model_fields)
+
+def ndjson_chunks(rows: Iterable[Tuple], rows_per_chunk: int = 500) -> Iterator[str]:
+    """Serializar filas de marcas como NDJSON agrupando varias líneas por bloque"""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(EXPORT_FIELDS, row, strict=False)), default=str, ensure_ascii=False))
+        if len(lines) >= rows_per_chunk:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+def csv_chunks(rows: Iterable[Tuple], rows_per_chunk: int = 500) -> Iterator[str]:
+    """Serializar filas de marcas como CSV (con cabecera) agrupando varias filas por bloque"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= rows_per_chunk:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+async def iterate_and_close(iterator: Generator[str, None, None]) -> AsyncIterator[str]:
+    """
+    Consumir un iterador síncrono en el threadpool y cerrarlo siempre
+
+    Si el cliente se desconecta, Starlette cancela la respuesta; el cierre
+    explícito ejecuta los bloques finally del generador (liberando la conexión).
+    """
+    try:
+        async for chunk in iterate_in_threadpool(iterator):
+            yield chunk
+    finally:
+        with anyio.CancelScope(shield=True):
+            await anyio.to_thread.run_sync(iterator.close)
+
+async def iter_ndjson_lines(
+    body: AsyncIterable[bytes], max_line_bytes: int = 65536
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    Partir un cuerpo NDJSON en streaming en (número de línea, línea)
+
+    Las líneas vacías se omiten. Una línea más larga que max_line_bytes se
+    entrega como None para que el llamador la reporte como error sin
+    acumularla en memoria.
+    """
+    pending = b""
+    line_no = 0
+    oversized = False
+    async for chunk in body:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if oversized:
+                oversized = False
+                yield line_no, None
+            elif line.strip():
+                yield line_no, line
+        if len(pending) > max_line_bytes:
+            oversized = True
+            pending = b""
+    if oversized:
+        yield line_no + 1, None
+    elif pending.strip():
+        yield line_no + 1, pending
@@ -0,0 +1,47 @@
+"""
+Clase de ruta de FastAPI con un span para el endpoint
+El span de servidor (TracingMiddleware) cubre toda la petición; este span
+empieza cuando FastAPI llama a la función de la ruta, así que la diferencia
+entre ambos es la lectura del cuerpo, la inyección de dependencias, la
+validación y la serialización de la respuesta.
+"""
+
+import functools
+import inspect
+from typing import Any, Callable
+
+from fastapi.routing import APIRoute
+
+from app.core.tracing import current_span, tracer
+
+def traced_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Envolver el endpoint en un span `endpoint <nombre>` (conserva la firma para FastAPI)"""
+    if getattr(endpoint, "__traced__", False):
+        # include_router vuelve a crear la ruta con el endpoint ya envuelto
+        return endpoint
+    name = f"endpoint {endpoint.__name__}"
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def traced(*args, **kwargs):
+            parent = current_span()
+            if parent is None or not parent.recording:
+                return await endpoint(*args, **kwargs)
+            with tracer.start_span(name, parent=parent):
+                return await endpoint(*args, **kwargs)
+    else:
+        @functools.wraps(endpoint)
+        def traced(*args, **kwargs):
+            parent = current_span()
+            if parent is None or not parent.recording:
+                return endpoint(*args, **kwargs)
+            with tracer.start_span(name, parent=parent):
+                return endpoint(*args, **kwargs)
+    traced.__traced__ = True
+    return traced
+
+class TracedRoute(APIRoute):
+    """APIRoute cuyo endpoint abre un span dentro de la traza de la petición"""
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        super().__init__(path, traced_endpoint(endpoint), **kwargs)
@@ -7,5 +7,62 @@ class TestSettings:
     DATABASE_URL: str = "sqlite:///:memory:"
     API_KEY: str = "super-secret-key-123"
     ENVIRONMENT: str = "test"
+    DB_ACCESS_MODE: str = "sync"
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_STRATEGY: str = "round_robin"
+    DB_READ_YOUR_WRITES_SECONDS: float = 5
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 0
+    SQL_ECHO: bool = False
+    SQL_SLOW_QUERY_MS: float = 200
+    SQL_SAMPLE_RATE: float = 0
+    LOG_LEVEL: str = "INFO"
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_OVERFLOW: str = "drop"
+    LOG_REQUEST_EVENTS: bool = True
+    LOG_LAYER_LINES: bool = False
+    ERROR_LOG_INTERVAL_SECONDS: float = 60
+    ERROR_LOG_MAX_FINGERPRINTS: int = 1000
+    METRICS_ENABLED: bool = True
+    METRICS_DIR: str = ""
+    METRICS_FLUSH_SECONDS: float = 5
+    TRACING_ENABLED: bool = False
+    TRACING_SAMPLE_RATE: float = 0.01
+    TRACING_EXPORTER: str = "otlp-file"
+    TRACING_OTLP_FILE: str = "traces.otlp.jsonl"
+    TRACING_SERVICE_NAME: str = "brands-api"
+    TRACING_QUEUE_SIZE: int = 2048
+    PAGE_DEFAULT_LIMIT: int = 50
+    PAGE_MAX_LIMIT: int = 500
+    BRAND_CACHE_ENABLED: bool = False
+    BRAND_CACHE_TTL_SECONDS: float = 60
+    BRAND_CACHE_MAX_ENTRIES: int = 10000
+    BRAND_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    SHARED_CACHE_URL: str = ""
+    SHARED_CACHE_TTL_SECONDS: float = 300
+    SHARED_CACHE_CHANNEL: str = "brands:invalidate"
+    SHARED_CACHE_SOCKET_TIMEOUT: float = 0.25
+    SHARED_CACHE_RETRY_SECONDS: float = 5
+    SEARCH_DEFAULT_LIMIT: int = 20
+    SEARCH_MAX_LIMIT: int = 100
+    SEARCH_MIN_SIMILARITY: float = 0.3
+    CHANGES_DEFAULT_LIMIT: int = 100
+    CHANGES_MAX_LIMIT: int = 1000
+    CHANGES_SETTLE_SECONDS: float = 1
+    BRAND_EVENTS_BACKEND: str = "auto"
+    BRAND_EVENTS_CHANNEL: str = "brand_events"
+    SSE_CLIENT_BUFFER: int = 100
+    SSE_MAX_SUBSCRIBERS: int = 10000
+    SSE_HEARTBEAT_SECONDS: float = 15
+    SSE_MAX_CONNECTION_SECONDS: float = 3600
+    EXPORT_BATCH_SIZE: int = 1000
+    BULK_BATCH_SIZE: int = 1000
+    BULK_MAX_LINE_BYTES: int = 65536
+    BULK_MAX_REPORTED_ERRORS: int = 1000
+    BULK_UPDATE_CHUNK_SIZE: int = 1000
 
 test_settings = TestSettings()
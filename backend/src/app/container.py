@@ -2,7 +2,13 @@ from injector import Binder, Module, Injector, singleton
 from sqlalchemy.orm import Session
 from app.domain.ports.brand_port import BrandPort
 from app.domain.ports.auth_port import AuthPort
+from app.domain.ports.async_brand_port import AsyncBrandPort
+from app.domain.ports.brand_event_port import BrandEventPort
 from app.adapters.db.repositories.brand_repository import BrandRepository
+from app.adapters.db.repositories.async_brand_repository import AsyncBrandRepository
+from app.adapters.cache.ttl_lru_cache import TTLLRUCache
+from app.adapters.cache.cached_brand_repository import brand_cache
+from app.adapters.events.brand_events import brand_events
 from app.adapters.auth.auth_adapter import SimpleAuthAdapter
 from app.domain.use_cases.brand_use_case import BrandUseCase
 from app.config import settings
@@ -20,6 +26,15 @@ class AppModule(Module):
             # Para producción, crear sin sesión (se manejará en las rutas)
             binder.bind(BrandPort, to=BrandRepository(), scope=singleton)
         
+        # Variante asíncrona (la sesión se asigna por petición en las rutas)
+        binder.bind(AsyncBrandPort, to=AsyncBrandRepository(), scope=singleton)
+        
+        # Caché de marcas por ID del worker: la comparten todos los CachedBrandRepository
+        binder.bind(TTLLRUCache, to=brand_cache, scope=singleton)
+        
+        # Publicador de eventos de marcas del proceso (stream SSE)
+        binder.bind(BrandEventPort, to=brand_events, scope=singleton)
+        
         binder.bind(BrandUseCase, to=BrandUseCase, scope=singleton)
         
         # Binding para autenticación
@@ -0,0 +1,133 @@
+"""
+Limitador de logs de error por huella
+Un error se identifica por (tipo de excepción, operación). La primera
+aparición se registra completa; las repeticiones dentro de la ventana solo
+se cuentan y se resumen periódicamente ("repeated N times in the last X s").
+Si una huella deja de repetirse durante una ventana completa, la siguiente
+aparición vuelve a registrarse completa. Los contadores por huella quedan
+disponibles para monitorización.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Fingerprint = Tuple[str, str]
+
+# Decisiones de record()
+LOG_FULL = "full"
+SUPPRESS = "suppress"
+
+@dataclass
+class _ErrorStats:
+    count: int
+    first_seen: float
+    last_seen: float
+    window_start: float
+    suppressed: int = 0
+
+class ErrorLogLimiter:
+    """
+    Deduplicación y resúmenes de errores repetidos
+
+    Args:
+        interval_seconds: ventana entre resúmenes de una misma huella
+        max_fingerprints: huellas distintas a conservar; el resto se agrupa en OTHER
+        clock: reloj monotónico (inyectable en tests)
+    """
+
+    OTHER: Fingerprint = ("<other>", "<other>")
+
+    def __init__(self, interval_seconds: float = 60.0, max_fingerprints: int = 1000, clock: Callable[[], float] = time.monotonic):
+        self.interval_seconds = interval_seconds
+        self.max_fingerprints = max_fingerprints
+        self.clock = clock
+        self._stats: Dict[Fingerprint, _ErrorStats] = {}
+        self._lock = threading.Lock()
+        # Evento de parada del thread de resúmenes en marcha (None: parado)
+        self._sweeper: Optional[threading.Event] = None
+
+    def record(self, fingerprint: Fingerprint) -> str:
+        """Contar una aparición y decidir si se registra completa (LOG_FULL) o se suprime"""
+        now = self.clock()
+        with self._lock:
+            stats = self._stats.get(fingerprint)
+            if stats is None and len(self._stats) >= self.max_fingerprints:
+                fingerprint = self.OTHER
+                stats = self._stats.get(fingerprint)
+            if stats is None:
+                self._stats[fingerprint] = _ErrorStats(count=1, first_seen=now, last_seen=now, window_start=now)
+                return LOG_FULL
+            stats.count += 1
+            quiet = now - stats.last_seen >= self.interval_seconds and stats.suppressed == 0
+            stats.last_seen = now
+            if quiet:
+                stats.window_start = now
+                return LOG_FULL
+            stats.suppressed += 1
+            return SUPPRESS
+
+    def due_summaries(self) -> List[Tuple[Fingerprint, int, float]]:
+        """Huellas con repeticiones suprimidas cuya ventana terminó: (huella, repeticiones, segundos)"""
+        now = self.clock()
+        due = []
+        with self._lock:
+            for fingerprint, stats in self._stats.items():
+                elapsed = now - stats.window_start
+                if stats.suppressed and elapsed >= self.interval_seconds:
+                    due.append((fingerprint, stats.suppressed, elapsed))
+                    stats.suppressed = 0
+                    stats.window_start = now
+        return due
+
+    def start(self, emit: Callable[[Fingerprint, int, float], None]) -> None:
+        """Arrancar (una vez) el thread que emite los resúmenes al cumplirse cada ventana"""
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = stopping = threading.Event()
+        threading.Thread(target=self._sweep, args=(emit, stopping), name="error-log-summaries", daemon=True).start()
+
+    def stop(self, emit: Optional[Callable[[Fingerprint, int, float], None]] = None) -> None:
+        """Detener el thread y emitir los resúmenes pendientes aunque la ventana no haya terminado"""
+        with self._lock:
+            if self._sweeper is not None:
+                self._sweeper.set()
+                self._sweeper = None
+        if emit is None:
+            return
+        with self._lock:
+            pending = [(fingerprint, stats.suppressed, self.clock() - stats.window_start)
+                       for fingerprint, stats in self._stats.items() if stats.suppressed]
+            for stats in self._stats.values():
+                stats.suppressed = 0
+        for fingerprint, repeated, seconds in pending:
+            emit(fingerprint, repeated, seconds)
+
+    def _sweep(self, emit: Callable[[Fingerprint, int, float], None], stopping: threading.Event) -> None:
+        while not stopping.wait(min(self.interval_seconds, 5.0)):
+            for fingerprint, repeated, seconds in self.due_summaries():
+                emit(fingerprint, repeated, seconds)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Contadores por huella, de más a menos frecuente"""
+        now = self.clock()
+        with self._lock:
+            rows = [
+                {
+                    "error_type": fingerprint[0],
+                    "operation": fingerprint[1],
+                    "count": stats.count,
+                    "suppressed": stats.suppressed,
+                    "first_seen_seconds_ago": round(now - stats.first_seen, 3),
+                    "last_seen_seconds_ago": round(now - stats.last_seen, 3),
+                }
+                for fingerprint, stats in self._stats.items()
+            ]
+        rows.sort(key=lambda row: row["count"], reverse=True)
+        return rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
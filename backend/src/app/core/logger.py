@@ -1,48 +1,232 @@
 """
 Sistema de logging técnico para la aplicación
 Configura logging estructurado con contexto de UUID
+
+Los threads de las peticiones no escriben en stdout: los registros se
+encolan en una cola acotada (QueueHandler) y un QueueListener los formatea
+y escribe desde su propio thread. Si la cola se llena, LOG_OVERFLOW decide
+si se descartan (drop, contados en logging_stats) o si se espera (block).
+El mensaje (msg % args) se construye en el listener, no en la petición.
+
+Dentro de una petición HTTP (LOG_REQUEST_EVENTS) los helpers log_* no
+escriben una línea por capa: anotan tiempos, ID de la marca y errores en el
+RequestContext, y el middleware emite un único registro JSON por petición en
+request_logger. LOG_LAYER_LINES=true recupera además las líneas por capa.
+
+Los errores pasan por error_limiter: la primera aparición de cada huella
+(tipo de excepción, operación) se registra completa, con la traza, y las
+repeticiones se resumen cada ERROR_LOG_INTERVAL_SECONDS.
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
-from typing import Optional
-from datetime import datetime
+import threading
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, TextIO
+
+from app.config import settings
+from app.core.error_limiter import ErrorLogLimiter, Fingerprint, LOG_FULL
+from app.core.request_context import RequestContext, current_request
+
+OVERFLOW_POLICIES = ("drop", "block")
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler sobre una cola acotada con política de desbordamiento
+
+    Args:
+        log_queue: cola acotada compartida con el listener
+        target: handler que escribe los registros (en el thread del listener)
+        overflow: "drop" descarta el registro con la cola llena; "block" espera
+    """
+
+    def __init__(self, log_queue: queue.Queue, target: logging.Handler, overflow: str = "drop"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid log overflow policy: {overflow}")
+        super().__init__(log_queue)
+        self.target = target
+        self.overflow = overflow
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._listener = _Listener(log_queue, target, respect_handler_level=True)
+        self._running = False
+
+    def start(self) -> None:
+        if not self._running:
+            self._listener.start()
+            self._running = True
+
+    def stop(self) -> None:
+        """Vaciar la cola y volver a escribir directamente (parada del proceso)"""
+        if self._running:
+            self._running = False
+            self._listener.stop()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formato diferido: el listener resuelve msg % args y la traza
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not self._running:
+            self.target.handle(record)
+            return
+        super().emit(record)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "overflow": self.overflow,
+            "dropped": self.dropped,
+        }
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # La cola puede estar llena al parar: esperar a que el thread haga sitio
+        self.queue.put(self._sentinel)
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler sobre el sys.stdout vigente en cada escritura (sobrevive a redirecciones)"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+# Handlers con cola activos por logger (se vacían al salir del proceso)
+_queue_handlers: Dict[str, BoundedQueueHandler] = {}
 
 # Configurar el logger principal
-def setup_logger(name: str = "app_logger", level: str = "INFO") -> logging.Logger:
-    """Configurar el logger principal de la aplicación"""
-    
+def setup_logger(
+    name: str = "app_logger",
+    level: str = settings.LOG_LEVEL,
+    queue_size: int = settings.LOG_QUEUE_SIZE,
+    overflow: str = settings.LOG_OVERFLOW,
+    stream: Optional[TextIO] = None,
+    formatter: Optional[logging.Formatter] = None,
+) -> logging.Logger:
+    """
+    Configurar el logger principal de la aplicación
+
+    Con queue_size > 0 la escritura se hace en un thread aparte a través de
+    una cola acotada; con 0 se escribe directamente (síncrono)
+    """
+
     # Crear logger
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
-    
+
     # Evitar duplicar handlers
     if not logger.handlers:
         # Handler para consola
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = logging.StreamHandler(stream) if stream is not None else _StdoutHandler()
         console_handler.setLevel(logging.INFO)
-        
+
         # Formato estructurado
-        formatter = logging.Formatter(
+        formatter = formatter or logging.Formatter(
             "[%(asctime)s] [%(levelname)s] [%(name)s] [%(uuid)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
+            datefmt="%Y-%m-%d %H:%M:%S",
+            defaults={"uuid": "N/A"},
         )
         console_handler.setFormatter(formatter)
-        
-        # Agregar handler
-        logger.addHandler(console_handler)
-        
+
+        # Agregar handler (detrás de la cola si está activada)
+        if queue_size > 0:
+            handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), console_handler, overflow)
+            handler.start()
+            _queue_handlers[name] = handler
+            logger.addHandler(handler)
+        else:
+            logger.addHandler(console_handler)
+
         # Configurar propagación
         logger.propagate = False
-    
+
     return logger
 
+def stop_logging() -> None:
+    """Escribir los registros pendientes y detener los threads de logging"""
+    error_limiter.stop(_log_error_summary)
+    for handler in _queue_handlers.values():
+        handler.stop()
+
+def logging_stats() -> Dict[str, Any]:
+    """Estado de las colas de logging (registros en cola y descartados)"""
+    return {name: handler.stats() for name, handler in _queue_handlers.items()}
+
+atexit.register(stop_logging)
+
+class JSONEventFormatter(logging.Formatter):
+    """Una línea JSON por registro cuyo msg es un dict (se serializa en el listener)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {"timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"), "level": record.levelname}
+        event.update(record.msg if isinstance(record.msg, dict) else {"message": record.getMessage()})
+        return json.dumps(event, default=str, ensure_ascii=False, separators=(",", ":"))
+
 # Logger principal
 app_logger = setup_logger()
 
+# Un registro JSON por petición HTTP
+request_logger = setup_logger("request_logger", formatter=JSONEventFormatter())
+
+# Deduplicación de errores repetidos (contadores en GET /admin/errors)
+error_limiter = ErrorLogLimiter(
+    interval_seconds=settings.ERROR_LOG_INTERVAL_SECONDS,
+    max_fingerprints=settings.ERROR_LOG_MAX_FINGERPRINTS,
+)
+
+def _log_error_summary(fingerprint: Fingerprint, repeated: int, seconds: float) -> None:
+    error_type, operation = fingerprint
+    _log(logging.ERROR, None, "%s in %s repeated %d times in the last %.0f s", (error_type, operation, repeated, seconds), {})
+
+def _should_log_error(fingerprint: Fingerprint) -> bool:
+    """Primera aparición (o tras una ventana sin repeticiones): registrar completa"""
+    if error_limiter.record(fingerprint) == LOG_FULL:
+        return True
+    error_limiter.start(_log_error_summary)
+    return False
+
+def log_request_event(context: RequestContext) -> None:
+    """
+    Emitir el registro de la petición (ERROR si terminó con error del servidor)
+
+    Se emite siempre, también en errores repetidos: es el único registro de la
+    petición. La deduplicación solo se aplica a las líneas por capa y de excepción.
+    """
+    level = logging.ERROR if context.outcome == "error" else logging.INFO
+    if request_logger.isEnabledFor(level):
+        request_logger.handle(
+            request_logger.makeRecord(request_logger.name, level, "(unknown file)", 0, context.to_event(), (), None)
+        )
+
+def _layer_lines(context: Optional[RequestContext]) -> bool:
+    """Emitir las líneas por capa: fuera de una petición o en modo depuración"""
+    return context is None or settings.LOG_LAYER_LINES
+
 class UUIDLogAdapter(logging.LoggerAdapter):
     """Adapter para logging con contexto de UUID"""
-    
+
     def process(self, msg, kwargs):
         """Procesar mensaje agregando UUID al contexto"""
         extra = kwargs.get('extra', {})
@@ -51,51 +235,86 @@ class UUIDLogAdapter(logging.LoggerAdapter):
         kwargs['extra'] = extra
         return msg, kwargs
 
+@lru_cache(maxsize=1024)
+def _cached_adapter(uuid: str, logger_name: str) -> UUIDLogAdapter:
+    return UUIDLogAdapter(logging.getLogger(logger_name), {"uuid": uuid})
+
 def get_logger_with_uuid(uuid: Optional[str] = None, logger_name: str = "app_logger") -> UUIDLogAdapter:
     """
-    Obtener logger con contexto de UUID
-    
+    Obtener logger con contexto de UUID (adapters reutilizados)
+
     Args:
         uuid: UUID de la entidad para trazabilidad
         logger_name: Nombre del logger a usar
-    
+
     Returns:
         Logger con contexto de UUID
     """
-    base_logger = logging.getLogger(logger_name)
-    return UUIDLogAdapter(base_logger, {"uuid": str(uuid) if uuid else "N/A"})
+    return _cached_adapter(str(uuid) if uuid else "N/A", logger_name)
+
+def _log(level: int, entity_id: Optional[str], msg: str, args: tuple, extra: Dict[str, Any], exc_info=None) -> None:
+    """Registrar en app_logger sin adapter; no hace nada si el nivel está desactivado"""
+    if not app_logger.isEnabledFor(level):
+        return
+    extra["uuid"] = str(entity_id) if entity_id else "N/A"
+    # Sin findCaller (el formato no usa fichero ni línea): es la parte más cara del registro
+    app_logger.handle(app_logger.makeRecord(app_logger.name, level, "(unknown file)", 0, msg, args, exc_info, extra=extra))
 
 def log_operation_start(operation: str, entity_type: str, entity_id: Optional[str] = None, **kwargs):
     """Loggear inicio de operación"""
-    logger = get_logger_with_uuid(entity_id)
-    logger.info(f"Starting {operation} for {entity_type}", extra=kwargs)
+    context = current_request.get()
+    if context is not None:
+        context.start_operation(operation)
+    if _layer_lines(context):
+        _log(logging.INFO, entity_id, "Starting %s for %s", (operation, entity_type), kwargs)
 
 def log_operation_success(operation: str, entity_type: str, entity_id: Optional[str] = None, **kwargs):
     """Loggear éxito de operación"""
-    logger = get_logger_with_uuid(entity_id)
-    logger.info(f"Successfully completed {operation} for {entity_type}", extra=kwargs)
+    context = current_request.get()
+    if context is not None:
+        context.end_operation(operation)
+        context.note_entity(entity_id)
+    if _layer_lines(context):
+        _log(logging.INFO, entity_id, "Successfully completed %s for %s", (operation, entity_type), kwargs)
 
 def log_operation_error(operation: str, entity_type: str, entity_id: Optional[str] = None, error: str = None, **kwargs):
-    """Loggear error de operación"""
-    logger = get_logger_with_uuid(entity_id)
-    logger.error(f"Error in {operation} for {entity_type}: {error}", extra=kwargs)
+    """
+    Loggear error de operación
+
+    Llamado dentro de un bloque except, la huella usa el tipo de la excepción
+    en curso y la primera aparición incluye la traza; las repeticiones se
+    resumen (ver error_limiter)
+    """
+    exc_info = sys.exc_info()
+    error_type = exc_info[0].__name__ if exc_info[0] is not None else "Error"
+    context = current_request.get()
+    if context is not None:
+        context.end_operation(operation, error=error, error_type=error_type)
+        context.note_entity(entity_id)
+    if _layer_lines(context) and _should_log_error((error_type, operation)):
+        _log(logging.ERROR, entity_id, "Error in %s for %s: %s", (operation, entity_type, error), kwargs,
+             exc_info if exc_info[0] is not None else None)
+
+def _log_entity(level: int, entity_id: str, msg: str, entity_type: str, kwargs: Dict[str, Any], not_found: bool = False) -> None:
+    context = current_request.get()
+    if context is not None:
+        context.note_entity(entity_id)
+        context.not_found = context.not_found or not_found
+    if _layer_lines(context):
+        _log(level, entity_id, msg, (entity_type,), kwargs)
 
 def log_entity_created(entity_type: str, entity_id: str, **kwargs):
     """Loggear creación de entidad"""
-    logger = get_logger_with_uuid(entity_id)
-    logger.info(f"{entity_type} created successfully", extra=kwargs)
+    _log_entity(logging.INFO, entity_id, "%s created successfully", entity_type, kwargs)
 
 def log_entity_updated(entity_type: str, entity_id: str, **kwargs):
     """Loggear actualización de entidad"""
-    logger = get_logger_with_uuid(entity_id)
-    logger.info(f"{entity_type} updated successfully", extra=kwargs)
+    _log_entity(logging.INFO, entity_id, "%s updated successfully", entity_type, kwargs)
 
 def log_entity_deleted(entity_type: str, entity_id: str, **kwargs):
     """Loggear eliminación de entidad"""
-    logger = get_logger_with_uuid(entity_id)
-    logger.info(f"{entity_type} deleted successfully", extra=kwargs)
+    _log_entity(logging.INFO, entity_id, "%s deleted successfully", entity_type, kwargs)
 
 def log_entity_not_found(entity_type: str, entity_id: str, **kwargs):
     """Loggear entidad no encontrada"""
-    logger = get_logger_with_uuid(entity_id)
-    logger.warning(f"{entity_type} not found", extra=kwargs)
+    _log_entity(logging.WARNING, entity_id, "%s not found", entity_type, kwargs, not_found=True)
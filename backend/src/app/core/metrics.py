@@ -0,0 +1,537 @@
+"""
+Métricas en formato de texto de Prometheus sin servicios externos
+Cada métrica acumula sus valores en un fragmento por thread, de modo que
+actualizarla no toma ningún lock (solo el primer uso desde un thread nuevo);
+los fragmentos se suman al exportar. Las métricas que ya mantiene otro
+componente (contadores de la caché, GC, memoria) se leen con callbacks en el
+momento de exportar.
+
+Con varios workers de uvicorn (METRICS_DIR), cada proceso vuelca su
+instantánea a METRICS_DIR/metrics-<pid>.json cada METRICS_FLUSH_SECONDS y
+/metrics suma las de todos: contadores e histogramas de todos los procesos
+(también de los que terminaron, para que no retrocedan) y gauges solo de los
+procesos vivos, sumados o con una etiqueta pid según la métrica. Al arrancar,
+cada worker incorpora a su instantánea los contadores de los procesos muertos
+y borra sus archivos, para que un PID reutilizado no los sobrescriba.
+"""
+
+import bisect
+import functools
+import gc
+import glob
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.config import settings
+
+try:
+    import resource
+except ImportError:  # Windows: sin getrusage no se exportan memoria ni CPU del proceso
+    resource = None
+
+Labels = Tuple[str, ...]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Buckets (segundos) de latencia de petición y de operación (los de prometheus_client)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+# Buckets (segundos) de sentencias SQL y esperas del pool
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Cómo se combinan los gauges de varios procesos
+GAUGE_SUM = "sum"
+GAUGE_PID = "pid"
+
+class _Metric:
+    """Base: nombre, etiquetas y fragmentos por thread"""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Dict[Labels, Any]] = []
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], Dict[Labels, float]]] = []
+
+    def _shard(self) -> Dict[Labels, Any]:
+        """Fragmento del thread actual (se registra en el primer uso)"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: Dict[Labels, Any] = {}
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def add_callback(self, callback: Callable[[], Dict[Labels, float]]) -> None:
+        """Valores leídos al exportar ({etiquetas: valor}); se suman a los acumulados"""
+        self._callbacks.append(callback)
+
+    def collect(self) -> Dict[Labels, Any]:
+        """Valores de este proceso por combinación de etiquetas"""
+        with self._lock:
+            shards = [shard.copy() for shard in self._shards]
+        values: Dict[Labels, Any] = {}
+        for shard in shards:
+            for labels, value in shard.items():
+                values[labels] = self._merge(values.get(labels), value)
+        for callback in self._callbacks:
+            for labels, value in callback().items():
+                values[labels] = self._merge(values.get(labels), value)
+        return values
+
+    @staticmethod
+    def _merge(current: Any, value: Any) -> Any:
+        return value if current is None else current + value
+
+    def reset(self) -> None:
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+class Counter(_Metric):
+    """Contador monótono"""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+class Gauge(_Metric):
+    """
+    Valor que sube y baja
+
+    Args:
+        multiprocess_mode: GAUGE_SUM (suma de los procesos vivos) o GAUGE_PID
+            (una serie por proceso vivo con la etiqueta pid)
+    """
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), multiprocess_mode: str = GAUGE_SUM):
+        super().__init__(name, documentation, labelnames)
+        self.multiprocess_mode = multiprocess_mode
+
+    def inc(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        self.inc(-amount, labels)
+
+class Histogram(_Metric):
+    """Histograma con buckets fijos; cada serie es [conteos por bucket..., +Inf, suma]"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            series = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    @staticmethod
+    def _merge(current: Any, value: Any) -> Any:
+        if current is None:
+            return list(value)
+        return [a + b for a, b in zip(current, value, strict=False)]
+
+    def time(self, labels: Labels = ()) -> "_Timer":
+        """Context manager que observa la duración del bloque"""
+        return _Timer(self, labels)
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: Labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, self.labels)
+
+if os.name == "nt":
+    import ctypes
+
+    # En Windows os.kill(pid, 0) termina el proceso: se consulta su código de salida
+    _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    _STILL_ACTIVE = 259
+
+    def _pid_alive(pid: int) -> bool:
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return False
+            return exit_code.value == _STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+else:
+    def _pid_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values, strict=False)) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class MetricsRegistry:
+    """
+    Conjunto de métricas de la aplicación y su exportación
+
+    Args:
+        directory: directorio compartido por los workers (None: solo este proceso)
+        flush_seconds: cada cuánto vuelca este proceso su instantánea al directorio
+    """
+
+    def __init__(self, directory: Optional[str] = None, flush_seconds: float = 5.0):
+        self.directory = directory or None
+        self.flush_seconds = flush_seconds
+        self._metrics: Dict[str, _Metric] = {}
+        self._flusher: Optional[threading.Event] = None
+        self._lock = threading.Lock()
+        # Contadores e histogramas heredados de procesos que terminaron
+        self._retired: Dict[str, Dict[str, Any]] = {}
+        self._written = False
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicated metric: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), multiprocess_mode: str = GAUGE_SUM) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, multiprocess_mode))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self) -> None:
+        """Vaciar los valores acumulados (los callbacks siguen leyendo su fuente)"""
+        for metric in self._metrics.values():
+            metric.reset()
+
+    # Instantáneas y varios procesos
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Valores de este proceso serializables en JSON ({métrica: {etiquetas JSON: valor}})"""
+        snapshot = {
+            name: {json.dumps(labels): value for labels, value in metric.collect().items()}
+            for name, metric in self._metrics.items()
+        }
+        for name, series in self._retired.items():
+            self._merge_series(snapshot.setdefault(name, {}), self._metrics[name], series)
+        return snapshot
+
+    @staticmethod
+    def _merge_series(target: Dict[str, Any], metric: _Metric, series: Dict[str, Any]) -> None:
+        for key, value in series.items():
+            target[key] = metric._merge(target.get(key), value)
+
+    def _snapshot_path(self, pid: int) -> str:
+        return os.path.join(self.directory, f"metrics-{pid}.json")
+
+    def write_snapshot(self) -> None:
+        """Volcar la instantánea de este proceso (escritura atómica con os.replace)"""
+        if self.directory is None:
+            return
+        path = self._snapshot_path(os.getpid())
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(temporary, path)
+        self._written = True
+
+    def _snapshot_files(self) -> Iterable[Tuple[int, str]]:
+        """(pid, ruta) de las instantáneas del directorio"""
+        for path in glob.glob(os.path.join(self.directory, "metrics-*.json")):
+            try:
+                yield int(os.path.basename(path)[len("metrics-"):-len(".json")]), path
+            except ValueError:
+                continue
+
+    def absorb_dead_snapshots(self) -> None:
+        """
+        Incorporar los contadores e histogramas de los procesos muertos y borrar sus archivos
+
+        Cada archivo se reclama renombrándolo, así que con varios workers
+        arrancando a la vez solo uno lo suma. El archivo con el PID propio es de
+        un proceso anterior que tuvo el mismo PID si este aún no ha volcado nada.
+        """
+        if self.directory is None:
+            return
+        own_pid = os.getpid()
+        claimed = []
+        for pid, path in list(self._snapshot_files()):
+            if pid == own_pid:
+                if self._written:
+                    continue
+            elif _pid_alive(pid):
+                continue
+            claim = os.path.join(self.directory, f"retired-{own_pid}-{pid}.json")
+            try:
+                os.rename(path, claim)
+            except OSError:
+                continue
+            claimed.append(claim)
+            try:
+                with open(claim, encoding="utf-8") as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for name, series in snapshot.items():
+                metric = self._metrics.get(name)
+                if metric is None or isinstance(metric, Gauge):
+                    continue
+                self._merge_series(self._retired.setdefault(name, {}), metric, series)
+        if not claimed:
+            return
+        # Primero la instantánea con lo heredado y después el borrado: nada retrocede
+        self.write_snapshot()
+        for claim in claimed:
+            try:
+                os.remove(claim)
+            except OSError:
+                pass
+
+    def _process_snapshots(self) -> Iterable[Tuple[int, bool, Dict[str, Dict[str, Any]]]]:
+        """(pid, vivo, instantánea) de cada proceso; la de este proceso se lee en memoria"""
+        own_pid = os.getpid()
+        yield own_pid, True, self.snapshot()
+        if self.directory is None:
+            return
+        for pid, path in self._snapshot_files():
+            if pid == own_pid:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+            yield pid, _pid_alive(pid), snapshot
+
+    def start(self) -> None:
+        """Arrancar (una vez) el thread que vuelca la instantánea periódicamente"""
+        if self.directory is None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = stopping = threading.Event()
+        os.makedirs(self.directory, exist_ok=True)
+        self.absorb_dead_snapshots()
+        threading.Thread(target=self._flush_loop, args=(stopping,), name="metrics-flush", daemon=True).start()
+
+    def stop(self) -> None:
+        """Detener el thread y volcar la última instantánea"""
+        with self._lock:
+            if self._flusher is not None:
+                self._flusher.set()
+                self._flusher = None
+        self.write_snapshot()
+
+    def _flush_loop(self, stopping: threading.Event) -> None:
+        while not stopping.wait(self.flush_seconds):
+            self.write_snapshot()
+
+    # Exportación
+
+    def render(self) -> str:
+        """Todas las métricas en formato de texto de Prometheus (0.0.4)"""
+        merged: Dict[str, Dict[Labels, Any]] = {name: {} for name in self._metrics}
+        for pid, alive, snapshot in self._process_snapshots():
+            for name, series in snapshot.items():
+                metric = self._metrics.get(name)
+                if metric is None:
+                    continue
+                if isinstance(metric, Gauge):
+                    if not alive:
+                        continue
+                    pid_label = (str(pid),) if metric.multiprocess_mode == GAUGE_PID else ()
+                else:
+                    pid_label = ()
+                target = merged[name]
+                for key, value in series.items():
+                    labels = tuple(json.loads(key)) + pid_label
+                    target[labels] = metric._merge(target.get(labels), value)
+
+        lines: List[str] = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            labelnames = metric.labelnames
+            if isinstance(metric, Gauge) and metric.multiprocess_mode == GAUGE_PID:
+                labelnames = labelnames + ("pid",)
+            for labels, value in sorted(merged[name].items()):
+                if isinstance(metric, Histogram):
+                    cumulative = 0
+                    for bound, count in zip(metric.buckets + (float("inf"),), value[:-1], strict=False):
+                        cumulative += count
+                        bucket_labels = _format_labels(labelnames + ("le",), labels + (_format_value(bound),))
+                        lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                    series_labels = _format_labels(labelnames, labels)
+                    lines.append(f"{name}_sum{series_labels} {_format_value(value[-1])}")
+                    lines.append(f"{name}_count{series_labels} {cumulative}")
+                else:
+                    lines.append(f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+def timed_operations(histogram: Histogram) -> Callable[[type], type]:
+    """
+    Decorador de clase: observa la duración de cada método público en
+    `histogram` con las etiquetas (operación, resultado)
+
+    Los métodos async se miden hasta que termina la corrutina y los
+    generadores hasta que se agotan (resultado "cancelled" si se cierran antes).
+    """
+
+    def wrap(function: Callable) -> Callable:
+        operation = function.__name__
+        success, error, cancelled = (operation, "success"), (operation, "error"), (operation, "cancelled")
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def timed(*args, **kwargs):
+                start = time.perf_counter()
+                labels = error
+                try:
+                    result = await function(*args, **kwargs)
+                    labels = success
+                    return result
+                finally:
+                    histogram.observe(time.perf_counter() - start, labels)
+        elif inspect.isgeneratorfunction(function):
+            @functools.wraps(function)
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                labels = error
+                try:
+                    yield from function(*args, **kwargs)
+                    labels = success
+                except GeneratorExit:
+                    labels = cancelled
+                    raise
+                finally:
+                    histogram.observe(time.perf_counter() - start, labels)
+        else:
+            @functools.wraps(function)
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                labels = error
+                try:
+                    result = function(*args, **kwargs)
+                    labels = success
+                    return result
+                finally:
+                    histogram.observe(time.perf_counter() - start, labels)
+        return timed
+
+    def decorate(cls: type) -> type:
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(attribute):
+                setattr(cls, name, wrap(attribute))
+        return cls
+
+    return decorate
+
+# Registro de la aplicación
+registry = MetricsRegistry(settings.METRICS_DIR, settings.METRICS_FLUSH_SECONDS)
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds", "Duración de las peticiones HTTP", ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_PROGRESS = registry.gauge(
+    "http_requests_in_progress", "Peticiones HTTP en curso", ("method",),
+)
+USE_CASE_SECONDS = registry.histogram(
+    "brand_use_case_duration_seconds", "Duración de las operaciones de BrandUseCase", ("operation", "outcome"),
+)
+DB_STATEMENT_SECONDS = registry.histogram(
+    "db_statement_duration_seconds", "Duración de las sentencias SQL por tipo", ("statement",), buckets=DB_BUCKETS,
+)
+DB_POOL_CHECKOUT_SECONDS = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Espera para obtener una conexión del pool", buckets=DB_BUCKETS,
+)
+DB_POOL_TIMEOUTS = registry.counter(
+    "db_pool_checkout_timeouts_total", "Checkouts del pool que agotaron pool_timeout",
+)
+CACHE_LOOKUPS = registry.counter(
+    "brand_cache_lookups_total", "Consultas a las cachés de marcas por resultado", ("cache", "result"),
+)
+PROCESS_MEMORY_BYTES = registry.gauge(
+    "process_resident_memory_bytes", "Memoria residente del proceso", multiprocess_mode=GAUGE_PID,
+)
+PROCESS_CPU_SECONDS = registry.counter(
+    "process_cpu_seconds_total", "Tiempo de CPU (usuario + sistema) del proceso",
+)
+GC_COLLECTIONS = registry.counter(
+    "python_gc_collections_total", "Recolecciones del GC por generación", ("generation",),
+)
+GC_OBJECTS_COLLECTED = registry.counter(
+    "python_gc_objects_collected_total", "Objetos recolectados por el GC por generación", ("generation",),
+)
+GC_OBJECTS_TRACKED = registry.gauge(
+    "python_gc_objects_tracked", "Objetos pendientes en cada generación del GC", ("generation",), multiprocess_mode=GAUGE_PID,
+)
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+def _resident_memory() -> Dict[Labels, float]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return {(): float(int(f.read().split()[1]) * _PAGE_SIZE)}
+    except (OSError, IndexError, ValueError):
+        # Sin /proc (macOS): máximo de memoria residente (ru_maxrss en bytes allí)
+        return {(): float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)}
+
+def _cpu_seconds() -> Dict[Labels, float]:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return {(): usage.ru_utime + usage.ru_stime}
+
+if resource is not None:
+    PROCESS_MEMORY_BYTES.add_callback(_resident_memory)
+    PROCESS_CPU_SECONDS.add_callback(_cpu_seconds)
+GC_COLLECTIONS.add_callback(lambda: {(str(generation),): float(stats["collections"]) for generation, stats in enumerate(gc.get_stats())})
+GC_OBJECTS_COLLECTED.add_callback(lambda: {(str(generation),): float(stats["collected"]) for generation, stats in enumerate(gc.get_stats())})
+GC_OBJECTS_TRACKED.add_callback(lambda: {(str(generation),): float(count) for generation, count in enumerate(gc.get_count())})
@@ -0,0 +1,38 @@
+"""
+Utilidades de paginación por cursor (keyset)
+El cursor es opaco para el cliente: codifica el orden solicitado y la clave
+de orden (valor del campo, id) de la última fila entregada.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+from uuid import UUID
+
+DEFAULT_SORT = "created_at"
+
+def encode_cursor(value: Any, brand_id: UUID, sort: str = DEFAULT_SORT) -> str:
+    """Codificar la clave de orden de una fila en un cursor opaco"""
+    payload = {"s": sort, "v": value, "i": str(brand_id)}
+    if isinstance(value, datetime):
+        payload.update(v=value.isoformat(), d=1)
+    raw = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, sort: str = DEFAULT_SORT) -> Tuple[Any, UUID]:
+    """
+    Decodificar un cursor opaco a su clave de orden
+
+    Raises:
+        ValueError: si el cursor no es válido o se generó con otro orden
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload["s"] != sort:
+            raise ValueError("cursor sort mismatch")
+        value = datetime.fromisoformat(payload["v"]) if payload.get("d") else payload["v"]
+        return value, UUID(payload["i"])
+    except (ValueError, KeyError, TypeError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,85 @@
+"""
+Contexto de petición para el logging de "wide events"
+Cada petición HTTP lleva un RequestContext en una contextvar (se copia al
+threadpool de las rutas síncronas, así que todas las capas ven el mismo
+objeto). Las capas anotan en él sus tiempos, el ID de la marca, las
+sentencias SQL y los errores, y al terminar la petición se emite un único
+registro JSON con todo ello.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+@dataclass
+class RequestContext:
+    """Datos acumulados durante una petición"""
+    request_id: str
+    method: str = ""
+    path: str = ""
+    route: Optional[str] = None
+    brand_id: Optional[str] = None
+    status: Optional[int] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    not_found: bool = False
+    trace_id: Optional[str] = None
+    db_statements: int = 0
+    db_time_ms: float = 0.0
+    started: float = field(default_factory=time.perf_counter)
+    # Milisegundos acumulados por operación (una por capa: create_brand, create, ...)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+    _operation_starts: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    def start_operation(self, operation: str) -> None:
+        self._operation_starts[operation] = time.perf_counter()
+
+    def end_operation(self, operation: str, error: Optional[str] = None, error_type: Optional[str] = None) -> None:
+        started = self._operation_starts.pop(operation, None)
+        if started is not None:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.timings_ms[operation] = self.timings_ms.get(operation, 0.0) + elapsed
+        if error is not None and self.error is None:
+            # Se guarda el error más interno (el primero que se anota)
+            self.error = f"{operation}: {error}"
+            self.error_type = error_type
+
+    def note_entity(self, entity_id: Any) -> None:
+        if entity_id is not None and self.brand_id is None:
+            self.brand_id = str(entity_id)
+
+    def note_statement(self, duration_ms: float) -> None:
+        self.db_statements += 1
+        self.db_time_ms += duration_ms
+
+    @property
+    def outcome(self) -> str:
+        if self.status is None or self.status >= 500:
+            return "error"
+        if self.status >= 400:
+            return "client_error"
+        return "success"
+
+    def to_event(self) -> Dict[str, Any]:
+        """Registro estructurado de la petición"""
+        return {
+            "request_id": self.request_id,
+            "trace_id": self.trace_id,
+            "method": self.method,
+            "route": self.route or self.path,
+            "path": self.path,
+            "status": self.status,
+            "outcome": self.outcome,
+            "duration_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "brand_id": self.brand_id,
+            "not_found": self.not_found,
+            "db_statements": self.db_statements,
+            "db_time_ms": round(self.db_time_ms, 3),
+            "timings_ms": {operation: round(ms, 3) for operation, ms in self.timings_ms.items()},
+            "error": self.error,
+            "error_type": self.error_type,
+        }
+
+# Contexto de la petición en curso (None fuera de una petición)
+current_request: ContextVar[Optional[RequestContext]] = ContextVar("current_request", default=None)
@@ -0,0 +1,494 @@
+"""
+Trazas distribuidas sin dependencias externas
+Spans para la ruta HTTP, cada método de BrandUseCase, cada llamada a un
+BrandPort y cada sentencia SQL, con propagación W3C `traceparent`.
+
+El muestreo se decide una vez en la raíz (TRACING_SAMPLE_RATE, o el flag
+sampled del `traceparent` entrante) y lo heredan todos los hijos: en una
+traza no muestreada el span actual no se registra y los decoradores solo
+leen una contextvar antes de llamar a la función. Los spans terminados pasan
+a un procesador (síncrono o por lotes en un thread con cola acotada) que los
+entrega a un exportador intercambiable: en memoria o fichero OTLP/JSON.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from app.config import settings
+
+# Tipos de span (valores de SpanKind en OTLP)
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+# Estados de span (valores de Status.code en OTLP)
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_SAMPLED_FLAG = 0x01
+
+class SpanContext:
+    """Identificadores de un span y si su traza se muestrea"""
+
+    __slots__ = ("trace_id", "span_id", "sampled")
+
+    def __init__(self, trace_id: int, span_id: int, sampled: bool = True):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+    def traceparent(self) -> str:
+        """Cabecera W3C traceparent de este contexto"""
+        return f"00-{self.trace_id:032x}-{self.span_id:016x}-{_SAMPLED_FLAG if self.sampled else 0:02x}"
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """Contexto remoto de una cabecera traceparent, o None si falta o no es válida"""
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None:
+        return None
+    version, trace_id, span_id, flags = match.groups()
+    if version == "ff" or int(trace_id, 16) == 0 or int(span_id, 16) == 0:
+        return None
+    return SpanContext(int(trace_id, 16), int(span_id, 16), bool(int(flags, 16) & _SAMPLED_FLAG))
+
+class Span:
+    """Operación medida dentro de una traza; como context manager es el span actual"""
+
+    __slots__ = (
+        "name", "context", "parent_span_id", "kind", "start_ns", "end_ns",
+        "attributes", "status", "status_message", "events", "_tracer", "_token",
+    )
+
+    recording = True
+
+    def __init__(self, tracer: "Tracer", name: str, context: SpanContext, parent_span_id: Optional[int],
+                 kind: int = KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.context = context
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self.events: List[Dict[str, Any]] = []
+        self._tracer = tracer
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = message
+
+    def record_exception(self, error: BaseException) -> None:
+        """Evento `exception` y estado de error"""
+        self.events.append({
+            "name": "exception",
+            "time_ns": time.time_ns(),
+            "attributes": {"exception.type": type(error).__name__, "exception.message": str(error)},
+        })
+        self.set_error(f"{type(error).__name__}: {error}")
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self._tracer.processor.on_end(self)
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, error, traceback) -> None:
+        _current_span.reset(self._token)
+        if error is not None:
+            self.record_exception(error)
+        self.end()
+
+class _NonRecordingSpan:
+    """Span de una traza no muestreada: no se registra y sus hijos tampoco"""
+
+    __slots__ = ("_token",)
+
+    recording = False
+    context = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+    def record_exception(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NonRecordingSpan":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, error, traceback) -> None:
+        _current_span.reset(self._token)
+
+AnySpan = Union[Span, _NonRecordingSpan]
+
+# Span actual (None fuera de una traza)
+_current_span: ContextVar[Optional[AnySpan]] = ContextVar("current_span", default=None)
+
+def current_span() -> Optional[AnySpan]:
+    return _current_span.get()
+
+# Exportadores
+
+class SpanExporter(ABC):
+    """Destino de los spans terminados"""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        """Liberar los recursos del exportador al parar el tracer (por defecto, ninguno)"""
+        return None
+
+class InMemorySpanExporter(SpanExporter):
+    """Guarda los spans en una lista (tests y depuración)"""
+
+    def __init__(self):
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+def to_otlp(spans: Sequence[Span], service_name: str) -> Dict[str, Any]:
+    """ExportTraceServiceRequest de OTLP en su codificación JSON"""
+    otlp_spans = []
+    for span in spans:
+        otlp_span = {
+            "traceId": f"{span.context.trace_id:032x}",
+            "spanId": f"{span.context.span_id:016x}",
+            "name": span.name,
+            "kind": span.kind,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": _otlp_attributes(span.attributes),
+            "status": {"code": span.status, "message": span.status_message} if span.status else {},
+        }
+        if span.parent_span_id is not None:
+            otlp_span["parentSpanId"] = f"{span.parent_span_id:016x}"
+        if span.events:
+            otlp_span["events"] = [
+                {"name": event["name"], "timeUnixNano": str(event["time_ns"]), "attributes": _otlp_attributes(event["attributes"])}
+                for event in span.events
+            ]
+        otlp_spans.append(otlp_span)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+            "scopeSpans": [{"scope": {"name": "app.core.tracing"}, "spans": otlp_spans}],
+        }]
+    }
+
+class OtlpFileSpanExporter(SpanExporter):
+    """
+    Añade cada lote como una línea JSON (OTLP File Exporter): el fichero se
+    puede reenviar después a un collector (receptor otlpjsonfile) o leer a mano
+    """
+
+    def __init__(self, path: str, service_name: str = "brands-api"):
+        self.path = path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        line = json.dumps(to_otlp(spans, self.service_name), separators=(",", ":"))
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+# Procesadores
+
+class SimpleSpanProcessor:
+    """Exporta cada span al terminar, en el thread que lo termina"""
+
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    def on_end(self, span: Span) -> None:
+        self.exporter.export([span])
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"processor": "simple", "exporter": type(self.exporter).__name__}
+
+class BatchSpanProcessor:
+    """
+    Acumula los spans terminados y los exporta por lotes desde un thread; por
+    encima de `max_queue_size` se descartan y se cuentan (la petición nunca
+    espera al exportador)
+
+    La petición solo hace un append a un deque: el thread se despierta cada
+    `interval_seconds` o cuando se junta un lote completo, no por cada span.
+    """
+
+    def __init__(self, exporter: SpanExporter, max_queue_size: int = 2048, max_batch_size: int = 512, interval_seconds: float = 1.0):
+        self.exporter = exporter
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.interval_seconds = interval_seconds
+        self.dropped = 0
+        self._spans: "deque[Span]" = deque()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        if self._thread is None:
+            self._start()
+        pending = len(self._spans)
+        if pending >= self.max_queue_size:
+            self.dropped += 1
+            return
+        self._spans.append(span)
+        if pending + 1 == self.max_batch_size:
+            self._wake.set()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval_seconds)
+            self._wake.clear()
+            stopping = self._stopping
+            self._drain()
+            if stopping:
+                return
+
+    def _drain(self) -> None:
+        while self._spans:
+            batch = []
+            while self._spans and len(batch) < self.max_batch_size:
+                batch.append(self._spans.popleft())
+            try:
+                self.exporter.export(batch)
+            except Exception:
+                # Un exportador que falla no debe tumbar el thread; los spans del lote se pierden
+                self.dropped += len(batch)
+
+    def shutdown(self) -> None:
+        """Exportar lo pendiente y detener el thread"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopping = True
+            self._wake.set()
+            thread.join()
+        self._drain()
+        self.exporter.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "processor": "batch",
+            "exporter": type(self.exporter).__name__,
+            "queued": len(self._spans),
+            "capacity": self.max_queue_size,
+            "dropped": self.dropped,
+        }
+
+class _NoopProcessor:
+    def on_end(self, span: Span) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"processor": None}
+
+# Tracer
+
+class Tracer:
+    """
+    Crea spans y aplica el muestreo
+
+    Args:
+        enabled: sin trazas activas los decoradores y middlewares no hacen nada
+        sample_rate: fracción (0-1) de trazas raíz que se registran
+        processor: destino de los spans terminados
+    """
+
+    def __init__(self, enabled: bool = False, sample_rate: float = 1.0, processor=None):
+        self.processor = _NoopProcessor()
+        self.configure(enabled, sample_rate, processor)
+
+    def configure(self, enabled: bool, sample_rate: float = 1.0, processor=None) -> None:
+        """Cambiar la configuración (el procesador anterior se cierra)"""
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"Invalid tracing sample rate: {sample_rate}")
+        previous = self.processor
+        self.processor = processor or _NoopProcessor()
+        if previous is not self.processor:
+            previous.shutdown()
+        self.sample_rate = sample_rate
+        # Umbral sobre 64 bits aleatorios de la raíz (TraceIdRatioBased)
+        self._threshold = int(sample_rate * (1 << 64))
+        self.enabled = enabled
+
+    def start_span(
+        self,
+        name: str,
+        kind: int = KIND_INTERNAL,
+        parent: Union[AnySpan, SpanContext, None] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> AnySpan:
+        """
+        Nuevo span hijo de `parent` (por defecto el span actual)
+
+        Sin padre se decide el muestreo de una traza nueva; con un padre no
+        muestreado devuelve un span que no se registra. El span no pasa a ser
+        el actual hasta usarlo con `with`.
+        """
+        if parent is None:
+            parent = _current_span.get()
+        if isinstance(parent, Span):
+            parent = parent.context
+        if parent is None:
+            if random.getrandbits(64) >= self._threshold:
+                return _NonRecordingSpan()
+            return Span(self, name, SpanContext(random.getrandbits(128) or 1, _span_id()), None, kind, attributes)
+        if isinstance(parent, _NonRecordingSpan) or not parent.sampled:
+            return _NonRecordingSpan()
+        return Span(self, name, SpanContext(parent.trace_id, _span_id()), parent.span_id, kind, attributes)
+
+    def shutdown(self) -> None:
+        self.processor.shutdown()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled, "sample_rate": self.sample_rate, **self.processor.stats()}
+
+def _span_id() -> int:
+    return random.getrandbits(64) or 1
+
+def create_exporter(settings) -> SpanExporter:
+    """Exportador según TRACING_EXPORTER (memory | otlp-file)"""
+    if settings.TRACING_EXPORTER == "memory":
+        return InMemorySpanExporter()
+    if settings.TRACING_EXPORTER == "otlp-file":
+        return OtlpFileSpanExporter(settings.TRACING_OTLP_FILE, settings.TRACING_SERVICE_NAME)
+    raise ValueError(f"Invalid tracing exporter: {settings.TRACING_EXPORTER}")
+
+def create_tracer(settings) -> Tracer:
+    """Tracer del proceso a partir de Settings (sin procesador si está desactivado)"""
+    if not settings.TRACING_ENABLED:
+        return Tracer(enabled=False, sample_rate=settings.TRACING_SAMPLE_RATE)
+    processor = BatchSpanProcessor(create_exporter(settings), max_queue_size=settings.TRACING_QUEUE_SIZE)
+    return Tracer(enabled=True, sample_rate=settings.TRACING_SAMPLE_RATE, processor=processor)
+
+# Tracer del proceso
+tracer = create_tracer(settings)
+atexit.register(tracer.shutdown)
+
+def traced_operations(cls: type) -> type:
+    """
+    Decorador de clase: un span `Clase.método` por cada método público
+
+    En una traza no muestreada (o con el tracing desactivado) solo se
+    comprueba el span actual. Los métodos async se miden hasta que termina la
+    corrutina; los generadores, hasta que se agotan, sin pasar a ser el span
+    actual (sus pasos se ejecutan en el contexto de quien los consume).
+    """
+
+    def wrap(function: Callable) -> Callable:
+        name = f"{cls.__name__}.{function.__name__}"
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def traced(*args, **kwargs):
+                parent = _current_span.get()
+                if not tracer.enabled or (parent is not None and not parent.recording):
+                    return await function(*args, **kwargs)
+                with tracer.start_span(name, parent=parent):
+                    return await function(*args, **kwargs)
+        elif inspect.isgeneratorfunction(function):
+            @functools.wraps(function)
+            def traced(*args, **kwargs):
+                parent = _current_span.get()
+                if not tracer.enabled or (parent is not None and not parent.recording):
+                    yield from function(*args, **kwargs)
+                    return
+                span = tracer.start_span(name, parent=parent)
+                try:
+                    yield from function(*args, **kwargs)
+                except GeneratorExit:
+                    span.set_attribute("cancelled", True)
+                    raise
+                except Exception as e:
+                    span.record_exception(e)
+                    raise
+                finally:
+                    span.end()
+        else:
+            @functools.wraps(function)
+            def traced(*args, **kwargs):
+                parent = _current_span.get()
+                if not tracer.enabled or (parent is not None and not parent.recording):
+                    return function(*args, **kwargs)
+                with tracer.start_span(name, parent=parent):
+                    return function(*args, **kwargs)
+        return traced
+
+    for attribute_name, attribute in list(vars(cls).items()):
+        if not attribute_name.startswith("_") and inspect.isfunction(attribute):
+            setattr(cls, attribute_name, wrap(attribute))
+    return cls
@@ -3,38 +3,82 @@ from typing import Optional
 from datetime import datetime
 from uuid import UUID
 
-@dataclass(frozen=False)  # Cambiado a False para permitir actualizaciones
+@dataclass(slots=True)
 class Brand:
     id: Optional[UUID]
     name: str
     owner: str
     lang: str
     status: str = "Pendiente"
-    
+
     # Campos de auditoría y trazabilidad
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
-    
+
     def __post_init__(self):
-        """Inicializar campos de auditoría si no están establecidos"""
-        if self.created_at is None:
-            object.__setattr__(self, 'created_at', datetime.utcnow())
-        if self.updated_at is None:
-            object.__setattr__(self, 'updated_at', datetime.utcnow())
-    
+        """Inicializar campos de auditoría si no están establecidos (una sola lectura del reloj)"""
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.utcnow()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
+
+    @classmethod
+    def from_row(
+        cls,
+        id: UUID,
+        name: str,
+        owner: str,
+        lang: str,
+        status: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        deleted_at: Optional[datetime] = None,
+    ) -> "Brand":
+        """
+        Hidratar una marca ya persistida (fila de base de datos o caché)
+        Copia los valores tal cual: no aplica valores por defecto ni genera timestamps
+        """
+        brand = _new_brand(cls)
+        brand.id = id
+        brand.name = name
+        brand.owner = owner
+        brand.lang = lang
+        brand.status = status
+        brand.created_at = created_at
+        brand.updated_at = updated_at
+        brand.deleted_at = deleted_at
+        return brand
+
+    @classmethod
+    def partial(
+        cls,
+        id: UUID,
+        name: Optional[str] = None,
+        owner: Optional[str] = None,
+        lang: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> "Brand":
+        """Marca con solo los campos a actualizar; el resto queda en None (incluido status)"""
+        return cls.from_row(id, name, owner, lang, status)
+
     def mark_as_updated(self):
         """Marcar la entidad como actualizada"""
-        object.__setattr__(self, 'updated_at', datetime.utcnow())
-    
+        self.updated_at = datetime.utcnow()
+
     def mark_as_deleted(self):
         """Marcar la entidad como eliminada (soft delete)"""
-        object.__setattr__(self, 'deleted_at', datetime.utcnow())
-    
+        self.deleted_at = datetime.utcnow()
+
     def is_deleted(self) -> bool:
         """Verificar si la entidad está marcada como eliminada"""
         return self.deleted_at is not None
-    
+
     def is_active(self) -> bool:
         """Verificar si la entidad está activa"""
         return not self.is_deleted()
+
+# Reserva la instancia sin pasar por __init__/__post_init__
+_new_brand = object.__new__
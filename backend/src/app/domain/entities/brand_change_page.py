@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.domain.entities.brand import Brand
+
+@dataclass
+class BrandChangePage:
+    """
+    Página del feed de cambios: marcas creadas, actualizadas o eliminadas
+    (con deleted_at) en orden (updated_at, id). next_cursor siempre permite
+    seguir consultando; has_more indica que ya hay más cambios disponibles
+    """
+    items: List[Brand] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    has_more: bool = False
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Campos de la marca que se pueden leer por filas o columnas (orden de la tabla)
+BRAND_FIELDS = ("id", "name", "owner", "lang", "status", "created_at", "updated_at", "deleted_at")
+
+def check_fields(fields: Sequence[str]) -> Tuple[str, ...]:
+    """Validar los campos pedidos y devolverlos como tupla"""
+    fields = tuple(fields)
+    if not fields:
+        raise ValueError("At least one brand field is required")
+    unknown = [name for name in fields if name not in BRAND_FIELDS]
+    if unknown:
+        raise ValueError(f"Invalid brand fields: {', '.join(unknown)}")
+    return fields
+
+@dataclass
+class BrandColumns:
+    """Lote columnar de marcas: una lista de valores por campo, alineadas por posición"""
+    fields: Tuple[str, ...]
+    columns: Dict[str, List[Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_rows(cls, fields: Sequence[str], rows: Iterable[Tuple]) -> "BrandColumns":
+        """Transponer filas (tuplas en el orden de `fields`) a columnas"""
+        fields = check_fields(fields)
+        transposed = list(zip(*rows, strict=False))
+        if not transposed:
+            return cls(fields, {name: [] for name in fields})
+        return cls(fields, {name: list(values) for name, values in zip(fields, transposed, strict=False)})
+
+    def __len__(self) -> int:
+        return len(self.columns[self.fields[0]]) if self.fields else 0
+
+    def __getitem__(self, name: str) -> List[Any]:
+        return self.columns[name]
+
+    def rows(self) -> Iterator[Tuple]:
+        """Volver a recorrer el lote como filas"""
+        return zip(*(self.columns[name] for name in self.fields), strict=False)
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.domain.entities.brand import Brand
+
+# Tipos de evento de marcas
+BRAND_CREATED = "created"
+BRAND_UPDATED = "updated"
+BRAND_DELETED = "deleted"
+# Operaciones masivas: solo llevan el número de filas afectadas
+BRANDS_BULK_CREATED = "bulk_created"
+BRANDS_BULK_UPDATED = "bulk_updated"
+BRANDS_BULK_DELETED = "bulk_deleted"
+
+@dataclass
+class BrandEvent:
+    """Cambio confirmado sobre las marcas, publicado después del commit"""
+    type: str
+    brand_id: Optional[UUID] = None
+    brand: Optional[Brand] = None
+    count: Optional[int] = None
@@ -0,0 +1,19 @@
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Optional
+
+@dataclass(frozen=True)
+class BrandFilter:
+    """Criterios de filtrado sobre marcas activas (todos opcionales, combinados con AND)"""
+    status: Optional[str] = None
+    lang: Optional[str] = None
+    owner: Optional[str] = None
+    # Rangos de fechas: desde inclusivo, hasta exclusivo
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    updated_from: Optional[datetime] = None
+    updated_to: Optional[datetime] = None
+    
+    def is_empty(self) -> bool:
+        """Verificar si no se estableció ningún criterio"""
+        return all(getattr(self, f.name) is None for f in fields(self))
@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.domain.entities.brand import Brand
+
+@dataclass
+class BrandPage:
+    """Página de marcas obtenida por paginación de cursor"""
+    items: List[Brand] = field(default_factory=list)
+    next_cursor: Optional[str] = None
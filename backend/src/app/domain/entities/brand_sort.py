@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+# Claves de ordenación permitidas (cada una respaldada por un índice parcial con id como desempate)
+SORT_FIELDS = ("created_at", "updated_at", "name")
+
+@dataclass(frozen=True)
+class BrandSort:
+    """Orden del listado de marcas: campo permitido y sentido, siempre desempatado por id"""
+    field: str = "created_at"
+    descending: bool = False
+    
+    def __post_init__(self):
+        if self.field not in SORT_FIELDS:
+            raise ValueError(f"Invalid sort field: {self.field}")
+    
+    @classmethod
+    def parse(cls, value: str) -> "BrandSort":
+        """Crear el orden desde su forma textual ('name', '-created_at', ...)"""
+        return cls(field=value.lstrip("-"), descending=value.startswith("-"))
+    
+    def __str__(self) -> str:
+        return f"-{self.field}" if self.descending else self.field
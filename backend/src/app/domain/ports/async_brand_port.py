@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
+
+class AsyncBrandPort(ABC):
+    """Variante asíncrona de BrandPort para adaptadores sobre asyncio"""
+
+    @abstractmethod
+    async def get_all(self, filters: Optional[BrandFilter] = None, sort: Optional[BrandSort] = None) -> List[Brand]:
+        """Obtener todas las marcas activas que cumplen `filters`, en el orden `sort`"""
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[Any, UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+    ) -> List[Brand]:
+        """Obtener hasta `limit` marcas activas filtradas posteriores a la clave `after` (keyset)"""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, brand_id: UUID) -> Optional[Brand]:
+        """Obtener una marca por ID"""
+        pass
+
+    @abstractmethod
+    async def get_version(self, brand_id: UUID) -> Optional[datetime]:
+        """updated_at de una marca activa (o None), sin cargar la fila completa"""
+        pass
+
+    @abstractmethod
+    async def get_collection_version(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Versión barata de la colección: (último updated_at de activas, último deleted_at)"""
+        pass
+
+    @abstractmethod
+    async def create(self, brand: Brand) -> Brand:
+        """Crear una nueva marca"""
+        pass
+
+    @abstractmethod
+    async def update(self, brand_id: UUID, brand: Brand) -> Brand:
+        """Actualizar una marca existente"""
+        pass
+
+    @abstractmethod
+    async def delete(self, brand_id: UUID) -> None:
+        """Eliminar una marca (soft delete)"""
+        pass
+
+    @abstractmethod
+    async def hard_delete(self, brand_id: UUID) -> None:
+        """Eliminación física de una marca (solo para casos especiales)"""
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from app.domain.entities.brand_event import BrandEvent
+
+class BrandEventPort(ABC):
+    """Puerto para publicar los cambios de marcas a los suscriptores"""
+    
+    @abstractmethod
+    def publish(self, event: BrandEvent) -> None:
+        """
+        Publicar un evento ya confirmado en la base de datos
+
+        No debe bloquear ni lanzar excepciones: un fallo al notificar no
+        invalida la escritura
+        """
+        pass
@@ -1,12 +1,75 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
 from uuid import UUID
+from datetime import datetime
 
 class BrandPort(ABC):
     @abstractmethod
-    def get_all(self) -> List[Brand]:
-        """Obtener todas las marcas activas"""
+    def get_all(self, filters: Optional[BrandFilter] = None, sort: Optional[BrandSort] = None) -> List[Brand]:
+        """Obtener todas las marcas activas que cumplen `filters`, en el orden `sort` (por defecto created_at)"""
+        pass
+
+    @abstractmethod
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[Any, UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+    ) -> List[Brand]:
+        """
+        Obtener hasta `limit` marcas activas que cumplen `filters`, ordenadas por
+        (campo de `sort`, id) y posteriores a la clave `after` (paginación keyset)
+        """
+        pass
+
+    @abstractmethod
+    def get_changes(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Brand]:
+        """
+        Obtener hasta `limit` marcas (activas o eliminadas) en orden
+        (updated_at, id), posteriores a la clave `after` y con updated_at
+        anterior a `until`; las eliminadas llevan deleted_at (lápidas)
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Brand]:
+        """Recorrer todas las marcas activas en lotes, sin cargarlas todas en memoria"""
+        pass
+
+    @abstractmethod
+    def get_rows(
+        self,
+        fields: Sequence[str],
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple]:
+        """
+        Lectura de solo lectura para listados grandes y analítica: tuplas con
+        los valores de `fields` de las marcas activas, sin construir entidades
+        """
+        pass
+
+    @abstractmethod
+    def iter_rows(self, fields: Sequence[str], batch_size: int = 1000) -> Iterator[Tuple]:
+        """Recorrer como tuplas los `fields` de todas las marcas activas en lotes (exportación)"""
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int, min_similarity: float) -> List[Brand]:
+        """
+        Búsqueda difusa de marcas activas por nombre o propietario, ordenadas
+        por similitud descendente y con similitud >= `min_similarity` (0-1)
+        """
         pass
 
     @abstractmethod
@@ -14,21 +77,57 @@ class BrandPort(ABC):
         """Obtener una marca por ID"""
         pass
 
+    @abstractmethod
+    def get_version(self, brand_id: UUID) -> Optional[datetime]:
+        """updated_at de una marca activa (o None), sin cargar la fila completa"""
+        pass
+
+    @abstractmethod
+    def get_collection_version(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Versión barata de la colección: (último updated_at de activas, último deleted_at)"""
+        pass
+
     @abstractmethod
     def create(self, brand: Brand) -> Brand:
         """Crear una nueva marca"""
         pass
 
+    @abstractmethod
+    def create_many(self, brands: List[Brand]) -> int:
+        """Crear varias marcas en una sola transacción; devuelve cuántas se insertaron"""
+        pass
+
     @abstractmethod
     def update(self, brand_id: UUID, brand: Brand) -> Brand:
         """Actualizar una marca existente"""
         pass
 
+    @abstractmethod
+    def bulk_update(
+        self,
+        changes: Dict[str, Any],
+        ids: Optional[List[UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        """Aplicar `changes` a las marcas activas indicadas por IDs o filtro; devuelve filas afectadas"""
+        pass
+
     @abstractmethod
     def delete(self, brand_id: UUID) -> None:
         """Eliminar una marca (soft delete)"""
         pass
 
+    @abstractmethod
+    def bulk_delete(
+        self,
+        ids: Optional[List[UUID]] = None,
+        filters: Optional[BrandFilter] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        """Soft delete de las marcas activas indicadas por IDs o filtro; devuelve filas afectadas"""
+        pass
+
     @abstractmethod
     def hard_delete(self, brand_id: UUID) -> None:
         """Eliminación física de una marca (solo para casos especiales)"""
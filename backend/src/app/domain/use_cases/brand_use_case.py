@@ -1,31 +1,199 @@
 from injector import inject
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
 from app.domain.ports.brand_port import BrandPort
+from app.domain.ports.async_brand_port import AsyncBrandPort
+from app.domain.ports.brand_event_port import BrandEventPort
 from app.domain.entities.brand import Brand
-from app.schemas.brand_dto import BrandCreateDTO, BrandUpdateDTO
+from app.domain.entities.brand_page import BrandPage
+from app.domain.entities.brand_change_page import BrandChangePage
+from app.domain.entities.brand_columns import BrandColumns
+from app.domain.entities.brand_event import (
+    BrandEvent, BRAND_CREATED, BRAND_UPDATED, BRAND_DELETED,
+    BRANDS_BULK_CREATED, BRANDS_BULK_UPDATED, BRANDS_BULK_DELETED
+)
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
+from app.schemas.brand_dto import (
+    BrandCreateDTO, BrandUpdateDTO, BrandBulkSelectionDTO, BrandBulkUpdateDTO
+)
 from app.core.logger import (
     log_operation_start, log_operation_success, log_operation_error,
     log_entity_created, log_entity_updated, log_entity_deleted
 )
+from app.core.metrics import USE_CASE_SECONDS, timed_operations
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.tracing import traced_operations
+from app.config import settings
 from uuid import UUID
+from datetime import datetime, timedelta
+
+# Orden del cursor del feed de cambios: (updated_at, id) sobre todas las marcas
+CHANGES_CURSOR = "changes"
 
+# Duración de cada método público en brand_use_case_duration_seconds y un span por llamada
+@timed_operations(USE_CASE_SECONDS)
+@traced_operations
 class BrandUseCase:
     @inject
-    def __init__(self, repo: BrandPort):
+    def __init__(self, repo: BrandPort, async_repo: AsyncBrandPort = None, events: BrandEventPort = None):
         self.repo = repo
+        self.async_repo = async_repo
+        self.events = events
+
+    def _publish(self, event: BrandEvent) -> None:
+        """Notificar un cambio ya confirmado; un fallo al notificar no afecta a la escritura"""
+        if self.events is None:
+            return
+        try:
+            self.events.publish(event)
+        except Exception as e:
+            log_operation_error("publish_event", "Brand", str(event.brand_id) if event.brand_id else None, error=str(e))
 
-    def list_brands(self) -> List[Brand]:
-        """Obtener todas las marcas registradas"""
+    def list_brands(self, filters: Optional[BrandFilter] = None, sort: Optional[BrandSort] = None) -> List[Brand]:
+        """Obtener todas las marcas registradas (filtradas y ordenadas por el repositorio)"""
         log_operation_start("list_brands", "Brand")
         
         try:
-            brands = self.repo.get_all()
+            brands = self.repo.get_all(filters, sort)
             log_operation_success("list_brands", "Brand", extra={"count": len(brands)})
             return brands
         except Exception as e:
             log_operation_error("list_brands", "Brand", error=str(e))
             raise
 
+    def list_brands_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+    ) -> BrandPage:
+        """
+        Obtener una página de marcas usando paginación por cursor
+        
+        Raises:
+            ValueError: si el cursor no es válido o se generó con otro orden
+        """
+        log_operation_start("list_brands_page", "Brand")
+        
+        try:
+            sort = sort or BrandSort()
+            limit, after = self._page_query(limit, cursor, sort)
+            
+            # Pedir una fila extra para saber si existe una página siguiente
+            page = self._build_page(self.repo.get_page(limit + 1, after, filters, sort), limit, sort)
+            
+            log_operation_success("list_brands_page", "Brand", extra={"count": len(page.items)})
+            return page
+        except Exception as e:
+            log_operation_error("list_brands_page", "Brand", error=str(e))
+            raise
+
+    def export_brands(self, batch_size: Optional[int] = None) -> Iterator[Brand]:
+        """Recorrer todas las marcas activas para exportarlas en streaming"""
+        log_operation_start("export_brands", "Brand")
+        
+        try:
+            yield from self.repo.iter_all(batch_size or settings.EXPORT_BATCH_SIZE)
+            log_operation_success("export_brands", "Brand")
+        except Exception as e:
+            log_operation_error("export_brands", "Brand", error=str(e))
+            raise
+
+    def export_brand_rows(self, fields: Sequence[str], batch_size: Optional[int] = None) -> Iterator[Tuple]:
+        """Recorrer los `fields` de todas las marcas activas como tuplas, sin construir entidades"""
+        log_operation_start("export_brand_rows", "Brand")
+        
+        try:
+            yield from self.repo.iter_rows(fields, batch_size or settings.EXPORT_BATCH_SIZE)
+            log_operation_success("export_brand_rows", "Brand")
+        except Exception as e:
+            log_operation_error("export_brand_rows", "Brand", error=str(e))
+            raise
+
+    def get_brand_columns(
+        self,
+        fields: Sequence[str],
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+        limit: Optional[int] = None,
+    ) -> BrandColumns:
+        """
+        Leer `fields` de las marcas activas como lote columnar (una lista por
+        campo) para analítica y procesos por lotes
+
+        Raises:
+            ValueError: si algún campo no existe
+        """
+        log_operation_start("get_brand_columns", "Brand")
+        
+        try:
+            columns = BrandColumns.from_rows(fields, self.repo.get_rows(fields, filters, sort, limit))
+            log_operation_success("get_brand_columns", "Brand", extra={"count": len(columns)})
+            return columns
+        except Exception as e:
+            log_operation_error("get_brand_columns", "Brand", error=str(e))
+            raise
+
+    def search_brands(self, query: str, limit: Optional[int] = None, min_similarity: Optional[float] = None) -> List[Brand]:
+        """
+        Buscar marcas por nombre o propietario tolerando coincidencias parciales y errores
+        
+        Raises:
+            ValueError: si la consulta está vacía
+        """
+        log_operation_start("search_brands", "Brand")
+        
+        try:
+            query = query.strip()
+            if not query:
+                raise ValueError("Search query must not be empty")
+            limit = min(limit or settings.SEARCH_DEFAULT_LIMIT, settings.SEARCH_MAX_LIMIT)
+            if min_similarity is None:
+                min_similarity = settings.SEARCH_MIN_SIMILARITY
+            
+            brands = self.repo.search(query, limit, min_similarity)
+            log_operation_success("search_brands", "Brand", extra={"count": len(brands)})
+            return brands
+        except Exception as e:
+            log_operation_error("search_brands", "Brand", error=str(e))
+            raise
+
+    def list_brand_changes(self, limit: Optional[int] = None, since: Optional[str] = None) -> BrandChangePage:
+        """
+        Obtener los cambios (altas, modificaciones y bajas lógicas) posteriores al cursor `since`
+
+        Se omiten los cambios de los últimos CHANGES_SETTLE_SECONDS: una transacción
+        que aún no ha confirmado puede llevar un updated_at anterior al de filas ya
+        visibles, y el cursor la dejaría atrás.
+
+        Raises:
+            ValueError: si el cursor no es válido
+        """
+        log_operation_start("list_brand_changes", "Brand")
+        
+        try:
+            limit = min(limit or settings.CHANGES_DEFAULT_LIMIT, settings.CHANGES_MAX_LIMIT)
+            after = decode_cursor(since, CHANGES_CURSOR) if since else None
+            until = None
+            if settings.CHANGES_SETTLE_SECONDS > 0:
+                until = datetime.utcnow() - timedelta(seconds=settings.CHANGES_SETTLE_SECONDS)
+            
+            # Pedir una fila extra para saber si ya hay más cambios
+            brands = self.repo.get_changes(limit + 1, after, until)
+            items = brands[:limit]
+            next_cursor = since
+            if items:
+                last = items[-1]
+                next_cursor = encode_cursor(last.updated_at, last.id, CHANGES_CURSOR)
+            page = BrandChangePage(items=items, next_cursor=next_cursor, has_more=len(brands) > limit)
+            
+            log_operation_success("list_brand_changes", "Brand", extra={"count": len(items)})
+            return page
+        except Exception as e:
+            log_operation_error("list_brand_changes", "Brand", error=str(e))
+            raise
+
     def get_brand(self, brand_id: UUID) -> Optional[Brand]:
         """Obtener una marca por su ID"""
         log_operation_start("get_brand", "Brand", str(brand_id))
@@ -39,22 +207,22 @@ class BrandUseCase:
             log_operation_error("get_brand", "Brand", str(brand_id), error=str(e))
             raise
 
+    def get_brand_version(self, brand_id: UUID) -> Optional[datetime]:
+        """Versión (updated_at) de una marca activa, para peticiones condicionales"""
+        return self.repo.get_version(brand_id)
+
+    def get_brands_version(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Versión de la colección de marcas, para peticiones condicionales"""
+        return self.repo.get_collection_version()
+
     def create_brand(self, dto: BrandCreateDTO) -> Brand:
         """Crear una nueva marca"""
         log_operation_start("create_brand", "Brand")
         
         try:
-            # Crear entidad de dominio desde DTO
-            brand = Brand(
-                id=None,  # Se generará automáticamente
-                name=dto.name,
-                owner=dto.owner,
-                lang=dto.lang,
-                status=dto.status or "Pendiente"
-            )
-            
             # Persistir usando el repositorio
-            created_brand = self.repo.create(brand)
+            created_brand = self.repo.create(self._brand_from_create_dto(dto))
+            self._publish(BrandEvent(BRAND_CREATED, created_brand.id, created_brand))
             
             log_entity_created("Brand", str(created_brand.id))
             log_operation_success("create_brand", "Brand", str(created_brand.id))
@@ -64,30 +232,29 @@ class BrandUseCase:
             log_operation_error("create_brand", "Brand", error=str(e))
             raise
 
+    def create_brands(self, dtos: List[BrandCreateDTO]) -> int:
+        """Crear un lote de marcas ya validadas en una única transacción"""
+        log_operation_start("create_brands", "Brand")
+        
+        try:
+            brands = [self._brand_from_create_dto(dto) for dto in dtos]
+            created = self.repo.create_many(brands)
+            self._publish(BrandEvent(BRANDS_BULK_CREATED, count=created))
+            
+            log_operation_success("create_brands", "Brand", extra={"count": created})
+            return created
+        except Exception as e:
+            log_operation_error("create_brands", "Brand", error=str(e))
+            raise
+
     def update_brand(self, brand_id: UUID, dto: BrandUpdateDTO) -> Brand:
         """Actualizar una marca existente"""
         log_operation_start("update_brand", "Brand", str(brand_id))
         
         try:
-            # Crear entidad de dominio con solo los campos a actualizar
-            update_data = {}
-            if dto.name is not None:
-                update_data['name'] = dto.name
-            if dto.owner is not None:
-                update_data['owner'] = dto.owner
-            if dto.lang is not None:
-                update_data['lang'] = dto.lang
-            if dto.status is not None:
-                update_data['status'] = dto.status
-            
-            # Crear entidad de dominio con campos de actualización
-            updated_brand = Brand(
-                id=brand_id,
-                **update_data
-            )
-            
             # Actualizar usando el repositorio
-            result = self.repo.update(brand_id, updated_brand)
+            result = self.repo.update(brand_id, self._brand_from_update_dto(brand_id, dto))
+            self._publish(BrandEvent(BRAND_UPDATED, brand_id, result))
             
             log_entity_updated("Brand", str(brand_id))
             log_operation_success("update_brand", "Brand", str(brand_id))
@@ -97,12 +264,55 @@ class BrandUseCase:
             log_operation_error("update_brand", "Brand", str(brand_id), error=str(e))
             raise
 
+    def bulk_update_brands(self, dto: BrandBulkUpdateDTO) -> int:
+        """Aplicar una actualización parcial a un conjunto de marcas"""
+        log_operation_start("bulk_update_brands", "Brand")
+        
+        try:
+            affected = self.repo.bulk_update(
+                dto.changes.model_dump(exclude_none=True),
+                ids=dto.ids,
+                filters=self._to_filter(dto),
+                chunk_size=settings.BULK_UPDATE_CHUNK_SIZE,
+            )
+            self._publish(BrandEvent(BRANDS_BULK_UPDATED, count=affected))
+            log_operation_success("bulk_update_brands", "Brand", extra={"count": affected})
+            return affected
+        except Exception as e:
+            log_operation_error("bulk_update_brands", "Brand", error=str(e))
+            raise
+
+    def bulk_delete_brands(self, dto: BrandBulkSelectionDTO) -> int:
+        """Eliminar (soft delete) un conjunto de marcas"""
+        log_operation_start("bulk_delete_brands", "Brand")
+        
+        try:
+            affected = self.repo.bulk_delete(
+                ids=dto.ids,
+                filters=self._to_filter(dto),
+                chunk_size=settings.BULK_UPDATE_CHUNK_SIZE,
+            )
+            self._publish(BrandEvent(BRANDS_BULK_DELETED, count=affected))
+            log_operation_success("bulk_delete_brands", "Brand", extra={"count": affected})
+            return affected
+        except Exception as e:
+            log_operation_error("bulk_delete_brands", "Brand", error=str(e))
+            raise
+
+    @staticmethod
+    def _to_filter(dto: BrandBulkSelectionDTO) -> Optional[BrandFilter]:
+        """Convertir el filtro del DTO a criterio de dominio"""
+        if dto.filter is None:
+            return None
+        return BrandFilter(**dto.filter.model_dump())
+
     def delete_brand(self, brand_id: UUID) -> None:
         """Eliminar una marca (soft delete)"""
         log_operation_start("delete_brand", "Brand", str(brand_id))
         
         try:
             self.repo.delete(brand_id)
+            self._publish(BrandEvent(BRAND_DELETED, brand_id))
             log_entity_deleted("Brand", str(brand_id))
             log_operation_success("delete_brand", "Brand", str(brand_id))
         except Exception as e:
@@ -115,7 +325,154 @@ class BrandUseCase:
         
         try:
             self.repo.hard_delete(brand_id)
+            self._publish(BrandEvent(BRAND_DELETED, brand_id))
             log_operation_success("hard_delete_brand", "Brand", str(brand_id))
         except Exception as e:
             log_operation_error("hard_delete_brand", "Brand", str(brand_id), error=str(e))
             raise
+
+    # Variantes asíncronas (AsyncBrandPort)
+
+    async def list_brands_async(self, filters: Optional[BrandFilter] = None, sort: Optional[BrandSort] = None) -> List[Brand]:
+        """Obtener todas las marcas registradas (asíncrono)"""
+        log_operation_start("list_brands", "Brand")
+        
+        try:
+            brands = await self.async_repo.get_all(filters, sort)
+            log_operation_success("list_brands", "Brand", extra={"count": len(brands)})
+            return brands
+        except Exception as e:
+            log_operation_error("list_brands", "Brand", error=str(e))
+            raise
+
+    async def list_brands_page_async(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[BrandFilter] = None,
+        sort: Optional[BrandSort] = None,
+    ) -> BrandPage:
+        """Obtener una página de marcas usando paginación por cursor (asíncrono)"""
+        log_operation_start("list_brands_page", "Brand")
+        
+        try:
+            sort = sort or BrandSort()
+            limit, after = self._page_query(limit, cursor, sort)
+            page = self._build_page(await self.async_repo.get_page(limit + 1, after, filters, sort), limit, sort)
+            
+            log_operation_success("list_brands_page", "Brand", extra={"count": len(page.items)})
+            return page
+        except Exception as e:
+            log_operation_error("list_brands_page", "Brand", error=str(e))
+            raise
+
+    async def get_brand_async(self, brand_id: UUID) -> Optional[Brand]:
+        """Obtener una marca por su ID (asíncrono)"""
+        log_operation_start("get_brand", "Brand", str(brand_id))
+        
+        try:
+            brand = await self.async_repo.get_by_id(brand_id)
+            if brand:
+                log_operation_success("get_brand", "Brand", str(brand_id))
+            return brand
+        except Exception as e:
+            log_operation_error("get_brand", "Brand", str(brand_id), error=str(e))
+            raise
+
+    async def get_brand_version_async(self, brand_id: UUID) -> Optional[datetime]:
+        """Versión (updated_at) de una marca activa, para peticiones condicionales (asíncrono)"""
+        return await self.async_repo.get_version(brand_id)
+
+    async def get_brands_version_async(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Versión de la colección de marcas, para peticiones condicionales (asíncrono)"""
+        return await self.async_repo.get_collection_version()
+
+    async def create_brand_async(self, dto: BrandCreateDTO) -> Brand:
+        """Crear una nueva marca (asíncrono)"""
+        log_operation_start("create_brand", "Brand")
+        
+        try:
+            created_brand = await self.async_repo.create(self._brand_from_create_dto(dto))
+            self._publish(BrandEvent(BRAND_CREATED, created_brand.id, created_brand))
+            
+            log_entity_created("Brand", str(created_brand.id))
+            log_operation_success("create_brand", "Brand", str(created_brand.id))
+            return created_brand
+        except Exception as e:
+            log_operation_error("create_brand", "Brand", error=str(e))
+            raise
+
+    async def update_brand_async(self, brand_id: UUID, dto: BrandUpdateDTO) -> Brand:
+        """Actualizar una marca existente (asíncrono)"""
+        log_operation_start("update_brand", "Brand", str(brand_id))
+        
+        try:
+            result = await self.async_repo.update(brand_id, self._brand_from_update_dto(brand_id, dto))
+            self._publish(BrandEvent(BRAND_UPDATED, brand_id, result))
+            
+            log_entity_updated("Brand", str(brand_id))
+            log_operation_success("update_brand", "Brand", str(brand_id))
+            return result
+        except Exception as e:
+            log_operation_error("update_brand", "Brand", str(brand_id), error=str(e))
+            raise
+
+    async def delete_brand_async(self, brand_id: UUID) -> None:
+        """Eliminar una marca (soft delete, asíncrono)"""
+        log_operation_start("delete_brand", "Brand", str(brand_id))
+        
+        try:
+            await self.async_repo.delete(brand_id)
+            self._publish(BrandEvent(BRAND_DELETED, brand_id))
+            log_entity_deleted("Brand", str(brand_id))
+            log_operation_success("delete_brand", "Brand", str(brand_id))
+        except Exception as e:
+            log_operation_error("delete_brand", "Brand", str(brand_id), error=str(e))
+            raise
+
+    async def hard_delete_brand_async(self, brand_id: UUID) -> None:
+        """Eliminación física de una marca (asíncrono)"""
+        log_operation_start("hard_delete_brand", "Brand", str(brand_id))
+        
+        try:
+            await self.async_repo.hard_delete(brand_id)
+            self._publish(BrandEvent(BRAND_DELETED, brand_id))
+            log_operation_success("hard_delete_brand", "Brand", str(brand_id))
+        except Exception as e:
+            log_operation_error("hard_delete_brand", "Brand", str(brand_id), error=str(e))
+            raise
+
+    # Conversión compartida entre variantes síncronas y asíncronas
+
+    @staticmethod
+    def _brand_from_create_dto(dto: BrandCreateDTO) -> Brand:
+        """Crear entidad de dominio desde el DTO de creación"""
+        return Brand(
+            id=None,  # Se generará automáticamente
+            name=dto.name,
+            owner=dto.owner,
+            lang=dto.lang,
+            status=dto.status or "Pendiente"
+        )
+
+    @staticmethod
+    def _brand_from_update_dto(brand_id: UUID, dto: BrandUpdateDTO) -> Brand:
+        """Crear entidad de dominio con solo los campos a actualizar (los demás quedan en None)"""
+        return Brand.partial(brand_id, **dto.model_dump(exclude_none=True))
+
+    @staticmethod
+    def _page_query(limit: Optional[int], cursor: Optional[str], sort: BrandSort):
+        """Normalizar el límite y decodificar el cursor de una petición paginada"""
+        limit = min(limit or settings.PAGE_DEFAULT_LIMIT, settings.PAGE_MAX_LIMIT)
+        after = decode_cursor(cursor, str(sort)) if cursor else None
+        return limit, after
+
+    @staticmethod
+    def _build_page(brands: List[Brand], limit: int, sort: BrandSort) -> BrandPage:
+        """Construir la página a partir de limit + 1 filas"""
+        items = brands[:limit]
+        next_cursor = None
+        if len(brands) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(getattr(last, sort.field), last.id, str(sort))
+        return BrandPage(items=items, next_cursor=next_cursor)
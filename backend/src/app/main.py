@@ -2,17 +2,45 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes.brand_routes import router as brand_router
-from app.adapters.db.session import engine, Base
-from app.adapters.db.models.brand_model import BrandModel
+from app.api.routes.brand_async_routes import router as brand_async_router
+from app.api.routes.admin_routes import router as admin_router
+from app.api.routes.metrics_routes import router as metrics_router
+from app.api.middleware import MetricsMiddleware, RequestContextMiddleware, TracingMiddleware
+from app.adapters.db.session import engine, replica_router
+from app.adapters.db.pool import warm_up_pool
+from app.adapters.db.async_session import dispose_async_engine
+from app.adapters.cache.cached_brand_repository import brand_cache
+from app.adapters.cache.shared_brand_repository import handle_invalidation, shared_cache
+from app.adapters.events.brand_events import brand_broadcaster, brand_events
+from app.core.metrics import registry as metrics_registry
+from app.core.tracing import tracer
+from app.config import settings
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events para la aplicación"""
-    # Startup
-    Base.metadata.create_all(bind=engine)
+    # Startup (el esquema lo gestionan las migraciones: python -m app.adapters.db.migrations upgrade)
+    if settings.DB_POOL_WARMUP > 0:
+        warm_up_pool(engine, settings.DB_POOL_WARMUP)
+    if shared_cache is not None:
+        # Invalidaciones de otros workers sobre la caché local
+        shared_cache.start_listener(lambda message: handle_invalidation(brand_cache, message))
+    # LISTEN/NOTIFY entre workers para el stream SSE (no-op con el backend en memoria)
+    brand_events.start()
+    # Volcado periódico de métricas para agregarlas entre workers (no-op sin METRICS_DIR)
+    metrics_registry.start()
     yield
+    # Cerrar los streams SSE abiertos antes de soltar el resto de recursos
+    brand_broadcaster.close()
+    brand_events.stop()
     # Shutdown
-    pass
+    await dispose_async_engine()
+    replica_router.dispose()
+    if shared_cache is not None:
+        shared_cache.stop_listener()
+    metrics_registry.stop()
+    # Exportar los spans pendientes
+    tracer.shutdown()
 
 app = FastAPI(
     title="API de Registro de Marcas",
@@ -30,8 +58,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Incluir las rutas
+# Span de servidor por petición (dentro del registro JSON para enlazarlo con su trace_id)
+if settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+
+# Latencia por ruta y estado y peticiones en curso para /metrics
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Registro JSON por petición (el más externo: mide también CORS y las excepciones)
+if settings.LOG_REQUEST_EVENTS:
+    app.add_middleware(RequestContextMiddleware)
+
+# Incluir las rutas (las asíncronas primero para que atiendan el CRUD en modo async)
+if settings.DB_ACCESS_MODE == "async":
+    app.include_router(brand_async_router, prefix="/api/v1", tags=["Marcas"])
 app.include_router(brand_router, prefix="/api/v1", tags=["Marcas"])
+app.include_router(admin_router, prefix="/api/v1", tags=["Admin"])
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 @app.get("/")
 def read_root():
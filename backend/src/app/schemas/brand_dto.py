@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+from typing import List, Literal, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -28,6 +28,81 @@ class BrandReadDTO(BaseModel):
     # Configuración para conversión desde ORM
     model_config = ConfigDict(from_attributes=True)
 
+class BrandPageDTO(BaseModel):
+    """DTO para una página de marcas con cursor a la página siguiente"""
+    items: List[BrandReadDTO]
+    next_cursor: Optional[str] = None
+    
+    model_config = ConfigDict(from_attributes=True)
+
+class BrandChangeDTO(BaseModel):
+    """DTO de un cambio del feed: la marca actual o una lápida si fue eliminada"""
+    id: UUID
+    change: Literal["upsert", "delete"]
+    updated_at: datetime
+    deleted_at: Optional[datetime] = None
+    brand: Optional[BrandReadDTO] = None
+    
+    @classmethod
+    def from_brand(cls, brand) -> "BrandChangeDTO":
+        """Construir el cambio a partir de la entidad (lápida si tiene deleted_at)"""
+        if brand.deleted_at is not None:
+            return cls(id=brand.id, change="delete", updated_at=brand.updated_at, deleted_at=brand.deleted_at)
+        return cls(id=brand.id, change="upsert", updated_at=brand.updated_at, brand=BrandReadDTO.model_validate(brand))
+
+class BrandChangesDTO(BaseModel):
+    """DTO de una página del feed de cambios"""
+    items: List[BrandChangeDTO]
+    next_cursor: Optional[str] = Field(None, description="Cursor para la siguiente consulta (since)")
+    has_more: bool = False
+
+class BrandBulkErrorDTO(BaseModel):
+    """Error de una fila concreta en una carga masiva"""
+    line: int = Field(..., description="Número de línea (1-based) en el cuerpo NDJSON")
+    error: str
+
+class BrandBulkResultDTO(BaseModel):
+    """Resultado de una carga masiva de marcas"""
+    created: int = 0
+    failed: int = 0
+    errors: List[BrandBulkErrorDTO] = Field(default_factory=list)
+    errors_truncated: bool = False
+
+class BrandFilterDTO(BaseModel):
+    """DTO de criterios de filtrado de marcas"""
+    status: Optional[str] = Field(None, max_length=50, description="Estado de la marca")
+    lang: Optional[str] = Field(None, min_length=2, max_length=10, description="Código de idioma ISO 639-1")
+    owner: Optional[str] = Field(None, min_length=1, max_length=255, description="Propietario de la marca")
+
+class BrandBulkSelectionDTO(BaseModel):
+    """Selección de marcas para operaciones masivas: lista de IDs o filtro (exactamente uno)"""
+    ids: Optional[List[UUID]] = Field(None, min_length=1, description="IDs de las marcas")
+    filter: Optional[BrandFilterDTO] = Field(None, description="Filtro de marcas")
+    
+    @model_validator(mode="after")
+    def check_selection(self):
+        """Exigir exactamente un criterio de selección y un filtro no vacío"""
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of 'ids' or 'filter'")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("'filter' must set at least one field")
+        return self
+
+class BrandBulkUpdateDTO(BrandBulkSelectionDTO):
+    """DTO para actualización masiva de marcas"""
+    changes: BrandUpdateDTO
+    
+    @model_validator(mode="after")
+    def check_changes(self):
+        """Exigir al menos un campo a modificar"""
+        if not self.changes.model_dump(exclude_none=True):
+            raise ValueError("'changes' must set at least one field")
+        return self
+
+class BrandBulkAffectedDTO(BaseModel):
+    """Resultado de una operación masiva"""
+    affected: int
+
 class BrandInternalDTO(BaseModel):
     """DTO interno para operaciones del sistema - incluye campos de auditoría"""
     id: UUID
@@ -0,0 +1,66 @@
+import pytest
+from app.config import settings
+
+class TestAdminRoutes:
+    """Tests para los endpoints de administración"""
+    
+    def test_admin_pool_status(self, client, api_headers):
+        """Test: GET /api/v1/admin/pool - estadísticas del pool"""
+        # Act
+        response = client.get("/api/v1/admin/pool", headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        assert {"pool_class", "checkouts", "checkout_latency_ms_histogram"} <= set(response.json())
+    
+    def test_admin_pool_requires_api_key(self, client, invalid_api_headers):
+        """Test: GET /api/v1/admin/pool - sin API key válida"""
+        # Act
+        response = client.get("/api/v1/admin/pool", headers=invalid_api_headers)
+        
+        # Assert
+        assert response.status_code == 403
+    
+    def test_admin_sql_stats(self, client, api_headers):
+        """Test: GET /api/v1/admin/sql-stats - agregados por huella"""
+        # Act
+        response = client.get("/api/v1/admin/sql-stats", params={"reset": True}, headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+    
+    def test_admin_cache_stats(self, client, api_headers, monkeypatch):
+        """Test: GET /api/v1/admin/cache - los GET repetidos por ID aciertan en caché"""
+        # Arrange
+        monkeypatch.setattr(settings, "BRAND_CACHE_ENABLED", True)
+        created = client.post("/api/v1/brands", json={"name": "Cached", "owner": "Owner", "lang": "es"}, headers=api_headers).json()
+        before = client.get("/api/v1/admin/cache", headers=api_headers).json()
+        
+        # Act
+        client.get(f"/api/v1/brands/{created['id']}", headers=api_headers)
+        client.get(f"/api/v1/brands/{created['id']}", headers=api_headers)
+        after = client.get("/api/v1/admin/cache", headers=api_headers).json()
+        
+        # Assert
+        assert after["misses"] - before["misses"] == 1
+        assert after["hits"] - before["hits"] == 1
+    
+    def test_admin_logging_stats(self, client, api_headers):
+        """Test: GET /api/v1/admin/logging - estado de la cola del logger principal"""
+        # Act
+        response = client.get("/api/v1/admin/logging", headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        assert set(response.json()["app_logger"]) == {"queued", "capacity", "overflow", "dropped"}
+    
+    def test_admin_error_stats(self, client, api_headers):
+        """Test: GET /api/v1/admin/errors - contadores por huella y reinicio"""
+        # Act
+        response = client.get("/api/v1/admin/errors", params={"reset": True}, headers=api_headers)
+        after_reset = client.get("/api/v1/admin/errors", headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200 and isinstance(response.json(), list)
+        assert after_reset.json() == []
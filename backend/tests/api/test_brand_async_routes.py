@@ -0,0 +1,80 @@
+import pytest
+
+class TestBrandAsyncRoutes:
+    """Tests para los endpoints asíncronos de marcas (DB_ACCESS_MODE=async)"""
+    
+    def test_crud_flow_async(self, async_client, api_headers):
+        """Test: crear, leer, actualizar y eliminar con el adaptador asíncrono"""
+        # Act - Create
+        created = async_client.post(
+            "/api/v1/brands",
+            json={"name": "Async Brand", "owner": "Owner", "lang": "es"},
+            headers=api_headers
+        )
+        brand_id = created.json()["id"]
+        
+        # Act - Read / Update / Delete
+        fetched = async_client.get(f"/api/v1/brands/{brand_id}", headers=api_headers)
+        updated = async_client.put(
+            f"/api/v1/brands/{brand_id}",
+            json={"name": "Async Updated", "owner": "Owner", "lang": "en", "status": "active"},
+            headers=api_headers
+        )
+        deleted = async_client.delete(f"/api/v1/brands/{brand_id}", headers=api_headers)
+        missing = async_client.get(f"/api/v1/brands/{brand_id}", headers=api_headers)
+        
+        # Assert
+        assert created.status_code == 200
+        assert fetched.json()["name"] == "Async Brand"
+        assert updated.json()["status"] == "active"
+        assert deleted.status_code == 200
+        assert missing.status_code == 404
+    
+    def test_list_brands_page_async(self, async_client, api_headers):
+        """Test: paginación por cursor con el adaptador asíncrono"""
+        # Arrange
+        for i in range(3):
+            async_client.post(
+                "/api/v1/brands",
+                json={"name": f"Async {i}", "owner": "Owner", "lang": "es"},
+                headers=api_headers
+            )
+        
+        # Act
+        first = async_client.get("/api/v1/brands", params={"limit": 2}, headers=api_headers).json()
+        second = async_client.get(
+            "/api/v1/brands", params={"limit": 2, "cursor": first["next_cursor"]}, headers=api_headers
+        ).json()
+        
+        # Assert
+        assert len(first["items"]) == 2
+        assert len(second["items"]) == 1
+        assert second["next_cursor"] is None
+    
+    def test_sync_only_routes_still_served(self, async_client, api_headers):
+        """Test: las rutas estáticas (/brands/export) no las captura /brands/{id} asíncrono"""
+        # Act
+        response = async_client.get("/api/v1/brands/export", headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+    
+    def test_conditional_get_async(self, async_client, api_headers):
+        """Test: 304 por ETag en el listado y por ID con el adaptador asíncrono"""
+        # Arrange
+        created = async_client.post(
+            "/api/v1/brands",
+            json={"name": "Async Etag", "owner": "Owner", "lang": "es"},
+            headers=api_headers
+        ).json()
+        url = f"/api/v1/brands/{created['id']}"
+        brand_etag = async_client.get(url, headers=api_headers).headers["etag"]
+        list_etag = async_client.get("/api/v1/brands", headers=api_headers).headers["etag"]
+        
+        # Act
+        brand = async_client.get(url, headers={**api_headers, "If-None-Match": brand_etag})
+        listing = async_client.get("/api/v1/brands", headers={**api_headers, "If-None-Match": list_etag})
+        
+        # Assert
+        assert brand.status_code == 304
+        assert listing.status_code == 304
@@ -1,6 +1,20 @@
+import csv
+import io
+import json
+import threading
 import pytest
+from uuid import uuid4
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
 from app.main import app
+from app.api.dependencies import brand_dependency
+from app.adapters.db.replicas import ReplicaRouter
+from app.adapters.db.session import Base
+from app.config import settings
+from app.adapters.events.brand_events import InProcessBrandEvents, brand_broadcaster
+from app.domain.entities.brand import Brand
+from app.domain.use_cases.brand_use_case import BrandUseCase
+from app.domain.entities.brand_event import BrandEvent, BRAND_CREATED
 from ..factories.brand_factory import BrandFactory
 
 class TestBrandRoutes:
@@ -299,3 +313,367 @@ class TestBrandRoutes:
         assert isinstance(create_data["name"], str)
         assert isinstance(create_data["country"], str)
         assert isinstance(create_data["status"], str)
+    
+    def test_list_brands_cursor_pagination(self, client, api_headers):
+        """Test: GET /api/v1/brands?limit= - recorrer todas las páginas con next_cursor"""
+        # Arrange
+        for i in range(5):
+            client.post(
+                "/api/v1/brands",
+                json={"name": f"Paged {i}", "owner": "Owner", "lang": "es"},
+                headers=api_headers
+            )
+        
+        # Act
+        seen = []
+        params = {"limit": 2}
+        while True:
+            response = client.get("/api/v1/brands", params=params, headers=api_headers)
+            assert response.status_code == 200
+            page = response.json()
+            seen.extend(item["id"] for item in page["items"])
+            if not page["next_cursor"]:
+                break
+            params = {"limit": 2, "cursor": page["next_cursor"]}
+        
+        # Assert
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+    
+    def test_list_brands_pagination_limit_and_cursor_validation(self, client, api_headers):
+        """Test: GET /api/v1/brands - límite máximo y cursor inválido"""
+        # Act
+        too_large = client.get("/api/v1/brands", params={"limit": 100000}, headers=api_headers)
+        bad_cursor = client.get("/api/v1/brands", params={"cursor": "@@@"}, headers=api_headers)
+        
+        # Assert
+        assert too_large.status_code == 422
+        assert bad_cursor.status_code == 400
+    
+    def test_export_brands_ndjson(self, client, api_headers):
+        """Test: GET /api/v1/brands/export - exportar marcas en NDJSON"""
+        # Arrange
+        for i in range(3):
+            client.post(
+                "/api/v1/brands",
+                json={"name": f"Export {i}", "owner": "Owner", "lang": "es"},
+                headers=api_headers
+            )
+        
+        # Act
+        response = client.get("/api/v1/brands/export", headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(row["name"] for row in rows) == ["Export 0", "Export 1", "Export 2"]
+        assert set(rows[0]) == {"id", "name", "owner", "lang", "status"}
+    
+    def test_export_brands_csv(self, client, api_headers):
+        """Test: GET /api/v1/brands/export?format=csv - exportar marcas en CSV"""
+        # Arrange
+        client.post(
+            "/api/v1/brands",
+            json={"name": "Csv, Brand", "owner": "Owner", "lang": "es"},
+            headers=api_headers
+        )
+        
+        # Act
+        response = client.get("/api/v1/brands/export", params={"format": "csv"}, headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["name"] == "Csv, Brand"
+    
+    def test_create_brands_bulk_ndjson(self, client, api_headers):
+        """Test: POST /api/v1/brands/bulk - carga masiva con errores por fila"""
+        # Arrange
+        lines = [
+            json.dumps({"name": "Bulk 1", "owner": "Owner", "lang": "es"}),
+            json.dumps({"name": "", "owner": "Owner", "lang": "es"}),
+            "",
+            "{not json",
+            json.dumps({"name": "Bulk 2", "owner": "Owner", "lang": "en", "status": "active"}),
+        ]
+        body = ("\n".join(lines) + "\n").encode("utf-8")
+        
+        # Act
+        response = client.post(
+            "/api/v1/brands/bulk",
+            content=body,
+            headers={**api_headers, "Content-Type": "application/x-ndjson"}
+        )
+        
+        # Assert
+        assert response.status_code == 200
+        result = response.json()
+        assert result["created"] == 2
+        assert result["failed"] == 2
+        assert [error["line"] for error in result["errors"]] == [2, 4]
+        assert "name" in result["errors"][0]["error"]
+        
+        listed = client.get("/api/v1/brands", headers=api_headers).json()
+        assert sorted(brand["name"] for brand in listed) == ["Bulk 1", "Bulk 2"]
+    
+    def test_bulk_update_and_delete_by_filter(self, client, api_headers):
+        """Test: PATCH /api/v1/brands/bulk y POST /api/v1/brands/bulk/delete"""
+        # Arrange
+        for i in range(3):
+            client.post(
+                "/api/v1/brands",
+                json={"name": f"Review {i}", "owner": "Owner", "lang": "es"},
+                headers=api_headers
+            )
+        
+        # Act
+        updated = client.patch(
+            "/api/v1/brands/bulk",
+            json={"filter": {"status": "Pendiente"}, "changes": {"status": "active"}},
+            headers=api_headers
+        )
+        deleted = client.post(
+            "/api/v1/brands/bulk/delete",
+            json={"filter": {"status": "active", "lang": "es"}},
+            headers=api_headers
+        )
+        
+        # Assert
+        assert updated.status_code == 200
+        assert updated.json() == {"affected": 3}
+        assert deleted.json() == {"affected": 3}
+        assert client.get("/api/v1/brands", headers=api_headers).json() == []
+    
+    def test_bulk_selection_validation(self, client, api_headers):
+        """Test: la selección masiva exige IDs o un filtro no vacío"""
+        # Act
+        both = client.post(
+            "/api/v1/brands/bulk/delete",
+            json={"ids": ["00000000-0000-0000-0000-000000000001"], "filter": {"lang": "es"}},
+            headers=api_headers
+        )
+        empty_filter = client.post("/api/v1/brands/bulk/delete", json={"filter": {}}, headers=api_headers)
+        
+        # Assert
+        assert both.status_code == 422
+        assert empty_filter.status_code == 422
+    
+    def test_search_brands(self, client, api_headers):
+        """Test: buscar marcas por nombre con resultados ordenados por similitud"""
+        # Arrange
+        for name in ["Nike", "Nikon", "Adidas"]:
+            client.post("/api/v1/brands", json={"name": name, "owner": "Owner", "lang": "en"}, headers=api_headers)
+        
+        # Act
+        response = client.get("/api/v1/brands/search", params={"q": "nike"}, headers=api_headers)
+        invalid = client.get("/api/v1/brands/search", params={"q": "nike", "min_similarity": 2}, headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        assert [brand["name"] for brand in response.json()][0] == "Nike"
+        assert "Adidas" not in [brand["name"] for brand in response.json()]
+        assert invalid.status_code == 422
+    
+    def test_list_brands_filters_and_sort(self, client, api_headers):
+        """Test: filtrar por estado y ordenar por nombre descendente, con sort validado"""
+        # Arrange
+        for name, status in [("Alpha", "active"), ("Beta", "active"), ("Gamma", "Pendiente")]:
+            client.post("/api/v1/brands", json={"name": name, "owner": "Owner", "lang": "en", "status": status}, headers=api_headers)
+        
+        # Act
+        response = client.get("/api/v1/brands", params={"status": "active", "sort": "-name"}, headers=api_headers)
+        page = client.get("/api/v1/brands", params={"status": "active", "sort": "-name", "limit": 1}, headers=api_headers)
+        invalid = client.get("/api/v1/brands", params={"sort": "owner"}, headers=api_headers)
+        
+        # Assert
+        assert [brand["name"] for brand in response.json()] == ["Beta", "Alpha"]
+        assert [brand["name"] for brand in page.json()["items"]] == ["Beta"]
+        assert page.json()["next_cursor"] is not None
+        assert invalid.status_code == 422
+    
+    def test_brand_changes_feed(self, client, api_headers, monkeypatch):
+        """Test: el feed de cambios pagina por cursor e incluye lápidas de las bajas"""
+        # Arrange
+        monkeypatch.setattr(settings, "CHANGES_SETTLE_SECONDS", 0)
+        ids = [
+            client.post("/api/v1/brands", json={"name": f"Feed {i}", "owner": "Owner", "lang": "es"}, headers=api_headers).json()["id"]
+            for i in range(3)
+        ]
+        
+        # Act
+        first = client.get("/api/v1/brands/changes", params={"limit": 2}, headers=api_headers).json()
+        rest = client.get("/api/v1/brands/changes", params={"since": first["next_cursor"]}, headers=api_headers).json()
+        client.delete(f"/api/v1/brands/{ids[0]}", headers=api_headers)
+        tombstone = client.get("/api/v1/brands/changes", params={"since": rest["next_cursor"]}, headers=api_headers).json()
+        invalid = client.get("/api/v1/brands/changes", params={"since": "not-a-cursor"}, headers=api_headers)
+        
+        # Assert
+        assert first["has_more"] is True and len(first["items"]) == 2
+        assert first["items"][0]["change"] == "upsert" and first["items"][0]["brand"]["name"] == "Feed 0"
+        assert rest["has_more"] is False and [item["id"] for item in rest["items"]] == [ids[2]]
+        assert [(item["id"], item["change"], item["brand"]) for item in tombstone["items"]] == [(ids[0], "delete", None)]
+        assert tombstone["items"][0]["deleted_at"] is not None
+        assert invalid.status_code == 400
+    
+    def test_brand_event_stream(self, client, api_headers, monkeypatch):
+        """Test: el stream SSE entrega los eventos publicados mientras la conexión está abierta"""
+        # Arrange
+        monkeypatch.setattr(settings, "SSE_MAX_CONNECTION_SECONDS", 1.0)
+        brand = Brand(id=uuid4(), name="Streamed", owner="Owner", lang="es")
+        events = InProcessBrandEvents(brand_broadcaster)
+        publisher = threading.Timer(0.2, events.publish, args=(BrandEvent(BRAND_CREATED, brand.id, brand),))
+        
+        # Act
+        publisher.start()
+        response = client.get("/api/v1/brands/stream", headers=api_headers)
+        publisher.join()
+        monkeypatch.setattr(brand_broadcaster, "max_subscribers", 0)
+        rejected = client.get("/api/v1/brands/stream", headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.startswith("retry: ")
+        data = [line for line in response.text.splitlines() if line.startswith("data: ")]
+        assert "event: created" in response.text
+        assert json.loads(data[0][len("data: "):])["brand"]["name"] == "Streamed"
+        assert rejected.status_code == 503
+    
+    def test_reads_go_to_replica_except_after_own_write(self, client, api_headers, monkeypatch, tmp_path):
+        """Test: los GET leen de la réplica salvo si el cliente reenvía una marca de escritura reciente"""
+        # Arrange
+        replica_engine = create_engine(f"sqlite:///{tmp_path}/replica.db", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=replica_engine)
+        monkeypatch.setattr(brand_dependency, "replica_router", ReplicaRouter([replica_engine]))
+        
+        # Act
+        created = client.post("/api/v1/brands", json={"name": "Primary Only", "owner": "Owner", "lang": "es"}, headers=api_headers)
+        token = created.headers[brand_dependency.WRITE_TOKEN_HEADER]
+        by_cookie = client.get("/api/v1/brands", headers=api_headers)
+        client.cookies.clear()
+        without_token = client.get("/api/v1/brands", headers=api_headers)
+        by_header = client.get("/api/v1/brands", headers={**api_headers, brand_dependency.WRITE_TOKEN_HEADER: token})
+        
+        # Assert
+        assert created.cookies[brand_dependency.WRITE_TOKEN_COOKIE] == token
+        assert [brand["name"] for brand in by_cookie.json()] == ["Primary Only"]
+        assert without_token.json() == []
+        assert [brand["name"] for brand in by_header.json()] == ["Primary Only"]
+        replica_engine.dispose()
+    
+    def test_get_brand_conditional_requests(self, client, api_headers):
+        """Test: GET por ID devuelve ETag/Last-Modified y 304 mientras la marca no cambie"""
+        # Arrange
+        created = client.post("/api/v1/brands", json={"name": "Etag", "owner": "Owner", "lang": "es"}, headers=api_headers).json()
+        url = f"/api/v1/brands/{created['id']}"
+        first = client.get(url, headers=api_headers)
+        etag = first.headers["etag"]
+        
+        # Act
+        by_etag = client.get(url, headers={**api_headers, "If-None-Match": f'W/"other", {etag}'})
+        by_date = client.get(url, headers={**api_headers, "If-Modified-Since": first.headers["last-modified"]})
+        client.put(url, json={"name": "Etag 2", "owner": "Owner", "lang": "es"}, headers=api_headers)
+        after_update = client.get(url, headers={**api_headers, "If-None-Match": etag})
+        
+        # Assert
+        assert first.status_code == 200
+        assert etag.startswith('"') and first.headers["cache-control"] == "private, no-cache"
+        assert by_etag.status_code == 304 and by_etag.content == b""
+        assert by_etag.headers["etag"] == etag
+        assert by_date.status_code == 304
+        assert after_update.status_code == 200
+        assert after_update.headers["etag"] != etag
+        assert after_update.json()["name"] == "Etag 2"
+    
+    def test_get_brand_probes_version_only_when_conditional(self, client, api_headers, monkeypatch):
+        """Test: sin If-None-Match / If-Modified-Since no se consulta la versión"""
+        # Arrange
+        created = client.post("/api/v1/brands", json={"name": "Probe", "owner": "Owner", "lang": "es"}, headers=api_headers).json()
+        url = f"/api/v1/brands/{created['id']}"
+        probes = []
+        original = BrandUseCase.get_brand_version
+        monkeypatch.setattr(BrandUseCase, "get_brand_version", lambda self, brand_id: probes.append(brand_id) or original(self, brand_id))
+        
+        # Act
+        plain = client.get(url, headers=api_headers)
+        conditional = client.get(url, headers={**api_headers, "If-None-Match": plain.headers["etag"]})
+        
+        # Assert
+        assert plain.status_code == 200 and "etag" in plain.headers
+        assert conditional.status_code == 304
+        assert len(probes) == 1
+    
+    def test_list_brands_conditional_requests(self, client, api_headers):
+        """Test: el ETag del listado depende de la consulta y cambia con altas y bajas"""
+        # Arrange
+        brand = client.post("/api/v1/brands", json={"name": "List", "owner": "Owner", "lang": "es"}, headers=api_headers).json()
+        first = client.get("/api/v1/brands", params={"sort": "name", "status": "active"}, headers=api_headers)
+        etag = first.headers["etag"]
+        
+        # Act
+        reordered = client.get("/api/v1/brands", params={"status": "active", "sort": "name"}, headers={**api_headers, "If-None-Match": etag})
+        other_query = client.get("/api/v1/brands", params={"sort": "-name"}, headers={**api_headers, "If-None-Match": etag})
+        client.delete(f"/api/v1/brands/{brand['id']}", headers=api_headers)
+        after_delete = client.get("/api/v1/brands", params={"sort": "name", "status": "active"}, headers={**api_headers, "If-None-Match": etag})
+        
+        # Assert
+        assert first.status_code == 200 and "last-modified" in first.headers
+        assert reordered.status_code == 304
+        assert other_query.status_code == 200
+        assert after_delete.status_code == 200
+        assert after_delete.json() == []
+    
+    def test_partial_update_keeps_other_fields(self, client, api_headers):
+        """Test: PUT con solo el nombre conserva owner, lang y status"""
+        # Arrange
+        created = client.post("/api/v1/brands", json={"name": "Partial", "owner": "Owner", "lang": "es"}, headers=api_headers).json()
+        
+        # Act
+        response = client.put(f"/api/v1/brands/{created['id']}", json={"name": "Partial 2"}, headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {**created, "name": "Partial 2"}
+    
+    def test_request_emits_single_wide_event(self, client, api_headers, monkeypatch):
+        """Test: una petición produce un solo registro JSON con ruta, marca, tiempos por capa y sentencias SQL"""
+        # Arrange
+        from app.core import logger
+        events, lines = [], []
+        monkeypatch.setattr(logger.request_logger, "handle", events.append)
+        monkeypatch.setattr(logger.app_logger, "handle", lines.append)
+        
+        # Act
+        response = client.post("/api/v1/brands", json={"name": "Wide", "owner": "Owner", "lang": "es"}, headers={**api_headers, "X-Request-ID": "req-1"})
+        missing = client.get(f"/api/v1/brands/{uuid4()}", headers=api_headers)
+        
+        # Assert
+        created, not_found = (record.msg for record in events)
+        assert len(events) == 2 and lines == []
+        assert response.headers["x-request-id"] == "req-1"
+        assert created["request_id"] == "req-1" and created["route"] == "/api/v1/brands"
+        assert created["status"] == response.status_code and created["outcome"] == "success"
+        assert created["brand_id"] == response.json()["id"]
+        assert {"create_brand", "create"} <= set(created["timings_ms"])
+        assert created["db_statements"] >= 1
+        assert not_found["route"] == "/api/v1/brands/{brand_id}"
+        assert not_found["status"] == 404 and not_found["outcome"] == "client_error"
+        assert missing.headers["x-request-id"] == not_found["request_id"]
+    
+    def test_layer_lines_in_debug_mode(self, client, api_headers, monkeypatch):
+        """Test: con LOG_LAYER_LINES se emiten también las líneas por capa"""
+        # Arrange
+        from app.core import logger
+        events, lines = [], []
+        monkeypatch.setattr(logger.settings, "LOG_LAYER_LINES", True)
+        monkeypatch.setattr(logger.request_logger, "handle", events.append)
+        monkeypatch.setattr(logger.app_logger, "handle", lines.append)
+        
+        # Act
+        client.post("/api/v1/brands", json={"name": "Debug", "owner": "Owner", "lang": "es"}, headers=api_headers)
+        
+        # Assert
+        assert len(events) == 1
+        assert "Starting %s for %s" in [record.msg for record in lines]
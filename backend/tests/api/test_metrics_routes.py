@@ -0,0 +1,25 @@
+class TestMetricsRoutes:
+    """Tests para el endpoint de métricas de Prometheus"""
+    
+    def test_metrics_after_requests(self, client, api_headers, invalid_api_headers):
+        """Test: GET /metrics - latencia por plantilla de ruta, operaciones del caso de uso y SQL"""
+        # Arrange
+        created = client.post("/api/v1/brands", json={"name": "Metrics", "owner": "Owner", "lang": "es"}, headers=api_headers).json()
+        client.get(f"/api/v1/brands/{created['id']}", headers=api_headers)
+        
+        # Act
+        response = client.get("/metrics", headers=api_headers)
+        unauthorized = client.get("/metrics", headers=invalid_api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        assert unauthorized.status_code == 403
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/brands/{brand_id}",status="200"}' in text
+        assert created["id"] not in text
+        assert 'brand_use_case_duration_seconds_count{operation="create_brand",outcome="success"}' in text
+        assert 'db_statement_duration_seconds_count{statement="INSERT"}' in text
+        assert "http_requests_in_progress" in text
+        assert 'python_gc_collections_total{generation="0"}' in text
+        assert "process_resident_memory_bytes{pid=" in text
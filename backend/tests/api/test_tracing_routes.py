@@ -0,0 +1,40 @@
+class TestTracingRoutes:
+    """Tests para las trazas de las peticiones HTTP"""
+    
+    def test_update_trace_covers_all_layers(self, client, api_headers, span_exporter):
+        """Test: PUT /api/v1/brands/{id} - spans de ruta, endpoint, caso de uso, repositorio y SQL bajo el traceparent entrante"""
+        # Arrange
+        created = client.post("/api/v1/brands", json={"name": "Traced", "owner": "Owner", "lang": "es"}, headers=api_headers).json()
+        span_exporter.clear()
+        traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+        
+        # Act
+        response = client.put(
+            f"/api/v1/brands/{created['id']}",
+            json={"name": "Traced 2", "owner": "Owner", "lang": "es"},
+            headers={**api_headers, "traceparent": traceparent},
+        )
+        
+        # Assert
+        assert response.status_code == 200
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+        server = spans["PUT /api/v1/brands/{brand_id}"]
+        assert server.context.trace_id == 0x4bf92f3577b34da6a3ce929d0e0e4736
+        assert server.parent_span_id == 0x00f067aa0ba902b7
+        assert server.attributes["http.response.status_code"] == 200
+        assert spans["endpoint update_brand"].parent_span_id == server.context.span_id
+        assert spans["BrandUseCase.update_brand"].parent_span_id == spans["endpoint update_brand"].context.span_id
+        repository = spans["BrandRepository.update"]
+        sql = [span for span in span_exporter.get_finished_spans() if span.name.startswith("SQL ")]
+        assert {"SQL UPDATE"} <= {span.name for span in sql}
+        assert all(span.context.trace_id == server.context.trace_id for span in sql)
+        assert any(span.parent_span_id == repository.context.span_id for span in sql)
+    
+    def test_untraced_when_disabled(self, client, api_headers):
+        """Test: con el tracing desactivado las peticiones no crean spans ni fallan"""
+        # Act
+        response = client.get("/api/v1/admin/tracing", headers=api_headers)
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["enabled"] is False
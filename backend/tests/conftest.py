@@ -49,13 +49,16 @@ def client(db_session):
     from tests.test_app import test_app
     
     # Importar get_db desde session para el override
-    from app.adapters.db.session import get_db
+    from app.adapters.db.session import get_db, get_session_factory
     
-    # Limpiar cualquier override previo
+    # Limpiar cualquier override previo y la caché de marcas del proceso
     test_app.dependency_overrides.clear()
+    from app.adapters.cache.cached_brand_repository import brand_cache
+    brand_cache.clear()
     
     # Override de la dependencia de base de datos
     test_app.dependency_overrides[get_db] = override_get_db
+    test_app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
     
     with TestClient(test_app) as test_client:
         yield test_client
@@ -63,6 +66,36 @@ def client(db_session):
     # Limpiar el override
     test_app.dependency_overrides.clear()
 
+@pytest.fixture(scope="function")
+def async_client(db_session):
+    """Fixture para crear un cliente de test de la aplicación en modo asíncrono"""
+    from tests.test_app import test_async_app
+    from app.adapters.db.session import get_db, get_session_factory
+    from app.adapters.db.async_session import get_async_db, create_async_test_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    
+    async_engine = create_async_test_engine(test_db_url)
+    AsyncTestingSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    
+    async def override_get_async_db():
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+    
+    def override_get_db():
+        yield db_session
+    
+    test_async_app.dependency_overrides.clear()
+    test_async_app.dependency_overrides[get_async_db] = override_get_async_db
+    test_async_app.dependency_overrides[get_db] = override_get_db
+    test_async_app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+    
+    with TestClient(test_async_app) as test_client:
+        yield test_client
+        # Liberar las conexiones aiosqlite dentro del event loop del cliente
+        test_client.portal.call(async_engine.dispose)
+    
+    test_async_app.dependency_overrides.clear()
+
 @pytest.fixture(scope="function")
 def brand_repository(db_session):
     """Fixture para crear un repositorio de marcas con sesión de test"""
@@ -74,6 +107,15 @@ def injector():
     """Fixture para crear un contenedor de dependencias para tests"""
     return Injector([AppModule()])
 
+@pytest.fixture
+def span_exporter():
+    """Tracer activo con muestreo completo y exportador en memoria (se desactiva al terminar)"""
+    from app.core.tracing import InMemorySpanExporter, SimpleSpanProcessor, tracer
+    exporter = InMemorySpanExporter()
+    tracer.configure(enabled=True, sample_rate=1.0, processor=SimpleSpanProcessor(exporter))
+    yield exporter
+    tracer.configure(enabled=False)
+
 @pytest.fixture
 def sample_brand_data():
     """Datos de ejemplo para crear marcas en tests"""
@@ -2,6 +2,10 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes.brand_routes import router as brand_router
+from app.api.routes.admin_routes import router as admin_router
+from app.api.routes.metrics_routes import router as metrics_router
+from app.api.middleware import MetricsMiddleware, RequestContextMiddleware, TracingMiddleware
+from app.config import settings
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -28,8 +32,22 @@ test_app.add_middleware(
     allow_headers=["*"],
 )
 
+# Span de servidor por petición (no-op mientras el tracer esté desactivado)
+test_app.add_middleware(TracingMiddleware)
+
+# Latencia por ruta y estado y peticiones en curso para /metrics
+if settings.METRICS_ENABLED:
+    test_app.add_middleware(MetricsMiddleware)
+
+# Registro JSON por petición (el más externo: mide también CORS y las excepciones)
+if settings.LOG_REQUEST_EVENTS:
+    test_app.add_middleware(RequestContextMiddleware)
+
 # Incluir las rutas
 test_app.include_router(brand_router, prefix="/api/v1", tags=["Marcas"])
+test_app.include_router(admin_router, prefix="/api/v1", tags=["Admin"])
+if settings.METRICS_ENABLED:
+    test_app.include_router(metrics_router)
 
 @test_app.get("/")
 def read_root():
@@ -38,3 +56,14 @@ def read_root():
 @test_app.get("/health")
 def health_check():
     return {"status": "healthy", "message": "Test API funcionando correctamente"}
+
+# Aplicación de test en modo asíncrono (DB_ACCESS_MODE=async)
+from app.api.routes.brand_async_routes import router as brand_async_router
+
+test_async_app = FastAPI(
+    title="API de Registro de Marcas - Test Async",
+    version="1.0.0",
+    lifespan=lifespan
+)
+test_async_app.include_router(brand_async_router, prefix="/api/v1", tags=["Marcas"])
+test_async_app.include_router(brand_router, prefix="/api/v1", tags=["Marcas"])
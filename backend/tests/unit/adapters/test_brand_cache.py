@@ -0,0 +1,187 @@
+from datetime import datetime
+import pytest
+from unittest.mock import Mock
+from app.adapters.cache.ttl_lru_cache import TTLLRUCache, approximate_size
+from app.adapters.cache.cached_brand_repository import CachedBrandRepository
+from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.ports.brand_port import BrandPort
+from uuid import uuid4
+
+class TestTTLLRUCache:
+    """Tests para la caché LRU con TTL"""
+    
+    def test_lru_eviction_by_entries(self):
+        """Test: al superar max_entries se desaloja la entrada menos usada"""
+        # Arrange
+        cache = TTLLRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        
+        # Act
+        cache.set("c", 3)
+        
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+    
+    def test_eviction_by_bytes(self):
+        """Test: el tamaño aproximado total no supera max_bytes"""
+        # Arrange
+        value = "x" * 1000
+        cache = TTLLRUCache(max_bytes=approximate_size(value) * 2)
+        
+        # Act
+        for key in range(5):
+            cache.set(key, value)
+        
+        # Assert
+        assert len(cache) == 2
+        assert cache.stats()["bytes"] <= cache.max_bytes
+    
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Test: una entrada expirada cuenta como fallo y se elimina"""
+        # Arrange
+        clock = [0.0]
+        monkeypatch.setattr("app.adapters.cache.ttl_lru_cache.time.monotonic", lambda: clock[0])
+        cache = TTLLRUCache(ttl_seconds=10)
+        cache.set("a", 1)
+        
+        # Act
+        clock[0] = 11
+        
+        # Assert
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_set_with_stale_generation_is_ignored(self):
+        """Test: un valor leído antes de una invalidación no se guarda"""
+        # Arrange
+        cache = TTLLRUCache()
+        generation = cache.generation("a")
+        
+        # Act
+        cache.invalidate("a")
+        cache.set("a", 1, generation)
+        cache.set("b", 2, cache.generation("b"))
+        
+        # Assert
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+class TestCachedBrandRepository:
+    """Tests para el decorador de BrandPort con caché"""
+    
+    def setup_method(self):
+        """Setup para cada test"""
+        self.inner = Mock(spec=BrandPort)
+        self.cache = TTLLRUCache()
+        self.repo = CachedBrandRepository(self.inner, self.cache)
+        self.brand = Brand(id=uuid4(), name="Brand", owner="Owner", lang="es")
+        self.inner.get_by_id.return_value = self.brand
+    
+    def test_get_by_id_is_cached(self):
+        """Test: la segunda lectura por ID no llega al repositorio"""
+        # Act
+        first = self.repo.get_by_id(self.brand.id)
+        second = self.repo.get_by_id(self.brand.id)
+        
+        # Assert
+        assert first == second == self.brand
+        assert second is not first
+        self.inner.get_by_id.assert_called_once_with(self.brand.id)
+        assert self.cache.stats()["hits"] == 1
+    
+    @pytest.mark.parametrize("write", [
+        lambda repo, brand: repo.update(brand.id, brand),
+        lambda repo, brand: repo.delete(brand.id),
+        lambda repo, brand: repo.hard_delete(brand.id),
+        lambda repo, brand: repo.bulk_delete(ids=[brand.id]),
+        lambda repo, brand: repo.bulk_update({"status": "active"}, filters=BrandFilter(lang="es")),
+    ])
+    def test_writes_invalidate(self, write):
+        """Test: las escrituras invalidan la entrada cacheada"""
+        # Arrange
+        self.repo.get_by_id(self.brand.id)
+        
+        # Act
+        write(self.repo, self.brand)
+        self.repo.get_by_id(self.brand.id)
+        
+        # Assert
+        assert self.inner.get_by_id.call_count == 2
+    
+    def test_missing_brand_is_not_cached(self):
+        """Test: una marca inexistente no se cachea"""
+        # Arrange
+        self.inner.get_by_id.return_value = None
+        
+        # Act
+        self.repo.get_by_id(self.brand.id)
+        self.repo.get_by_id(self.brand.id)
+        
+        # Assert
+        assert self.inner.get_by_id.call_count == 2
+        assert len(self.cache) == 0
+    
+    def test_get_version_served_from_cache(self):
+        """Test: la sonda de versión usa el updated_at de la marca cacheada"""
+        # Arrange
+        self.brand.updated_at = datetime(2024, 1, 1, 12, 0)
+        self.inner.get_version.return_value = datetime(2024, 1, 1, 11, 0)
+        
+        # Act
+        before = self.repo.get_version(self.brand.id)
+        self.repo.get_by_id(self.brand.id)
+        after = self.repo.get_version(self.brand.id)
+        
+        # Assert
+        assert before == datetime(2024, 1, 1, 11, 0)
+        assert after == self.brand.updated_at
+        self.inner.get_version.assert_called_once_with(self.brand.id)
+    
+    def test_racing_reader_cannot_recache_stale_brand(self):
+        """Test: una lectura que se solapa con una escritura no deja en caché la marca anterior"""
+        # Arrange
+        stale = Brand(id=self.brand.id, name="Stale", owner="Owner", lang="es")
+        
+        def read_then_write(brand_id):
+            self.repo.update(brand_id, self.brand)
+            return stale
+        
+        self.inner.get_by_id.side_effect = read_then_write
+        
+        # Act
+        self.repo.get_by_id(self.brand.id)
+        
+        # Assert
+        assert self.cache.get(self.brand.id) is None
+    
+    def test_cached_brand_is_not_shared_between_callers(self):
+        """Test: modificar la marca devuelta no altera la copia cacheada"""
+        # Arrange
+        first = self.repo.get_by_id(self.brand.id)
+        
+        # Act
+        first.name = "Mutated"
+        second = self.repo.get_by_id(self.brand.id)
+        
+        # Assert
+        assert second.name == "Brand"
+        self.inner.get_by_id.assert_called_once_with(self.brand.id)
+    
+    def test_replica_reads_do_not_fill_cache(self):
+        """Test: con lecturas de réplica la marca leída no se cachea"""
+        # Arrange
+        repo = CachedBrandRepository(self.inner, self.cache, fill=False)
+        
+        # Act
+        repo.get_by_id(self.brand.id)
+        repo.get_by_id(self.brand.id)
+        
+        # Assert
+        assert self.inner.get_by_id.call_count == 2
+        assert len(self.cache) == 0
@@ -1,8 +1,13 @@
 import pytest
+from datetime import datetime
+from sqlalchemy import event, text
 from sqlalchemy.orm import Session
-from app.adapters.db.repositories.brand_repository import BrandRepository
+from app.adapters.db.repositories.brand_repository import BrandRepository, _list_statement, _collection_version_statement, _changes_statement
 from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
 from app.adapters.db.models.brand_model import BrandModel
+from uuid import uuid4
 from ...factories.brand_factory import BrandFactory
 
 class TestBrandRepository:
@@ -205,3 +210,362 @@ class TestBrandRepository:
         assert callable(repo.create)
         assert callable(repo.update)
         assert callable(repo.delete)
+    
+    def test_get_page_keyset_pagination(self, brand_repository):
+        """Test: paginar marcas activas por (created_at, id) sin solapamientos"""
+        # Arrange
+        repo = brand_repository
+        for i in range(5):
+            repo.create(Brand(id=uuid4(), name=f"Page {i}", owner="Owner", lang="es"))
+        
+        # Act
+        first_page = repo.get_page(limit=3)
+        last = first_page[-1]
+        second_page = repo.get_page(limit=3, after=(last.created_at, last.id))
+        
+        # Assert
+        assert len(first_page) == 3
+        assert len(second_page) == 2
+        first_ids = {brand.id for brand in first_page}
+        assert not first_ids & {brand.id for brand in second_page}
+    
+    def test_get_page_excludes_deleted_brands(self, brand_repository):
+        """Test: la paginación solo devuelve marcas activas"""
+        # Arrange
+        repo = brand_repository
+        kept = repo.create(Brand(id=uuid4(), name="Kept", owner="Owner", lang="es"))
+        removed = repo.create(Brand(id=uuid4(), name="Removed", owner="Owner", lang="es"))
+        repo.delete(removed.id)
+        
+        # Act
+        result = repo.get_page(limit=10)
+        
+        # Assert
+        assert [brand.id for brand in result] == [kept.id]
+    
+    def test_iter_all_streams_active_brands(self, brand_repository):
+        """Test: recorrer marcas activas en lotes pequeños"""
+        # Arrange
+        repo = brand_repository
+        created = [
+            repo.create(Brand(id=uuid4(), name=f"Stream {i}", owner="Owner", lang="es"))
+            for i in range(5)
+        ]
+        repo.delete(created[0].id)
+        
+        # Act
+        result = list(repo.iter_all(batch_size=2))
+        
+        # Assert
+        assert {brand.id for brand in result} == {brand.id for brand in created[1:]}
+    
+    def test_create_many_inserts_batch(self, brand_repository):
+        """Test: crear varias marcas en una sola transacción"""
+        # Arrange
+        repo = brand_repository
+        brands = [Brand(id=None, name=f"Batch {i}", owner="Owner", lang="es") for i in range(4)]
+        
+        # Act
+        created = repo.create_many(brands)
+        
+        # Assert
+        assert created == 4
+        assert sorted(brand.name for brand in repo.get_all()) == [f"Batch {i}" for i in range(4)]
+    
+    def test_bulk_update_by_filter_in_chunks(self, brand_repository):
+        """Test: actualización masiva por filtro recorriendo varios lotes"""
+        # Arrange
+        repo = brand_repository
+        repo.create_many([Brand(id=None, name=f"Pending {i}", owner="Owner", lang="es") for i in range(5)])
+        repo.create_many([Brand(id=None, name="Other", owner="Owner", lang="en", status="active")])
+        
+        # Act
+        affected = repo.bulk_update({"status": "active"}, filters=BrandFilter(status="Pendiente"), chunk_size=2)
+        
+        # Assert
+        assert affected == 5
+        assert {brand.status for brand in repo.get_all()} == {"active"}
+    
+    def test_bulk_delete_by_ids(self, brand_repository):
+        """Test: soft delete masivo por lista de IDs"""
+        # Arrange
+        repo = brand_repository
+        created = [repo.create(Brand(id=uuid4(), name=f"Del {i}", owner="Owner", lang="es")) for i in range(3)]
+        
+        # Act
+        affected = repo.bulk_delete(ids=[created[0].id, created[1].id, uuid4()], chunk_size=2)
+        
+        # Assert
+        assert affected == 2
+        assert [brand.id for brand in repo.get_all()] == [created[2].id]
+    
+    def test_bulk_chunks_are_stamped_at_their_own_time(self, brand_repository, monkeypatch):
+        """Test: cada lote de una operación masiva lleva la hora de su propia escritura"""
+        # Arrange
+        repo = brand_repository
+        created = [repo.create(Brand(id=uuid4(), name=f"Stamp {i}", owner="Owner", lang="es")) for i in range(3)]
+        ids = sorted(brand.id for brand in created)
+        ticks = iter(datetime(2030, 1, 1, 0, 0, second) for second in range(60))
+        
+        class Clock(datetime):
+            @classmethod
+            def utcnow(cls):
+                return next(ticks)
+        
+        monkeypatch.setattr("app.adapters.db.repositories.brand_repository.datetime", Clock)
+        
+        # Act
+        repo.bulk_update({"status": "active"}, ids=ids, chunk_size=1)
+        repo.bulk_delete(ids=ids[:2], chunk_size=1)
+        
+        # Assert
+        rows = {row.id: row for row in repo.get_changes(10)}
+        assert [rows[brand_id].updated_at.second for brand_id in ids] == [3, 4, 2]
+        assert [rows[brand_id].deleted_at.second for brand_id in ids[:2]] == [3, 4]
+    
+    def test_bulk_update_rejects_unknown_fields(self, brand_repository):
+        """Test: la actualización masiva solo acepta campos de negocio"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="cannot be bulk updated"):
+            brand_repository.bulk_update({"deleted_at": None}, ids=[uuid4()])
+    
+    def test_writes_use_single_statement_with_returning(self, brand_repository, db_session):
+        """Test: create, update y delete ejecutan una sola sentencia cada uno"""
+        # Arrange
+        repo = brand_repository
+        statements = []
+        engine = db_session.get_bind()
+        
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            # Act
+            created = repo.create(Brand(id=uuid4(), name="Returning", owner="Owner", lang="es"))
+            after_create = len(statements)
+            updated = repo.update(created.id, Brand(id=created.id, name="Renamed", owner="Owner", lang="en"))
+            after_update = len(statements)
+            repo.delete(created.id)
+            after_delete = len(statements)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+        
+        # Assert
+        assert after_create == 1
+        assert after_update - after_create == 1
+        assert after_delete - after_update == 1
+        assert all("RETURNING" in statement for statement in statements)
+        assert updated.name == "Renamed"
+        assert updated.lang == "en"
+        assert updated.created_at == created.created_at
+    
+    def test_hard_delete_not_found_without_select(self, brand_repository):
+        """Test: eliminar físicamente una marca inexistente informa 'not found'"""
+        # Act & Assert
+        missing_id = uuid4()
+        with pytest.raises(ValueError, match=f"Brand with id {missing_id} not found"):
+            brand_repository.hard_delete(missing_id)
+
+    def test_not_found_is_logged_once(self, brand_repository, monkeypatch):
+        """Test: una marca inexistente registra un único error por operación"""
+        # Arrange
+        from app.adapters.db.repositories import brand_repository as module
+        errors = []
+        monkeypatch.setattr(module, "log_operation_error", lambda op, *args, **kwargs: errors.append(op))
+
+        # Act
+        for operation in (
+            lambda brand_id: brand_repository.update(brand_id, Brand(id=None, name="X", owner="Owner", lang="es")),
+            brand_repository.delete,
+            brand_repository.hard_delete,
+        ):
+            with pytest.raises(ValueError):
+                operation(uuid4())
+
+        # Assert
+        assert errors == ["update", "delete", "hard_delete"]
+
+    def test_search_ranks_fuzzy_matches(self, brand_repository):
+        """Test: la búsqueda tolera errores, ordena por similitud y excluye eliminadas"""
+        # Arrange
+        repo = brand_repository
+        exact = repo.create(Brand(id=uuid4(), name="Coca Cola", owner="Company", lang="es"))
+        similar = repo.create(Brand(id=uuid4(), name="Coca Colina", owner="Other", lang="es"))
+        repo.create(Brand(id=uuid4(), name="Pepsi", owner="Company", lang="es"))
+        deleted = repo.create(Brand(id=uuid4(), name="Coca Cola Zero", owner="Company", lang="es"))
+        repo.delete(deleted.id)
+        
+        # Act
+        result = repo.search("coca cola", limit=10, min_similarity=0.3)
+        misspelled = repo.search("Koka Cola", limit=1, min_similarity=0.3)
+        
+        # Assert
+        assert [brand.id for brand in result] == [exact.id, similar.id]
+        assert [brand.id for brand in misspelled] == [exact.id]
+    
+    def test_search_by_owner_and_short_query(self, brand_repository):
+        """Test: se busca también por propietario y las consultas cortas usan subcadena"""
+        # Arrange
+        repo = brand_repository
+        brand = repo.create(Brand(id=uuid4(), name="Brand", owner="Jane Smith", lang="en"))
+        
+        # Act
+        by_owner = repo.search("smith", limit=10, min_similarity=0.3)
+        short = repo.search("ja", limit=10, min_similarity=0.3)
+        
+        # Assert
+        assert [b.id for b in by_owner] == [brand.id]
+        assert [b.id for b in short] == [brand.id]
+    
+    def test_get_page_filters_and_sorts_in_sql(self, brand_repository):
+        """Test: filtros y orden descendente se aplican en la consulta con paginación keyset"""
+        # Arrange
+        repo = brand_repository
+        for i in range(4):
+            repo.create(Brand(id=uuid4(), name=f"Active {i}", owner="Owner", lang="es", status="active"))
+        repo.create(Brand(id=uuid4(), name="Pending", owner="Owner", lang="es", status="Pendiente"))
+        filters = BrandFilter(status="active")
+        sort = BrandSort.parse("-name")
+        
+        # Act
+        first = repo.get_page(3, filters=filters, sort=sort)
+        second = repo.get_page(3, after=(first[-1].name, first[-1].id), filters=filters, sort=sort)
+        
+        # Assert
+        assert [brand.name for brand in first] == ["Active 3", "Active 2", "Active 1"]
+        assert [brand.name for brand in second] == ["Active 0"]
+    
+    def test_get_all_filters_by_date_range(self, brand_repository):
+        """Test: los rangos de fechas son desde inclusivo y hasta exclusivo"""
+        # Arrange
+        repo = brand_repository
+        old = repo.create(Brand(id=uuid4(), name="Old", owner="Owner", lang="es", created_at=datetime(2020, 1, 1)))
+        new = repo.create(Brand(id=uuid4(), name="New", owner="Owner", lang="es", created_at=datetime(2024, 1, 1)))
+        
+        # Act
+        result = repo.get_all(BrandFilter(created_from=datetime(2024, 1, 1), created_to=datetime(2025, 1, 1)))
+        
+        # Assert
+        assert [brand.id for brand in result] == [new.id]
+        assert [brand.id for brand in repo.get_all(BrandFilter(created_to=datetime(2024, 1, 1)))] == [old.id]
+    
+    @pytest.mark.parametrize("filters, sort, index", [
+        (BrandFilter(status="active"), None, "idx_brands_active_status_created"),
+        (BrandFilter(lang="es"), None, "idx_brands_active_lang_created"),
+        (BrandFilter(owner="Owner"), None, "idx_brands_active_owner_created"),
+        (None, BrandSort.parse("-updated_at"), "idx_brands_active_updated_id"),
+        (None, BrandSort.parse("name"), "idx_brands_active_name_id"),
+    ])
+    def test_list_query_plan_uses_composite_index(self, db_session, filters, sort, index):
+        """Test: el plan de la consulta del listado usa el índice compuesto sin ordenar en memoria"""
+        # Arrange
+        stmt = _list_statement(filters, sort, limit=50)
+        sql = str(stmt.compile(dialect=db_session.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+        
+        # Act
+        plan = " ".join(row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+        
+        # Assert
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+    
+    def test_get_version_and_collection_version(self, brand_repository):
+        """Test: las versiones siguen a updated_at de activas y a deleted_at de eliminadas"""
+        # Arrange
+        repo = brand_repository
+        empty = repo.get_collection_version()
+        kept = repo.create(Brand(id=uuid4(), name="Kept", owner="Owner", lang="es"))
+        removed = repo.create(Brand(id=uuid4(), name="Removed", owner="Owner", lang="es"))
+        
+        # Act
+        before = repo.get_collection_version()
+        repo.delete(removed.id)
+        after = repo.get_collection_version()
+        
+        # Assert
+        assert empty == (None, None)
+        assert repo.get_version(kept.id) == kept.updated_at
+        assert repo.get_version(removed.id) is None
+        assert before[1] is None
+        assert after[1] is not None and after != before
+    
+    def test_collection_version_query_plan_uses_partial_indexes(self, db_session):
+        """Test: la sonda de versión de la colección resuelve los máximos por índice"""
+        # Arrange
+        stmt = _collection_version_statement()
+        sql = str(stmt.compile(dialect=db_session.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+        
+        # Act
+        plan = " ".join(row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+        
+        # Assert
+        assert "idx_brands_active_updated_id" in plan
+        assert "idx_brands_deleted_at" in plan
+        assert "SCAN brands" not in plan
+    
+    def test_get_changes_includes_tombstones_in_update_order(self, brand_repository):
+        """Test: el feed devuelve altas, modificaciones y bajas lógicas en orden (updated_at, id)"""
+        # Arrange
+        repo = brand_repository
+        first = repo.create(Brand(id=uuid4(), name="First", owner="Owner", lang="es", updated_at=datetime(2024, 1, 1)))
+        second = repo.create(Brand(id=uuid4(), name="Second", owner="Owner", lang="es", updated_at=datetime(2024, 1, 2)))
+        repo.delete(first.id)
+        
+        # Act
+        changes = repo.get_changes(10)
+        after_second = repo.get_changes(10, after=(second.updated_at, second.id))
+        before_now = repo.get_changes(10, until=datetime(2024, 6, 1))
+        
+        # Assert
+        assert [brand.id for brand in changes] == [second.id, first.id]
+        assert changes[1].deleted_at is not None
+        assert [brand.id for brand in after_second] == [first.id]
+        assert [brand.id for brand in before_now] == [second.id]
+    
+    def test_changes_query_plan_uses_updated_index(self, db_session):
+        """Test: el feed de cambios usa idx_brands_updated_id sin ordenar en memoria"""
+        # Arrange
+        stmt = _changes_statement(100, after=(datetime(2024, 1, 1), uuid4()))
+        sql = str(stmt.compile(dialect=db_session.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+        
+        # Act
+        plan = " ".join(row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+        
+        # Assert
+        assert "idx_brands_updated_id" in plan
+        assert "TEMP B-TREE" not in plan
+    
+    def test_get_rows_returns_tuples_without_orm_objects(self, brand_repository, db_session):
+        """Test: la lectura por filas devuelve tuplas de los campos pedidos sin cargar BrandModel"""
+        # Arrange
+        repo = brand_repository
+        repo.create_many([Brand(id=None, name=f"Row {i}", owner="Owner", lang="es" if i else "en") for i in range(3)])
+        db_session.expunge_all()
+        
+        # Act
+        rows = repo.get_rows(["name", "lang"], filters=BrandFilter(lang="es"), sort=BrandSort("name", descending=True), limit=5)
+        
+        # Assert
+        assert rows == [("Row 2", "es"), ("Row 1", "es")]
+        assert all(type(row) is tuple for row in rows)
+        assert len(db_session.identity_map) == 0
+    
+    def test_iter_rows_streams_active_rows(self, brand_repository):
+        """Test: recorrer las filas de marcas activas en lotes pequeños"""
+        # Arrange
+        repo = brand_repository
+        created = [repo.create(Brand(id=uuid4(), name=f"Stream {i}", owner="Owner", lang="es")) for i in range(4)]
+        repo.delete(created[0].id)
+        
+        # Act
+        rows = list(repo.iter_rows(["id", "name"], batch_size=2))
+        
+        # Assert
+        assert sorted(rows) == sorted((brand.id, brand.name) for brand in created[1:])
+    
+    def test_get_rows_rejects_unknown_fields(self, brand_repository):
+        """Test: solo se pueden leer columnas de la tabla de marcas"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid brand fields: country"):
+            brand_repository.get_rows(["name", "country"])
@@ -0,0 +1,83 @@
+from sqlalchemy import create_engine, inspect, text
+from app.adapters.db.migrations import SAMPLE_BRANDS, applied_versions, load_migrations, pending_migrations, run_migrations, seed_sample_data
+from app.adapters.db.models.brand_model import BrandModel
+
+class TestMigrations:
+    """Tests para el runner de migraciones de esquema"""
+    
+    def setup_method(self):
+        """Setup para cada test: base de datos SQLite vacía"""
+        self.engine = create_engine("sqlite://")
+    
+    def teardown_method(self):
+        """Liberar el engine de cada test"""
+        self.engine.dispose()
+    
+    def test_upgrade_creates_schema_matching_model(self):
+        """Test: las migraciones crean la tabla con los índices que declara el modelo"""
+        # Act
+        applied = run_migrations(self.engine)
+        
+        # Assert
+        assert applied == [module.VERSION for module in load_migrations()]
+        inspector = inspect(self.engine)
+        assert {column["name"] for column in inspector.get_columns("brands")} == set(BrandModel.__table__.columns.keys())
+        assert {index["name"] for index in inspector.get_indexes("brands")} == {index.name for index in BrandModel.__table__.indexes}
+    
+    def test_upgrade_is_idempotent(self):
+        """Test: una segunda ejecución no aplica nada"""
+        # Arrange
+        run_migrations(self.engine)
+        
+        # Act
+        applied = run_migrations(self.engine)
+        
+        # Assert
+        assert applied == []
+        assert pending_migrations(self.engine) == []
+    
+    def test_upgrade_to_target_version(self):
+        """Test: se puede detener la actualización en una versión concreta"""
+        # Act
+        applied = run_migrations(self.engine, target="0001")
+        
+        # Assert
+        assert applied == ["0001"]
+        assert applied_versions(self.engine) == ["0001"]
+    
+    def test_upgrade_adopts_legacy_create_all_schema(self):
+        """Test: una tabla creada por create_all() antiguo pierde los índices redundantes y gana UNIQUE(name)"""
+        # Arrange
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE brands (id CHAR(32) PRIMARY KEY, name VARCHAR(255) NOT NULL, owner VARCHAR(255) NOT NULL, "
+                "lang VARCHAR(10) NOT NULL, status VARCHAR(50), created_at DATETIME NOT NULL, "
+                "updated_at DATETIME NOT NULL, deleted_at DATETIME)"
+            ))
+            conn.execute(text("CREATE INDEX ix_brands_owner ON brands (owner)"))
+            conn.execute(text("CREATE INDEX ix_brands_deleted_at ON brands (deleted_at)"))
+        
+        # Act
+        run_migrations(self.engine)
+        
+        # Assert
+        indexes = {index["name"]: index for index in inspect(self.engine).get_indexes("brands")}
+        assert "ix_brands_owner" not in indexes
+        assert "ix_brands_deleted_at" not in indexes
+        assert indexes["brands_name_key"]["unique"]
+        assert "idx_brands_active_owner_created" in indexes
+    
+    def test_seed_inserts_sample_brands_once(self):
+        """Test: el seed inserta las marcas de ejemplo y una segunda ejecución no duplica nada"""
+        # Arrange
+        run_migrations(self.engine)
+        
+        # Act
+        first = seed_sample_data(self.engine)
+        second = seed_sample_data(self.engine)
+        
+        # Assert
+        assert first == [row["name"] for row in SAMPLE_BRANDS]
+        assert second == []
+        with self.engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM brands")).scalar() == len(SAMPLE_BRANDS)
@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import create_engine, exc
+from app.adapters.db.pool import PoolMetrics, instrumented_queue_pool, pool_options, pool_status, warm_up_pool
+from app.config_test import test_settings
+
+class TestConnectionPool:
+    """Tests para la configuración e instrumentación del pool de conexiones"""
+    
+    def setup_method(self):
+        """Setup para cada test"""
+        self.metrics = PoolMetrics()
+        self.engine = create_engine(
+            "sqlite://",
+            poolclass=instrumented_queue_pool(self.metrics),
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+    
+    def teardown_method(self):
+        """Liberar el engine de cada test"""
+        self.engine.dispose()
+    
+    def test_pool_options_from_settings(self):
+        """Test: los parámetros del pool salen de Settings (salvo en SQLite)"""
+        # Act
+        options = pool_options("postgresql://user:pw@localhost/db", test_settings, self.metrics)
+        
+        # Assert
+        assert options["pool_size"] == test_settings.DB_POOL_SIZE
+        assert options["max_overflow"] == test_settings.DB_MAX_OVERFLOW
+        assert options["pool_pre_ping"] is True
+        assert pool_options("sqlite:///test.db", test_settings) == {}
+    
+    def test_checkouts_are_measured(self):
+        """Test: cada checkout se cuenta en las métricas y en el histograma"""
+        # Act
+        warm_up_pool(self.engine, 1)
+        with self.engine.connect():
+            status = pool_status(self.engine, self.metrics)
+        
+        # Assert
+        assert status["checkouts"] == 2
+        assert status["checked_out"] == 1
+        assert status["checkout_latency_ms_histogram"]["+Inf"] == 2
+    
+    def test_checkout_timeout_is_counted(self):
+        """Test: agotar el pool registra un timeout"""
+        # Arrange
+        held = self.engine.connect()
+        
+        # Act & Assert
+        with pytest.raises(exc.TimeoutError):
+            self.engine.connect()
+        held.close()
+        
+        assert self.metrics.snapshot()["timeouts"] == 1
@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.adapters.db.replicas import ReplicaRouter, create_replica_router, parse_replica_urls
+from app.adapters.db.repositories.brand_repository import BrandRepository
+from app.adapters.db.session import Base
+from app.domain.entities.brand import Brand
+from app.config_test import TestSettings
+from uuid import uuid4
+
+class TestReplicaRouter:
+    """Tests para el enrutado de lecturas a réplicas (primario y réplicas en archivos SQLite)"""
+    
+    @pytest.fixture
+    def engines(self, tmp_path):
+        """Primario y dos réplicas, cada uno en su propio archivo SQLite"""
+        engines = {
+            name: create_engine(f"sqlite:///{tmp_path / name}.db", connect_args={"check_same_thread": False})
+            for name in ("primary", "replica_a", "replica_b")
+        }
+        for engine in engines.values():
+            Base.metadata.create_all(bind=engine)
+        yield engines
+        for engine in engines.values():
+            engine.dispose()
+    
+    def test_round_robin_alternates_replicas(self, engines):
+        """Test: el turno rotatorio reparte las lecturas entre réplicas"""
+        # Arrange
+        router = ReplicaRouter([engines["replica_a"], engines["replica_b"]])
+        
+        # Act
+        chosen = [router.choose() for _ in range(4)]
+        
+        # Assert
+        assert chosen == [engines["replica_a"], engines["replica_b"]] * 2
+    
+    def test_least_latency_prefers_fastest_replica(self, engines):
+        """Test: con least_latency se elige la réplica con menor latencia media"""
+        # Arrange
+        router = ReplicaRouter([engines["replica_a"], engines["replica_b"]], strategy="least_latency")
+        router.observe(engines["replica_a"], 40.0)
+        router.observe(engines["replica_b"], 5.0)
+        
+        # Act & Assert
+        assert router.choose() is engines["replica_b"]
+        router.observe(engines["replica_b"], 500.0)
+        assert router.choose() is engines["replica_a"]
+    
+    def test_read_your_writes_window(self, engines, monkeypatch):
+        """Test: con una marca de escritura reciente el cliente lee del primario hasta que vence la ventana"""
+        # Arrange
+        clock = [1000.0]
+        monkeypatch.setattr("app.adapters.db.replicas.time.time", lambda: clock[0])
+        router = ReplicaRouter([engines["replica_a"]], read_your_writes_seconds=5)
+        
+        # Act
+        token = router.write_token()
+        during = router.session(token)
+        other = router.session(None)
+        invalid = router.session("not-a-timestamp")
+        far_future = router.recently_wrote(str(clock[0] + 60))
+        clock[0] += 6
+        after = router.session(token)
+        
+        # Assert
+        assert token == "1000.000"
+        assert during is None
+        assert not far_future
+        assert other is not None and invalid is not None and after is not None
+        assert ReplicaRouter([]).write_token() is None
+        other.close()
+        invalid.close()
+        after.close()
+    
+    def test_repository_reads_from_replica_and_writes_to_primary(self, engines):
+        """Test: el repositorio lee de la sesión de réplica y escribe en el primario"""
+        # Arrange
+        router = ReplicaRouter([engines["replica_a"]])
+        primary = sessionmaker(bind=engines["primary"])()
+        replica = router.session()
+        BrandRepository(db=sessionmaker(bind=engines["replica_a"])()).create(
+            Brand(id=uuid4(), name="Replicated", owner="Owner", lang="es")
+        )
+        repo = BrandRepository(db=primary, read_db=replica)
+        
+        # Act
+        created = repo.create(Brand(id=uuid4(), name="Fresh", owner="Owner", lang="es"))
+        listed = repo.get_all()
+        
+        # Assert
+        assert [brand.name for brand in listed] == ["Replicated"]
+        assert repo.get_by_id(created.id) is None
+        assert BrandRepository(db=primary).get_by_id(created.id).name == "Fresh"
+        assert router.status()[0]["queries"] > 0
+        primary.close()
+        replica.close()
+    
+    def test_create_from_settings(self, tmp_path):
+        """Test: las réplicas y la estrategia salen de Settings"""
+        # Arrange
+        settings = TestSettings()
+        settings.DATABASE_REPLICA_URLS = f"sqlite:///{tmp_path}/r1.db, sqlite:///{tmp_path}/r2.db"
+        settings.DB_REPLICA_STRATEGY = "least_latency"
+        
+        # Act
+        router = create_replica_router(settings)
+        
+        # Assert
+        assert len(router.engines) == 2
+        assert router.strategy == "least_latency"
+        assert parse_replica_urls("") == []
+        assert not create_replica_router(TestSettings()).enabled
+        router.dispose()
+    
+    def test_invalid_strategy(self):
+        """Test: una estrategia desconocida produce ValueError"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid replica strategy"):
+            ReplicaRouter([], strategy="random")
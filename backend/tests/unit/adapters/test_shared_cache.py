@@ -0,0 +1,282 @@
+import asyncio
+from datetime import datetime
+import queue
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+from app.adapters.cache.async_invalidating_brand_repository import AsyncInvalidatingBrandRepository
+from app.adapters.cache.shared_cache import ENTITY_VERSION, SharedCache, create_shared_cache
+from app.adapters.cache.shared_brand_repository import SharedCachedBrandRepository, dump_brands, handle_invalidation, id_version
+from app.adapters.cache.cached_brand_repository import CachedBrandRepository
+from app.adapters.cache.ttl_lru_cache import TTLLRUCache
+from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.ports.async_brand_port import AsyncBrandPort
+from app.domain.ports.brand_port import BrandPort
+from app.config_test import TestSettings
+from uuid import uuid4
+
+class FakeRedis:
+    """Servidor Redis en memoria con el subconjunto de la API de redis-py que usa SharedCache"""
+    
+    def __init__(self):
+        self.data = {}
+        self.subscribers = []
+        self.down = False
+        self.lock = threading.Lock()
+    
+    def _check(self):
+        if self.down:
+            raise ConnectionError("Connection refused")
+    
+    def get(self, key):
+        self._check()
+        return self.data.get(key)
+    
+    def mget(self, keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+    
+    def set(self, key, value, ex=None):
+        self._check()
+        self.data[key] = value
+    
+    def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.data.pop(key, None)
+    
+    def incr(self, key):
+        self._check()
+        with self.lock:
+            value = int(self.data.get(key, b"0")) + 1
+            self.data[key] = str(value).encode()
+            return value
+    
+    def expire(self, key, seconds):
+        self._check()
+    
+    def publish(self, channel, message):
+        self._check()
+        for subscriber in list(self.subscribers):
+            if channel in subscriber.channels:
+                subscriber.messages.put({"type": "message", "data": message.encode()})
+    
+    def pubsub(self, ignore_subscribe_messages=False):
+        self._check()
+        return FakePubSub(self)
+
+class FakePubSub:
+    """Suscripción pub/sub de FakeRedis"""
+    
+    def __init__(self, server):
+        self.server = server
+        self.channels = set()
+        self.messages = queue.Queue()
+    
+    def subscribe(self, channel):
+        self.channels.add(channel)
+        self.server.subscribers.append(self)
+    
+    def get_message(self, timeout=0.0):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
+    def close(self):
+        if self in self.server.subscribers:
+            self.server.subscribers.remove(self)
+
+class TestSharedCache:
+    """Tests para la caché compartida entre workers"""
+    
+    def setup_method(self):
+        """Setup para cada test: dos workers sobre el mismo servidor"""
+        self.server = FakeRedis()
+        self.brand = Brand(id=uuid4(), name="Shared", owner="Owner", lang="es")
+        self.workers = []
+        for _ in range(2):
+            inner = Mock(spec=BrandPort)
+            inner.get_by_id.return_value = self.brand
+            inner.get_page.return_value = [self.brand]
+            shared = SharedCache(self.server, retry_after_seconds=60)
+            self.workers.append((inner, shared, SharedCachedBrandRepository(inner, shared)))
+    
+    def test_lookup_is_shared_between_workers(self):
+        """Test: lo que carga un worker lo aprovecha otro sin ir a la base de datos"""
+        # Arrange
+        (inner_a, _, repo_a), (inner_b, _, repo_b) = self.workers
+        
+        # Act
+        repo_a.get_by_id(self.brand.id)
+        result = repo_b.get_by_id(self.brand.id)
+        
+        # Assert
+        assert result == self.brand
+        inner_a.get_by_id.assert_called_once()
+        inner_b.get_by_id.assert_not_called()
+    
+    def test_write_invalidates_entity_and_list_pages(self):
+        """Test: una escritura invalida la entidad y las páginas cacheadas"""
+        # Arrange
+        (inner_a, _, repo_a), (inner_b, _, repo_b) = self.workers
+        repo_a.get_by_id(self.brand.id)
+        repo_a.get_page(10)
+        
+        # Act
+        repo_b.update(self.brand.id, self.brand)
+        repo_a.get_by_id(self.brand.id)
+        repo_a.get_page(10)
+        repo_a.get_page(10)
+        
+        # Assert
+        assert inner_a.get_by_id.call_count == 2
+        assert inner_a.get_page.call_count == 2
+    
+    def test_racing_reader_cannot_recache_stale_entity(self):
+        """Test: un lector que cargó la marca antes de una escritura no la vuelve a cachear obsoleta"""
+        # Arrange
+        (inner_a, shared_a, repo_a), (_, _, repo_b) = self.workers
+        key = shared_a.key("id", self.brand.id)
+        _, version = shared_a.get_versioned(key, ENTITY_VERSION, id_version(self.brand.id))
+        
+        # Act
+        repo_b.update(self.brand.id, self.brand)
+        shared_a.set_versioned(key, version, dump_brands([self.brand]))
+        repo_a.get_by_id(self.brand.id)
+        
+        # Assert
+        inner_a.get_by_id.assert_called_once()
+    
+    def test_replica_reads_do_not_fill_cache(self):
+        """Test: lo leído de una réplica no se guarda en la caché compartida, pero sí se sirven sus aciertos"""
+        # Arrange
+        (inner_a, shared_a, repo_a), (inner_b, _, repo_b) = self.workers
+        replica_repo = SharedCachedBrandRepository(inner_a, shared_a, fill=False)
+        
+        # Act
+        replica_repo.get_by_id(self.brand.id)
+        replica_repo.get_page(10)
+        repo_b.get_by_id(self.brand.id)
+        result = replica_repo.get_by_id(self.brand.id)
+        
+        # Assert
+        assert result == self.brand
+        assert inner_a.get_by_id.call_count == 1
+        assert inner_a.get_page.call_count == 1
+        inner_b.get_by_id.assert_called_once()
+    
+    def test_async_write_invalidates_shared_and_local_caches(self):
+        """Test: una escritura por el repositorio asíncrono invalida la caché compartida y la local"""
+        # Arrange
+        inner_a, shared_a, repo_a = self.workers[0]
+        local = TTLLRUCache()
+        cached_a = CachedBrandRepository(repo_a, local)
+        cached_a.get_by_id(self.brand.id)
+        repo_a.get_page(10)
+        async_inner = AsyncMock(spec=AsyncBrandPort)
+        async_repo = AsyncInvalidatingBrandRepository(async_inner, local=local, shared=shared_a)
+        
+        # Act
+        asyncio.run(async_repo.update(self.brand.id, self.brand))
+        cached_a.get_by_id(self.brand.id)
+        repo_a.get_page(10)
+        
+        # Assert
+        async_inner.update.assert_awaited_once_with(self.brand.id, self.brand)
+        assert inner_a.get_by_id.call_count == 2
+        assert inner_a.get_page.call_count == 2
+    
+    def test_version_probes_served_from_cache(self):
+        """Test: las sondas de versión por ID y de la colección se sirven desde la caché compartida"""
+        # Arrange
+        (inner_a, _, repo_a), (inner_b, _, repo_b) = self.workers
+        self.brand.updated_at = datetime(2024, 1, 1, 12, 0)
+        versions = (datetime(2024, 1, 1, 12, 0), None)
+        inner_a.get_collection_version.return_value = versions
+        repo_a.get_by_id(self.brand.id)
+        
+        # Act
+        entity_version = repo_b.get_version(self.brand.id)
+        first = repo_a.get_collection_version()
+        cached = repo_b.get_collection_version()
+        repo_b.create(self.brand)
+        inner_b.get_collection_version.return_value = (datetime(2024, 1, 2), None)
+        after_write = repo_b.get_collection_version()
+        
+        # Assert
+        assert entity_version == self.brand.updated_at
+        inner_b.get_version.assert_not_called()
+        assert first == cached == versions
+        assert after_write == (datetime(2024, 1, 2), None)
+        assert inner_b.get_collection_version.call_count == 1
+    
+    def test_filter_bulk_invalidates_all_entities(self):
+        """Test: una operación masiva por filtro invalida todas las entidades cacheadas"""
+        # Arrange
+        (inner_a, _, repo_a), (_, _, repo_b) = self.workers
+        repo_a.get_by_id(self.brand.id)
+        
+        # Act
+        repo_b.bulk_delete(filters=BrandFilter(lang="es"))
+        repo_a.get_by_id(self.brand.id)
+        
+        # Assert
+        assert inner_a.get_by_id.call_count == 2
+    
+    def test_pubsub_drops_local_copies_in_other_workers(self):
+        """Test: el aviso pub/sub invalida la caché local de otro worker"""
+        # Arrange
+        (inner_a, shared_a, repo_a), (_, _, repo_b) = self.workers
+        local_a = TTLLRUCache()
+        cached_a = CachedBrandRepository(repo_a, local_a)
+        received = threading.Event()
+        
+        def on_message(message):
+            handle_invalidation(local_a, message)
+            if message == str(self.brand.id):
+                received.set()
+        
+        shared_a.start_listener(on_message, poll_seconds=0.05)
+        try:
+            while not self.server.subscribers:
+                time.sleep(0.01)
+            cached_a.get_by_id(self.brand.id)
+            
+            # Act
+            repo_b.delete(self.brand.id)
+            
+            # Assert
+            assert received.wait(timeout=2)
+            assert len(local_a) == 0
+        finally:
+            shared_a.stop_listener()
+    
+    def test_unreachable_backend_falls_back_to_database(self):
+        """Test: sin servidor las lecturas van al repositorio y las invalidaciones se reintentan"""
+        # Arrange
+        (inner_a, shared_a, repo_a), _ = self.workers
+        repo_a.get_by_id(self.brand.id)
+        self.server.down = True
+        
+        # Act
+        result = repo_a.get_by_id(self.brand.id)
+        repo_a.update(self.brand.id, self.brand)
+        pending = shared_a.stats()["pending_invalidations"]
+        self.server.down = False
+        shared_a._down_until = 0
+        repo_a.get_by_id(self.brand.id)
+        repo_a.get_by_id(self.brand.id)
+        
+        # Assert
+        assert result == self.brand
+        assert pending > 0
+        assert shared_a.stats()["pending_invalidations"] == 0
+        assert shared_a.stats()["errors"] == 1
+        assert inner_a.get_by_id.call_count == 3
+    
+    def test_disabled_without_url(self):
+        """Test: sin SHARED_CACHE_URL no se crea la caché compartida"""
+        # Act & Assert
+        assert create_shared_cache(TestSettings()) is None
@@ -0,0 +1,72 @@
+import logging
+import pytest
+from sqlalchemy import create_engine, text
+from app.adapters.db.sql_instrumentation import SqlInstrumentation, fingerprint, redact_parameters
+
+class TestSqlInstrumentation:
+    """Tests para el log de sentencias lentas y los agregados por huella"""
+    
+    def test_fingerprint_collapses_literals_and_lists(self):
+        """Test: sentencias con distintos valores comparten huella"""
+        # Act
+        first = fingerprint("SELECT * FROM brands WHERE id IN (?, ?, ?) AND name = 'Nike' LIMIT 10")
+        second = fingerprint("SELECT *  FROM brands WHERE id IN (?) AND name = 'Puma' LIMIT 5")
+        
+        # Assert
+        assert first == second == "SELECT * FROM brands WHERE id IN (...) AND name = ? LIMIT ?"
+    
+    def test_redact_parameters(self):
+        """Test: los valores de los parámetros nunca se registran"""
+        # Assert
+        assert redact_parameters({"name": "Nike"}) == {"name": "***"}
+        assert redact_parameters(("Nike", 1)) == ["***", "***"]
+        assert redact_parameters([("a",), ("b",)], executemany=True) == "<2 parameter sets>"
+    
+    def test_aggregates_per_fingerprint(self):
+        """Test: los agregados acumulan conteo, total y p95 por huella"""
+        # Arrange
+        instrumentation = SqlInstrumentation(slow_threshold_ms=10_000)
+        
+        # Act
+        for duration in range(1, 101):
+            instrumentation.record("SELECT * FROM brands WHERE id = ?", float(duration))
+        instrumentation.record("DELETE FROM brands", 1.0)
+        stats = instrumentation.dump()
+        
+        # Assert
+        assert stats[0]["count"] == 100
+        assert stats[0]["total_ms"] == 5050.0
+        assert stats[0]["p95_ms"] == 96.0
+        assert len(stats) == 2
+    
+    def test_slow_queries_are_logged_without_parameters(self, caplog):
+        """Test: solo las sentencias por encima del umbral se registran"""
+        # Arrange
+        instrumentation = SqlInstrumentation(slow_threshold_ms=50)
+        
+        # Act
+        with caplog.at_level(logging.INFO, logger="app_logger"):
+            instrumentation.record("SELECT 1", 5.0, {"secret": "value"})
+            instrumentation.record("SELECT 2", 80.0, {"secret": "value"})
+        
+        # Assert
+        messages = [record.getMessage() for record in caplog.records]
+        assert len(messages) == 1
+        assert "Slow query" in messages[0]
+        assert "value" not in messages[0]
+    
+    def test_attach_to_engine_records_statements(self):
+        """Test: los eventos del engine alimentan los agregados"""
+        # Arrange
+        engine = create_engine("sqlite://")
+        instrumentation = SqlInstrumentation(slow_threshold_ms=10_000)
+        instrumentation.attach(engine)
+        
+        # Act
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        
+        # Assert
+        assert instrumentation.dump()[0]["fingerprint"] == "SELECT ?"
+        assert instrumentation.dump()[0]["count"] == 2
@@ -1,5 +1,8 @@
 import pytest
+from datetime import datetime
+from uuid import uuid4
 from app.domain.entities.brand import Brand
+from app.domain.entities.brand_columns import BrandColumns
 
 class TestBrandEntity:
     """Tests unitarios para la entidad Brand"""
@@ -233,3 +236,77 @@ class TestBrandEntity:
         assert hasattr(brand, 'name')
         assert hasattr(brand, 'country')
         assert hasattr(brand, 'status')
+    
+    def test_new_brand_gets_single_timestamp(self):
+        """Test: una marca nueva recibe created_at y updated_at de una sola lectura del reloj"""
+        # Arrange & Act
+        brand = Brand(id=None, name="Nike", owner="Owner", lang="en")
+        
+        # Assert
+        assert brand.created_at is not None
+        assert brand.created_at == brand.updated_at
+        assert brand.deleted_at is None
+        assert brand.status == "Pendiente"
+    
+    def test_brand_uses_slots(self):
+        """Test: la entidad no tiene __dict__ por instancia"""
+        # Arrange
+        brand = Brand(id=None, name="Nike", owner="Owner", lang="en")
+        
+        # Act & Assert
+        assert not hasattr(brand, "__dict__")
+        with pytest.raises(AttributeError):
+            brand.country = "USA"
+    
+    def test_from_row_keeps_values_without_defaults(self):
+        """Test: la hidratación desde una fila no aplica valores por defecto ni genera timestamps"""
+        # Arrange
+        created = datetime(2024, 1, 1)
+        
+        # Act
+        brand = Brand.from_row(id=uuid4(), name="Nike", owner="Owner", lang="en", status=None, created_at=created, updated_at=None)
+        
+        # Assert
+        assert brand.status is None
+        assert brand.created_at == created
+        assert brand.updated_at is None
+    
+    def test_partial_brand_only_carries_changes(self):
+        """Test: una marca parcial para actualizar solo lleva los campos indicados"""
+        # Arrange
+        brand_id = uuid4()
+        
+        # Act
+        brand = Brand.partial(brand_id, name="Nuevo nombre")
+        
+        # Assert
+        assert brand.id == brand_id
+        assert brand.name == "Nuevo nombre"
+        assert (brand.owner, brand.lang, brand.status, brand.created_at, brand.updated_at) == (None, None, None, None, None)
+
+class TestBrandColumns:
+    """Tests para el lote columnar de marcas"""
+    
+    def test_from_rows_transposes_and_back(self):
+        """Test: las filas se transponen a una lista por campo y se pueden volver a recorrer"""
+        # Arrange
+        rows = [("Nike", "en"), ("Adidas", "de")]
+        
+        # Act
+        columns = BrandColumns.from_rows(["name", "lang"], rows)
+        empty = BrandColumns.from_rows(["name"], [])
+        
+        # Assert
+        assert columns["name"] == ["Nike", "Adidas"]
+        assert columns["lang"] == ["en", "de"]
+        assert len(columns) == 2
+        assert list(columns.rows()) == rows
+        assert empty.columns == {"name": []} and len(empty) == 0
+    
+    def test_from_rows_validates_fields(self):
+        """Test: se rechazan campos vacíos o desconocidos"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            BrandColumns.from_rows([], [])
+        with pytest.raises(ValueError, match="country"):
+            BrandColumns.from_rows(["country"], [])
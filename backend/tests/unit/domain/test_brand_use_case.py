@@ -1,9 +1,15 @@
 import pytest
 from unittest.mock import Mock, MagicMock
-from app.domain.use_cases.brand_use_case import BrandUseCase
+from app.domain.use_cases.brand_use_case import BrandUseCase, CHANGES_CURSOR
 from app.domain.ports.brand_port import BrandPort
+from app.domain.ports.brand_event_port import BrandEventPort
 from app.domain.entities.brand import Brand
+from app.domain.entities.brand_filter import BrandFilter
+from app.domain.entities.brand_sort import BrandSort
 from app.schemas.brand_dto import BrandCreateDTO, BrandUpdateDTO
+from app.core.pagination import encode_cursor, decode_cursor
+from uuid import uuid4
+from datetime import datetime
 from ...factories.brand_factory import BrandFactory
 
 class TestBrandUseCase:
@@ -160,3 +166,170 @@ class TestBrandUseCase:
             self.use_case.delete_brand(brand_id)
         
         self.mock_repo.delete.assert_called_once_with(brand_id)
+    
+    def test_list_brands_page_with_next_cursor(self):
+        """Test: listar una página devuelve cursor cuando hay más resultados"""
+        # Arrange
+        brands = [
+            Brand(id=uuid4(), name=f"Brand {i}", owner="Owner", lang="es")
+            for i in range(3)
+        ]
+        self.mock_repo.get_page.return_value = brands
+        
+        # Act
+        result = self.use_case.list_brands_page(limit=2)
+        
+        # Assert
+        assert result.items == brands[:2]
+        assert decode_cursor(result.next_cursor) == (brands[1].created_at, brands[1].id)
+        self.mock_repo.get_page.assert_called_once_with(3, None, None, BrandSort())
+    
+    def test_list_brands_page_last_page(self):
+        """Test: la última página no devuelve cursor"""
+        # Arrange
+        brand = Brand(id=uuid4(), name="Brand", owner="Owner", lang="es")
+        self.mock_repo.get_page.return_value = [brand]
+        cursor = encode_cursor(brand.created_at, brand.id)
+        
+        # Act
+        result = self.use_case.list_brands_page(limit=2, cursor=cursor)
+        
+        # Assert
+        assert result.items == [brand]
+        assert result.next_cursor is None
+        self.mock_repo.get_page.assert_called_once_with(3, (brand.created_at, brand.id), None, BrandSort())
+    
+    def test_list_brands_page_invalid_cursor(self):
+        """Test: un cursor inválido produce ValueError"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            self.use_case.list_brands_page(limit=2, cursor="not-a-cursor")
+        
+        self.mock_repo.get_page.assert_not_called()
+    
+    def test_list_brand_changes_cursor_and_settle_window(self):
+        """Test: el feed devuelve cursor del último cambio, has_more y excluye los cambios recientes"""
+        # Arrange
+        brands = [Brand(id=uuid4(), name=f"Brand {i}", owner="Owner", lang="es") for i in range(3)]
+        self.mock_repo.get_changes.return_value = brands
+        
+        # Act
+        result = self.use_case.list_brand_changes(limit=2)
+        
+        # Assert
+        assert result.items == brands[:2]
+        assert result.has_more is True
+        assert decode_cursor(result.next_cursor, CHANGES_CURSOR) == (brands[1].updated_at, brands[1].id)
+        limit, after, until = self.mock_repo.get_changes.call_args.args
+        assert (limit, after) == (3, None)
+        assert until is not None
+    
+    def test_list_brand_changes_without_changes_keeps_cursor(self):
+        """Test: sin cambios nuevos se devuelve el mismo cursor para volver a consultar"""
+        # Arrange
+        since = encode_cursor(datetime(2024, 1, 1), uuid4(), CHANGES_CURSOR)
+        self.mock_repo.get_changes.return_value = []
+        
+        # Act
+        result = self.use_case.list_brand_changes(since=since)
+        
+        # Assert
+        assert result.items == []
+        assert result.next_cursor == since
+        assert result.has_more is False
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            self.use_case.list_brand_changes(since=encode_cursor(datetime(2024, 1, 1), uuid4()))
+    
+    def test_writes_publish_events_after_commit(self):
+        """Test: las escrituras publican su evento y un fallo del publicador no rompe la escritura"""
+        # Arrange
+        events = Mock(spec=BrandEventPort)
+        use_case = BrandUseCase(repo=self.mock_repo, events=events)
+        created = Brand(id=uuid4(), name="Nike", owner="Owner", lang="en")
+        self.mock_repo.create.return_value = created
+        self.mock_repo.create_many.return_value = 2
+        
+        # Act
+        use_case.create_brand(BrandCreateDTO(name="Nike", owner="Owner", lang="en"))
+        use_case.create_brands([BrandCreateDTO(name="A", owner="Owner", lang="en")] * 2)
+        use_case.delete_brand(created.id)
+        events.publish.side_effect = RuntimeError("broker down")
+        use_case.hard_delete_brand(created.id)
+        
+        # Assert
+        published = [call.args[0] for call in events.publish.call_args_list]
+        assert [(event.type, event.brand_id, event.count) for event in published] == [
+            ("created", created.id, None),
+            ("bulk_created", None, 2),
+            ("deleted", created.id, None),
+            ("deleted", created.id, None),
+        ]
+        assert published[0].brand is created
+    
+    def test_failed_write_publishes_nothing(self):
+        """Test: si la escritura falla no se publica ningún evento"""
+        # Arrange
+        events = Mock(spec=BrandEventPort)
+        use_case = BrandUseCase(repo=self.mock_repo, events=events)
+        self.mock_repo.delete.side_effect = ValueError("Brand not found")
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            use_case.delete_brand(uuid4())
+        events.publish.assert_not_called()
+    
+    def test_search_brands_applies_defaults_and_max_limit(self):
+        """Test: la búsqueda aplica umbral por defecto y limita el número de resultados"""
+        # Arrange
+        self.mock_repo.search.return_value = []
+        
+        # Act
+        self.use_case.search_brands("  coca  ", limit=10_000)
+        
+        # Assert
+        self.mock_repo.search.assert_called_once_with("coca", 100, 0.3)
+    
+    def test_search_brands_empty_query(self):
+        """Test: una consulta vacía produce ValueError"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="must not be empty"):
+            self.use_case.search_brands("   ")
+        
+        self.mock_repo.search.assert_not_called()
+    
+    def test_list_brands_page_sorted_cursor(self):
+        """Test: el cursor codifica el campo de orden y no sirve para otro orden"""
+        # Arrange
+        brands = [Brand(id=uuid4(), name=f"Brand {i}", owner="Owner", lang="es") for i in range(3)]
+        self.mock_repo.get_page.return_value = brands
+        sort = BrandSort.parse("-name")
+        filters = BrandFilter(status="active")
+        
+        # Act
+        result = self.use_case.list_brands_page(limit=2, filters=filters, sort=sort)
+        
+        # Assert
+        assert decode_cursor(result.next_cursor, "-name") == ("Brand 1", brands[1].id)
+        self.mock_repo.get_page.assert_called_once_with(3, None, filters, sort)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            self.use_case.list_brands_page(limit=2, cursor=result.next_cursor)
+    
+    def test_brand_sort_whitelist(self):
+        """Test: solo se admiten claves de orden permitidas"""
+        # Act & Assert
+        assert BrandSort.parse("-updated_at") == BrandSort(field="updated_at", descending=True)
+        with pytest.raises(ValueError, match="Invalid sort field"):
+            BrandSort.parse("owner; DROP TABLE brands")
+    
+    def test_get_brand_columns_from_rows(self):
+        """Test: el lote columnar se construye desde las filas del repositorio"""
+        # Arrange
+        self.mock_repo.get_rows.return_value = [("Nike", "active"), ("Puma", "Pendiente")]
+        filters = BrandFilter(lang="es")
+        
+        # Act
+        columns = self.use_case.get_brand_columns(["name", "status"], filters=filters)
+        
+        # Assert
+        assert columns["status"] == ["active", "Pendiente"]
+        self.mock_repo.get_rows.assert_called_once_with(["name", "status"], filters, None, None)
@@ -6,6 +6,8 @@ from app.domain.ports.auth_port import AuthPort
 from app.domain.use_cases.brand_use_case import BrandUseCase
 from app.adapters.db.repositories.brand_repository import BrandRepository
 from app.adapters.auth.auth_adapter import SimpleAuthAdapter
+from app.adapters.cache.ttl_lru_cache import TTLLRUCache
+from app.adapters.cache.cached_brand_repository import brand_cache
 
 class TestContainer:
     """Tests para el contenedor de dependencias"""
@@ -177,3 +179,11 @@ class TestContainer:
         assert brand_port1 is not brand_port2  # Diferentes instancias
         assert isinstance(brand_port1, BrandRepository)
         assert isinstance(brand_port2, BrandRepository)
+    
+    def test_brand_cache_binding(self):
+        """Test: verificar que la caché de marcas es la instancia única del worker"""
+        # Act
+        cache = injector.get(TTLLRUCache)
+        
+        # Assert
+        assert cache is brand_cache
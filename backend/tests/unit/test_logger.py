@@ -0,0 +1,204 @@
+import io
+import json
+import logging
+import queue
+import pytest
+from app.core.logger import (
+    BoundedQueueHandler, JSONEventFormatter, setup_logger, get_logger_with_uuid,
+    log_operation_start, log_operation_error, app_logger
+)
+from app.core.error_limiter import ErrorLogLimiter, LOG_FULL, SUPPRESS
+from app.core.request_context import RequestContext, current_request
+
+def _record(msg: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+class TestQueueLogging:
+    """Tests para el logging a través de una cola acotada"""
+
+    def test_records_are_written_by_listener(self):
+        """Test: los registros llegan al stream desde el thread del listener"""
+        # Arrange
+        stream = io.StringIO()
+        logger = setup_logger("test_queue_logger", queue_size=10, stream=stream)
+        handler = logger.handlers[0]
+
+        # Act
+        get_logger_with_uuid("brand-1", "test_queue_logger").info("Created %s", "Nike")
+        handler.stop()
+        get_logger_with_uuid(None, "test_queue_logger").info("After stop")
+
+        # Assert
+        lines = stream.getvalue().splitlines()
+        assert isinstance(handler, BoundedQueueHandler)
+        assert "[brand-1] Created Nike" in lines[0]
+        assert "[N/A] After stop" in lines[1]
+
+    def test_drop_policy_counts_dropped_records(self):
+        """Test: con la cola llena los registros se descartan y se cuentan"""
+        # Arrange
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), logging.NullHandler(), overflow="drop")
+
+        # Act
+        for i in range(3):
+            handler.enqueue(_record("message %s", i))
+
+        # Assert
+        assert handler.stats() == {"queued": 1, "capacity": 1, "overflow": "drop", "dropped": 2}
+
+    def test_message_formatting_is_deferred(self):
+        """Test: el registro se encola sin formatear (msg y args intactos)"""
+        # Arrange
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), logging.NullHandler())
+
+        # Act
+        prepared = handler.prepare(_record("Starting %s", "create"))
+
+        # Assert
+        assert prepared.msg == "Starting %s" and prepared.args == ("create",)
+
+    def test_invalid_overflow_policy(self):
+        """Test: solo se admiten las políticas drop y block"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid log overflow policy"):
+            BoundedQueueHandler(queue.Queue(maxsize=1), logging.NullHandler(), overflow="spill")
+
+    def test_adapters_are_cached_and_disabled_levels_skipped(self, monkeypatch):
+        """Test: los adapters se reutilizan y los helpers no registran con el logger desactivado"""
+        # Arrange
+        emitted = []
+        monkeypatch.setattr(app_logger, "handle", emitted.append)
+        monkeypatch.setattr(app_logger, "disabled", True)
+
+        # Act
+        log_operation_start("create", "Brand")
+
+        # Assert
+        assert get_logger_with_uuid("x") is get_logger_with_uuid("x")
+        assert emitted == []
+
+class TestRequestContext:
+    """Tests para el contexto de petición y su registro JSON"""
+
+    def test_helpers_annotate_context_instead_of_lines(self, monkeypatch):
+        """Test: dentro de una petición los helpers anotan tiempos, marca y error sin escribir líneas"""
+        # Arrange
+        lines = []
+        monkeypatch.setattr(app_logger, "handle", lines.append)
+        context = RequestContext(request_id="r1", status=500)
+        token = current_request.set(context)
+
+        # Act
+        try:
+            log_operation_start("update_brand", "Brand", "b1")
+            log_operation_start("update", "Brand", "b1")
+            log_operation_error("update", "Brand", "b1", error="db down")
+            log_operation_error("update_brand", "Brand", "b1", error="wrapped")
+        finally:
+            current_request.reset(token)
+        event = context.to_event()
+
+        # Assert
+        assert lines == []
+        assert set(event["timings_ms"]) == {"update_brand", "update"}
+        assert event["brand_id"] == "b1"
+        assert event["error"] == "update: db down"
+        assert event["outcome"] == "error"
+
+    def test_json_event_formatter(self):
+        """Test: el registro se serializa como una línea JSON con nivel y marca de tiempo"""
+        # Arrange
+        record = logging.LogRecord("request_logger", logging.INFO, __file__, 1, {"route": "/brands", "status": 200}, (), None)
+
+        # Act
+        line = JSONEventFormatter().format(record)
+
+        # Assert
+        payload = json.loads(line)
+        assert payload["level"] == "INFO" and payload["route"] == "/brands" and "timestamp" in payload
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestErrorLogLimiter:
+    """Tests para la deduplicación de errores repetidos"""
+
+    def test_first_occurrence_full_then_summaries(self):
+        """Test: la primera aparición se registra, las repeticiones se resumen al cumplir la ventana"""
+        # Arrange
+        clock = FakeClock()
+        limiter = ErrorLogLimiter(interval_seconds=60, clock=clock)
+        key = ("OperationalError", "create")
+
+        # Act
+        decisions = [limiter.record(key) for _ in range(4)]
+        early = limiter.due_summaries()
+        clock.now += 61
+        due = limiter.due_summaries()
+        clock.now += 120
+        after_quiet = limiter.record(key)
+
+        # Assert
+        assert decisions == [LOG_FULL, SUPPRESS, SUPPRESS, SUPPRESS]
+        assert early == []
+        assert due == [(key, 3, 61)]
+        assert after_quiet == LOG_FULL
+        assert limiter.stats()[0]["count"] == 5 and limiter.stats()[0]["suppressed"] == 0
+
+    def test_fingerprint_limit_groups_into_other(self):
+        """Test: por encima del máximo de huellas las nuevas se agrupan en <other>"""
+        # Arrange
+        limiter = ErrorLogLimiter(max_fingerprints=1, clock=FakeClock())
+
+        # Act
+        limiter.record(("ValueError", "a"))
+        limiter.record(("KeyError", "b"))
+        limiter.record(("TypeError", "c"))
+
+        # Assert
+        assert {(row["error_type"], row["count"]) for row in limiter.stats()} == {("ValueError", 1), ("<other>", 2)}
+
+    def test_log_operation_error_deduplicates(self, monkeypatch):
+        """Test: el mismo error en la misma operación solo se registra completo la primera vez"""
+        # Arrange
+        from app.core import logger
+        lines = []
+        monkeypatch.setattr(logger, "error_limiter", ErrorLogLimiter(clock=FakeClock()))
+        monkeypatch.setattr(app_logger, "handle", lines.append)
+
+        # Act
+        for _ in range(3):
+            try:
+                raise ConnectionError("db down")
+            except ConnectionError as e:
+                log_operation_error("create", "Brand", error=str(e))
+        logger.error_limiter.stop(logger._log_error_summary)
+
+        # Assert
+        assert len(lines) == 2
+        assert lines[0].exc_info[0] is ConnectionError
+        assert lines[1].getMessage() == "ConnectionError in create repeated 2 times in the last 0 s"
+        assert logger.error_limiter.stats()[0]["count"] == 3
+
+    def test_request_events_are_not_deduplicated(self, monkeypatch):
+        """Test: cada petición con error de servidor emite su registro aunque el error se repita"""
+        # Arrange
+        from app.core import logger
+        events = []
+        monkeypatch.setattr(logger, "error_limiter", ErrorLogLimiter(clock=FakeClock()))
+        monkeypatch.setattr(logger.request_logger, "handle", events.append)
+
+        # Act
+        for index in range(3):
+            context = RequestContext(request_id=f"req-{index}", method="GET", path="/brands", status=500)
+            context.end_operation("list_brands", error="db down", error_type="ConnectionError")
+            logger.log_request_event(context)
+
+        # Assert
+        assert [record.msg["request_id"] for record in events] == ["req-0", "req-1", "req-2"]
+        assert all(record.levelno == logging.ERROR for record in events)
+        assert logger.error_limiter.stats() == []
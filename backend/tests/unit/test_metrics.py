@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+import pytest
+from app.core.metrics import GAUGE_PID, MetricsRegistry, timed_operations
+
+class TestMetricsRegistry:
+    """Tests para las métricas y su exportación en formato Prometheus"""
+
+    def test_render_counter_and_histogram(self):
+        """Test: contadores e histogramas con buckets acumulados, suma y conteo"""
+        # Arrange
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Peticiones", ("route",))
+        latency = registry.histogram("latency_seconds", "Latencia", buckets=(0.1, 1.0))
+
+        # Act
+        requests.inc(labels=("/brands",))
+        requests.inc(2, labels=("/brands",))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+        text = registry.render()
+
+        # Assert
+        assert 'requests_total{route="/brands"} 3' in text
+        assert 'latency_seconds_bucket{le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{le="1"} 3' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+        assert "latency_seconds_sum 3.65" in text and "latency_seconds_count 4" in text
+        assert "# TYPE latency_seconds histogram" in text
+
+    def test_updates_from_many_threads_are_not_lost(self):
+        """Test: cada thread escribe en su fragmento y la suma es exacta"""
+        # Arrange
+        registry = MetricsRegistry()
+        counter = registry.counter("hits_total", "Hits")
+        workers = [threading.Thread(target=lambda: [counter.inc() for _ in range(10000)]) for _ in range(8)]
+
+        # Act
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        # Assert
+        assert counter.collect() == {(): 80000}
+
+    def test_aggregates_worker_snapshots(self, tmp_path):
+        """Test: con METRICS_DIR se suman contadores de todos los procesos y gauges solo de los vivos"""
+        # Arrange
+        registry = MetricsRegistry(str(tmp_path))
+        counter = registry.counter("requests_total", "Peticiones")
+        memory = registry.gauge("memory_bytes", "Memoria", multiprocess_mode=GAUGE_PID)
+        counter.inc(2)
+        memory.inc(100)
+        dead_pid = 2 ** 22 + 1
+        (tmp_path / f"metrics-{dead_pid}.json").write_text(json.dumps({
+            "requests_total": {"[]": 5},
+            "memory_bytes": {"[]": 999},
+        }))
+
+        # Act
+        registry.write_snapshot()
+        text = registry.render()
+
+        # Assert
+        assert "requests_total 7" in text
+        assert "memory_bytes{pid=" in text and "999" not in text
+        assert len(list(tmp_path.glob("metrics-*.json"))) == 2
+
+    def test_absorbs_dead_process_snapshots_on_start(self, tmp_path):
+        """Test: al arrancar se incorporan los contadores de procesos muertos y se borran sus archivos"""
+        # Arrange
+        registry = MetricsRegistry(str(tmp_path))
+        counter = registry.counter("requests_total", "Peticiones")
+        memory = registry.gauge("memory_bytes", "Memoria")
+        counter.inc(2)
+        dead_pid = 2 ** 22 + 1
+        (tmp_path / f"metrics-{dead_pid}.json").write_text(json.dumps({
+            "requests_total": {"[]": 5},
+            "memory_bytes": {"[]": 999},
+        }))
+        (tmp_path / f"metrics-{os.getpid()}.json").write_text(json.dumps({"requests_total": {"[]": 3}}))
+
+        # Act
+        registry.absorb_dead_snapshots()
+        first = registry.render()
+        registry.absorb_dead_snapshots()
+        (tmp_path / f"metrics-{dead_pid}.json").write_text(json.dumps({"requests_total": {"[]": 1}}))
+        registry.absorb_dead_snapshots()
+        second = registry.render()
+
+        # Assert
+        assert "requests_total 10" in first and "999" not in first
+        assert "requests_total 11" in second
+        assert [path.name for path in tmp_path.iterdir()] == [f"metrics-{os.getpid()}.json"]
+
+    def test_duplicated_metric_name(self):
+        """Test: no se pueden registrar dos métricas con el mismo nombre"""
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Peticiones")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Duplicated metric"):
+            registry.gauge("requests_total", "Peticiones")
+
+class TestTimedOperations:
+    """Tests para el decorador que mide los métodos de una clase"""
+
+    def test_records_outcome_per_operation(self):
+        """Test: se observa cada llamada con su resultado; los generadores cerrados antes quedan como cancelled"""
+        # Arrange
+        histogram = MetricsRegistry().histogram("operation_seconds", "Duración", ("operation", "outcome"))
+
+        @timed_operations(histogram)
+        class Service:
+            def ok(self):
+                return 1
+
+            def fail(self):
+                raise RuntimeError("boom")
+
+            def rows(self):
+                yield from range(3)
+
+            def _private(self):
+                return 2
+
+        service = Service()
+
+        # Act
+        service.ok()
+        with pytest.raises(RuntimeError):
+            service.fail()
+        rows = service.rows()
+        next(rows)
+        rows.close()
+        list(service.rows())
+        service._private()
+
+        # Assert
+        counts = {labels: series[-2] + sum(series[:-2]) for labels, series in histogram.collect().items()}
+        assert set(counts) == {("ok", "success"), ("fail", "error"), ("rows", "cancelled"), ("rows", "success")}
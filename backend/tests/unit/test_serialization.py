@@ -0,0 +1,59 @@
+import json
+import pytest
+from typing import List
+from uuid import uuid4
+from pydantic import TypeAdapter
+from app.api import serialization
+from app.api.serialization import BRAND_PUBLIC_FIELDS, brand_response, dump_brand, dump_brand_page, dump_brands, public_row
+from app.domain.entities.brand import Brand
+from app.domain.entities.brand_page import BrandPage
+from app.schemas.brand_dto import BrandReadDTO, BrandPageDTO
+
+def _response_model_bytes(annotation, content) -> bytes:
+    """Cuerpo que produce FastAPI con response_model y JSONResponse"""
+    adapter = TypeAdapter(annotation)
+    value = adapter.dump_python(adapter.validate_python(content, from_attributes=True), mode="json")
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+class TestSerialization:
+    """Tests para la serialización directa de marcas a JSON"""
+    
+    def setup_method(self):
+        """Setup para cada test: marcas con caracteres que requieren escape"""
+        self.brands = [
+            Brand(id=uuid4(), name='Ñandú "Sur"\n', owner="Dueño \\ \x01", lang="es", status="active"),
+            Brand(id=uuid4(), name="Marca 😀", owner="Owner", lang="en"),
+        ]
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_output_matches_response_model_path(self, monkeypatch, use_orjson):
+        """Test: la salida es idéntica byte a byte a la del camino con response_model, con y sin orjson"""
+        # Arrange
+        if not use_orjson:
+            monkeypatch.setattr(serialization, "orjson", None)
+        elif serialization.orjson is None:
+            pytest.skip("orjson no está instalado")
+        page = BrandPage(items=self.brands, next_cursor="abc")
+        
+        # Act & Assert
+        assert dump_brands(self.brands) == _response_model_bytes(List[BrandReadDTO], self.brands)
+        assert dump_brand(self.brands[0]) == _response_model_bytes(BrandReadDTO, self.brands[0])
+        assert dump_brand_page(page) == _response_model_bytes(BrandPageDTO, page)
+    
+    def test_public_row_matches_read_schema(self):
+        """Test: la fila pública tiene exactamente los campos de BrandReadDTO y en su orden"""
+        # Act
+        row = public_row(self.brands[0])
+        
+        # Assert
+        assert tuple(row) == BRAND_PUBLIC_FIELDS
+    
+    def test_brand_response_sets_headers(self):
+        """Test: la respuesta lleva content-type JSON y las cabeceras indicadas"""
+        # Act
+        response = brand_response(self.brands, {"ETag": '"v1"'})
+        
+        # Assert
+        assert response.media_type == "application/json"
+        assert response.headers["etag"] == '"v1"'
+        assert json.loads(response.body)[1]["name"] == "Marca 😀"
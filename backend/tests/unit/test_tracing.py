@@ -0,0 +1,151 @@
+import json
+import time
+import pytest
+from app.core.tracing import (
+    BatchSpanProcessor, InMemorySpanExporter, OtlpFileSpanExporter, SimpleSpanProcessor,
+    SpanContext, Tracer, parse_traceparent, traced_operations, tracer
+)
+
+@traced_operations
+class Service:
+    def outer(self):
+        return self.inner()
+
+    def inner(self):
+        return 42
+
+    def fail(self):
+        raise LookupError("missing")
+
+class TestTraceparent:
+    """Tests para la propagación W3C traceparent"""
+
+    def test_parse_and_format(self):
+        """Test: una cabecera válida conserva IDs y flag de muestreo"""
+        # Arrange
+        header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+        # Act
+        context = parse_traceparent(header)
+
+        # Assert
+        assert context.sampled is True
+        assert context.traceparent() == header
+
+    @pytest.mark.parametrize("header", [
+        None,
+        "garbage",
+        "00-00000000000000000000000000000000-00f067aa0ba902b7-01",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-0000000000000000-01",
+        "ff-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+    ])
+    def test_invalid_headers_are_ignored(self, header):
+        """Test: cabeceras ausentes o no válidas no aportan contexto"""
+        # Act & Assert
+        assert parse_traceparent(header) is None
+
+class TestTracer:
+    """Tests para los spans, el muestreo y los decoradores"""
+
+    def test_nested_spans_share_trace(self, span_exporter):
+        """Test: los métodos anidados crean spans hijos de la misma traza"""
+        # Act
+        result = Service().outer()
+
+        # Assert
+        inner, outer = span_exporter.get_finished_spans()
+        assert result == 42
+        assert (outer.name, inner.name) == ("Service.outer", "Service.inner")
+        assert inner.context.trace_id == outer.context.trace_id
+        assert inner.parent_span_id == outer.context.span_id and outer.parent_span_id is None
+
+    def test_exception_marks_span_as_error(self, span_exporter):
+        """Test: una excepción queda como evento y estado de error del span"""
+        # Act
+        with pytest.raises(LookupError):
+            Service().fail()
+
+        # Assert
+        span, = span_exporter.get_finished_spans()
+        assert span.status_message == "LookupError: missing"
+        assert span.events[0]["attributes"]["exception.type"] == "LookupError"
+
+    def test_unsampled_trace_records_nothing(self, span_exporter):
+        """Test: con muestreo 0 ni la raíz ni sus hijos se registran"""
+        # Arrange
+        tracer.configure(enabled=True, sample_rate=0.0, processor=SimpleSpanProcessor(span_exporter))
+
+        # Act
+        with tracer.start_span("root") as root:
+            Service().outer()
+
+        # Assert
+        assert root.recording is False
+        assert span_exporter.get_finished_spans() == []
+
+    def test_remote_parent_decides_sampling(self, span_exporter):
+        """Test: el flag sampled del padre remoto manda sobre la tasa local"""
+        # Arrange
+        tracer.configure(enabled=True, sample_rate=0.0, processor=SimpleSpanProcessor(span_exporter))
+        remote = SpanContext(trace_id=0xABC, span_id=0x123, sampled=True)
+
+        # Act
+        with tracer.start_span("server", parent=remote):
+            Service().inner()
+
+        # Assert
+        inner, server = span_exporter.get_finished_spans()
+        assert server.context.trace_id == 0xABC and server.parent_span_id == 0x123
+        assert inner.parent_span_id == server.context.span_id
+
+    def test_invalid_sample_rate(self):
+        """Test: la tasa de muestreo debe estar entre 0 y 1"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid tracing sample rate"):
+            Tracer(enabled=True, sample_rate=1.5)
+
+class TestSpanExport:
+    """Tests para el procesador por lotes y el exportador OTLP a fichero"""
+
+    def test_batch_processor_writes_otlp_json_lines(self, tmp_path):
+        """Test: los spans se exportan por lotes como líneas OTLP/JSON"""
+        # Arrange
+        path = tmp_path / "traces.jsonl"
+        local_tracer = Tracer(enabled=True, processor=BatchSpanProcessor(OtlpFileSpanExporter(str(path), "test-service")))
+
+        # Act
+        with local_tracer.start_span("parent", attributes={"brand.count": 3}):
+            with local_tracer.start_span("child"):
+                pass
+        local_tracer.shutdown()
+
+        # Assert
+        spans = [
+            span
+            for line in path.read_text().splitlines()
+            for span in json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        ]
+        child, parent = spans
+        assert child["parentSpanId"] == parent["spanId"] and len(parent["traceId"]) == 32
+        assert parent["attributes"] == [{"key": "brand.count", "value": {"intValue": "3"}}]
+        assert int(parent["endTimeUnixNano"]) >= int(parent["startTimeUnixNano"])
+
+    def test_batch_processor_drops_when_queue_full(self):
+        """Test: con la cola llena los spans se descartan sin bloquear"""
+        # Arrange
+        class SlowExporter(InMemorySpanExporter):
+            def export(self, spans):
+                time.sleep(0.05)
+                super().export(spans)
+
+        processor = BatchSpanProcessor(SlowExporter(), max_queue_size=1)
+        local_tracer = Tracer(enabled=True, processor=processor)
+
+        # Act
+        for _ in range(50):
+            local_tracer.start_span("span").end()
+        local_tracer.shutdown()
+
+        # Assert
+        assert processor.dropped > 0
+        assert len(processor.exporter.get_finished_spans()) + processor.dropped == 50